@@ -1,36 +1,55 @@
 from flask import Flask
-from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 
-from app.blueprints import sync_blueprints
-from app.swagger import create_swagger
+from app.utils.sharding import ShardedSession
 from config import Config
 
-db = SQLAlchemy()
-app = Flask(__name__)
-CORS(app)
+db = SQLAlchemy(session_options={"class_": ShardedSession})
 
 
-def create_app():
+def create_app(config_object=Config):
     """
         Function: create_app
 
         Description:
         This function serves as a factory for creating instances of the Flask application for the
-        Todo-List API. It configures the application with the provided configuration object, initializes the database,
-        synchronizes the blueprints of various routes, sets up Swagger documentation, creates all necessary database
-        tables within the application context, and finally returns the configured Flask application instance.
+        Todo-List API. It configures the application with the provided configuration object, initializes the database
+        along with its SQLite tuning profile, compiled statement statistics, slow-query log and statement timeout,
+        enables load shedding, rate limiting, response compression and idempotency keys, synchronizes the blueprints
+        of various routes, sets up Swagger documentation, registers the CLI commands and finally returns the
+        configured Flask application instance.
+
+        The application is only built when this factory is called, never at import time, and no schema DDL is issued
+        here: tables are created explicitly through the "flask create-db" command.
+
+        Parameters:
+        - config_object: The configuration object loaded into the application (defaults to Config).
 
         Returns:
         Flask: The configured Flask application instance.
     """
-    app.config.from_object(Config)
+    from flask_cors import CORS
+
+    from app.blueprints import sync_blueprints
+    from app.commands import register_commands
+    from app.middlewares import init_admission_control, init_compression, init_idempotency, init_rate_limiting
+    from app.swagger import create_swagger
+    from app.utils import init_sqlite_profile, init_statement_cache, init_statement_monitor
+
+    app = Flask(__name__)
+    app.config.from_object(config_object)
+    CORS(app)
     db.init_app(app)
+    init_sqlite_profile(app)
+    init_statement_cache(app)
+    init_statement_monitor(app)
+    init_admission_control(app)
+    init_rate_limiting(app)
+    init_compression(app)
+    init_idempotency(app)
 
     sync_blueprints(app)
     create_swagger(app)
-
-    with app.app_context():
-        db.create_all()
+    register_commands(app)
 
     return app
@@ -7,8 +7,8 @@ def sync_blueprints(app: Flask):
 
         Description:
         This function is responsible for synchronizing the blueprints of various routes with the Flask application. It
-        registers the blueprints for authentication, task categories, and tasks with the provided Flask application
-        instance.
+        registers the blueprints for authentication, task categories, tasks, and jobs with the provided Flask
+        application instance.
 
         Parameters:
         - app (Flask): The Flask application instance to which the blueprints will be registered.
@@ -17,7 +17,8 @@ def sync_blueprints(app: Flask):
         None
     """
 
-    from .routes import auth, task, task_category
+    from .routes import auth, job, task, task_category
     app.register_blueprint(auth.bp)
     app.register_blueprint(task_category.bp)
     app.register_blueprint(task.bp)
+    app.register_blueprint(job.bp)
@@ -0,0 +1,35 @@
+from flask import Flask
+
+
+def register_commands(app: Flask):
+    """
+        Function: register_commands
+
+        Description:
+        This function is responsible for registering the custom "flask" CLI commands of the Todo-List API with the
+        provided Flask application instance (database setup and migrations, OpenAPI export, startup profiling, search
+        indexing, shard rebalancing, task archiving and background jobs).
+
+        Parameters:
+        - app (Flask): The Flask application instance to which the commands will be registered.
+
+        Returns:
+        None
+    """
+
+    from .archive import archive_tasks
+    from .database import create_db
+    from .jobs import jobs_worker
+    from .migrations import migrate_category_keys
+    from .openapi import openapi_dump
+    from .search import search_reindex
+    from .sharding import shard_rebalance
+    from .startup import startup_profile
+    app.cli.add_command(create_db)
+    app.cli.add_command(migrate_category_keys)
+    app.cli.add_command(openapi_dump)
+    app.cli.add_command(startup_profile)
+    app.cli.add_command(search_reindex)
+    app.cli.add_command(shard_rebalance)
+    app.cli.add_command(archive_tasks)
+    app.cli.add_command(jobs_worker)
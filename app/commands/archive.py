@@ -0,0 +1,37 @@
+import time
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from app.utils import shard_router
+
+
+@click.command("archive-tasks")
+@click.option("--interval", type=click.IntRange(min=0), default=0,
+              help="Keep running, archiving every INTERVAL seconds (0 runs once).")
+@with_appcontext
+def archive_tasks(interval: int):
+    """
+        Command: flask archive-tasks [--interval SECONDS]
+
+        Description:
+        Moves the completed tasks left untouched to the archive, on every database shard, following the archive policy
+        (TASK_ARCHIVE_CATEGORIES, TASK_ARCHIVE_AFTER_DAYS and TASK_ARCHIVE_BATCH_SIZE). Run it once from a scheduler,
+        or as a long-running background process with "--interval".
+    """
+    from app.services import TaskService
+
+    if not current_app.config["TASK_ARCHIVE_AFTER_DAYS"]:
+        raise click.ClickException("The archive policy is disabled (TASK_ARCHIVE_AFTER_DAYS=0).")
+
+    task_service = TaskService()
+    while True:
+        for shard in shard_router.shard_names():
+            shard_router.use(shard)
+            archived = task_service.archive_stale()
+            click.echo(f"Archived {archived} tasks on shard '{shard}'.")
+
+        if not interval:
+            return
+        time.sleep(interval)
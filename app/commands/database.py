@@ -0,0 +1,82 @@
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.schema import CreateColumn
+
+from app import db
+from app.commands.migrations import migrate_legacy_category_keys
+from app.models import Task, TaskCategory
+from app.utils import shard_router
+
+
+def add_missing_columns(connection, table):
+    """
+        Function: add_missing_columns
+
+        Description:
+        Adds to an existing table the nullable columns declared by its model that the table does not have yet (such as
+        "user.shard_key"), so databases created by an earlier release keep working without a migration tool.
+
+        Parameters:
+        - connection: The SQLAlchemy connection of the database holding the table.
+        - table (Table): The table declared by the model.
+
+        Returns:
+        None
+    """
+    existing = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    for column in table.columns:
+        if column.name not in existing and column.nullable:
+            ddl = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.exec_driver_sql(f"ALTER TABLE {connection.dialect.identifier_preparer.format_table(table)} "
+                                       f"ADD COLUMN {ddl}")
+
+
+def count_category_tasks(connection):
+    """
+        Function: count_category_tasks
+
+        Description:
+        Initializes the task counters of the task categories that do not have them yet, such as the categories created
+        before "task_category.task_count" was added. Categories whose counter is known are left untouched.
+
+        Parameters:
+        - connection: The SQLAlchemy connection of the database holding the task categories.
+
+        Returns:
+        None
+    """
+    last_task_update = (select(func.max(Task.updated_at)).where(Task.category_id == TaskCategory.id)
+                        .scalar_subquery())
+    connection.execute(update(TaskCategory.__table__).where(TaskCategory.task_count.is_(None))
+                       .values(task_count=TaskCategory.task_count_expression(), tasks_updated_at=last_task_update))
+
+
+@click.command("create-db")
+@with_appcontext
+def create_db():
+    """
+        Command: flask create-db
+
+        Description:
+        Creates every table declared by the models that does not exist yet, along with any column or index missing
+        from the existing tables, so it can be re-run after an upgrade that adds them. Schema creation used to run
+        inside create_app on every worker boot; it is now an explicit step executed once per deployment. When
+        DATABASE_SHARDS is set, the schema is created on every shard. A database still using the former 64-character
+        task category keys is migrated to integer keys first (see migrate_legacy_category_keys), since the tables
+        referencing the categories need integer keys. The task counters of the task categories that do not have them
+        yet are initialized as well.
+    """
+    import app.models  # noqa: F401 - registers the models in the metadata
+
+    for shard in shard_router.shard_names():
+        with shard_router.engine(shard).begin() as connection:
+            if migrate_legacy_category_keys(connection):
+                click.echo(f"Task category keys migrated to integers on shard '{shard}'.")
+            db.metadata.create_all(connection)
+            for table in db.metadata.sorted_tables:
+                add_missing_columns(connection, table)
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
+            count_category_tasks(connection)
+        click.echo(f"Database tables created on shard '{shard}'.")
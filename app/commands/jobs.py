@@ -0,0 +1,85 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+logger = logging.getLogger("app.jobs")
+
+MAX_ERROR_BACKOFF_SECONDS = 60
+REVOKED_TOKEN_PURGE_INTERVAL_SECONDS = 3600
+
+
+@click.command("jobs-worker")
+@click.option("--threads", type=click.IntRange(min=1), default=2, help="Number of jobs run at the same time.")
+@click.option("--poll-interval", type=click.FloatRange(min=0), default=1.0,
+              help="Seconds to wait before looking for new jobs when the queue is empty.")
+@click.option("--once", is_flag=True, help="Exit once the queue is empty instead of waiting for new jobs.")
+@with_appcontext
+def jobs_worker(threads: int, poll_interval: float, once: bool):
+    """
+        Command: flask jobs-worker [--threads N] [--poll-interval SECONDS] [--once]
+
+        Description:
+        Runs the background jobs queued in the "job" table with a pool of threads, each one claiming and running one
+        job at a time in an application context of its own. Several workers can run side by side, on one host or many,
+        since a job is claimed atomically. Stop it with Ctrl+C; the jobs it was running are started again by another
+        worker once JOB_TIMEOUT_SECONDS have passed.
+
+        A thread that fails to claim or record a job, e.g. while the database is unreachable, logs the error to the
+        "app.jobs" logger and tries again after a delay doubled at every consecutive failure (up to
+        MAX_ERROR_BACKOFF_SECONDS), so the pool keeps all of its threads. With --once, the error ends the command.
+
+        When the queue is empty, the worker also deletes the expired revoked tokens, at most every
+        REVOKED_TOKEN_PURGE_INTERVAL_SECONDS, so the API never does it while serving requests.
+    """
+    from app import db
+    from app.services import JobService
+    from app.services.token_revocation_service import token_revocation_service
+
+    app = current_app._get_current_object()
+    job_service = JobService()
+    purge, purge_lock = {"at": 0.0}, threading.Lock()
+
+    def purge_revoked_tokens():
+        with purge_lock:
+            if time.monotonic() - purge["at"] < REVOKED_TOKEN_PURGE_INTERVAL_SECONDS:
+                return
+            purge["at"] = time.monotonic()
+        token_revocation_service.purge_expired()
+
+    def work():
+        failures = 0
+        while True:
+            job, backoff = None, None
+            with app.app_context():
+                try:
+                    job = job_service.run_next()
+                    if job is not None:
+                        click.echo(f"Job {job.id} ({job.name}) {job.status} after {job.attempts} attempt(s).")
+                    else:
+                        purge_revoked_tokens()
+                except Exception:
+                    if once:
+                        raise
+                    failures += 1
+                    backoff = min(max(poll_interval, 1.0) * 2 ** (failures - 1), MAX_ERROR_BACKOFF_SECONDS)
+                    logger.exception("Jobs worker failed to run the next job, retrying in %.1f s", backoff)
+                finally:
+                    db.session.remove()
+            if backoff is not None:
+                time.sleep(backoff)
+                continue
+            failures = 0
+            if job is not None:
+                continue
+            if once:
+                return
+            time.sleep(poll_interval)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(work) for _ in range(threads)]:
+            future.result()
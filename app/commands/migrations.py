@@ -0,0 +1,126 @@
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import Integer, inspect, text
+
+from app import db
+
+
+def category_keys_are_legacy(connection) -> bool:
+    """
+        Function: category_keys_are_legacy
+
+        Description:
+        Tells whether the "task_category" table still uses the former 64-character hexadecimal primary key.
+
+        Parameters:
+        - connection: The SQLAlchemy connection to inspect.
+
+        Returns:
+        bool: True if the table exists and its "id" column is not an integer.
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table("task_category"):
+        return False
+    id_column = next(column for column in inspector.get_columns("task_category") if column["name"] == "id")
+    return not isinstance(id_column["type"], Integer)
+
+
+def category_dependent_tables() -> list:
+    """
+        Function: category_dependent_tables
+
+        Description:
+        Lists the tables declared by the models that reference the "task_category" table, such as "task", in the
+        order they are created.
+
+        Returns:
+        list[Table]: The tables with a foreign key to "task_category".
+    """
+    from app.models import TaskCategory
+
+    return [table for table in db.metadata.sorted_tables
+            if any(key.column.table is TaskCategory.__table__ for key in table.foreign_keys)]
+
+
+def migrate_legacy_category_keys(connection) -> bool:
+    """
+        Function: migrate_legacy_category_keys
+
+        Description:
+        Migrates a database created with 64-character hexadecimal task category keys to integer keys. The
+        "task_category" rows, and the rows of every table referencing them (see category_dependent_tables), are copied
+        aside and the tables are recreated with the current schema, dropping the foreign keys to the former keys. The
+        categories get new integer keys (the former key is kept in "legacy_id" so the API still resolves it), and the
+        other rows are copied back with the columns both schemas have, re-pointed to the integer key of their category.
+        Their IDs are preserved, and the task counters of the categories are initialized (see count_category_tasks). It
+        runs in the transaction of the connection.
+
+        Parameters:
+        - connection: The SQLAlchemy connection of the database to migrate.
+
+        Returns:
+        bool: True if the database has been migrated, False if its keys already were integers.
+    """
+    from app.commands.database import count_category_tasks
+    from app.models import TaskCategory
+    from app.utils import create_task_search_index, rebuild_task_search_index
+
+    if not category_keys_are_legacy(connection):
+        return False
+
+    inspector = inspect(connection)
+    dependents = [table for table in category_dependent_tables() if inspector.has_table(table.name)]
+    legacy_columns = {table.name: {column["name"] for column in inspector.get_columns(table.name)}
+                      for table in dependents}
+    quote = connection.dialect.identifier_preparer.quote
+
+    for table in [TaskCategory.__table__, *dependents]:
+        connection.execute(text(f"CREATE TABLE {table.name}_legacy AS SELECT * FROM {table.name}"))
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS task_fts"))
+    for table in reversed([TaskCategory.__table__, *dependents]):
+        connection.execute(text(f"DROP TABLE {table.name}"))
+
+    db.metadata.create_all(connection, tables=[TaskCategory.__table__, *dependents])
+    connection.execute(text(
+        'INSERT INTO task_category (title, "order", user_id, legacy_id) '
+        'SELECT title, "order", user_id, id FROM task_category_legacy ORDER BY user_id, "order"'))
+    for table in dependents:
+        columns = [column.name for column in table.columns
+                   if column.name in legacy_columns[table.name] and column.name != "category_id"]
+        connection.execute(text(
+            f"INSERT INTO {table.name} ({', '.join(quote(name) for name in columns)}, category_id) "
+            f"SELECT {', '.join(f'r.{quote(name)}' for name in columns)}, c.id FROM {table.name}_legacy r "
+            f"LEFT JOIN task_category c ON c.legacy_id = r.category_id"))
+        if connection.dialect.name == "postgresql" and "id" in table.c:
+            connection.execute(text(f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                                    f"COALESCE((SELECT MAX(id) FROM {table.name}), 0) + 1, false)"))
+
+    for table in [TaskCategory.__table__, *dependents]:
+        connection.execute(text(f"DROP TABLE {table.name}_legacy"))
+    count_category_tasks(connection)
+    create_task_search_index(connection)
+    rebuild_task_search_index(connection)
+    return True
+
+
+@click.command("migrate-category-keys")
+@with_appcontext
+def migrate_category_keys():
+    """
+        Command: flask migrate-category-keys
+
+        Description:
+        Migrates a database created with 64-character hexadecimal task category keys to integer keys, within a single
+        transaction per shard (see migrate_legacy_category_keys). "flask create-db" runs it before creating the other
+        tables, so it is only needed on databases that are not upgraded through it. Running it on an already migrated
+        database does nothing.
+    """
+    from app.utils import shard_router
+
+    for shard in shard_router.shard_names():
+        with shard_router.engine(shard).begin() as connection:
+            if migrate_legacy_category_keys(connection):
+                click.echo(f"Task category keys migrated to integers on shard '{shard}'.")
+            else:
+                click.echo(f"Task category keys are already integers on shard '{shard}'.")
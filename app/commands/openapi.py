@@ -0,0 +1,25 @@
+import json
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+@click.command("openapi-dump")
+@click.argument("path", type=click.Path(dir_okay=False, writable=True), default="openapi.json")
+@with_appcontext
+def openapi_dump(path):
+    """
+        Command: flask openapi-dump [PATH]
+
+        Description:
+        Renders the OpenAPI (Swagger) document of the API and writes it to PATH (defaults to "openapi.json"). Point the
+        OPENAPI_SPEC_PATH setting at the generated file so workers serve it as-is instead of building it at runtime.
+    """
+    api = current_app.extensions["restx_api"]
+    with current_app.test_request_context():
+        schema = api.__schema__
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(schema, file)
+    click.echo(f"OpenAPI document written to {path}.")
@@ -0,0 +1,21 @@
+import click
+from flask.cli import with_appcontext
+
+from app.utils import create_task_search_index, rebuild_task_search_index, shard_router
+
+
+@click.command("search-reindex")
+@with_appcontext
+def search_reindex():
+    """
+        Command: flask search-reindex
+
+        Description:
+        Creates the full-text search index of the tasks when it is missing (databases created before it existed) and
+        repopulates it from the current content of the "task" table, on every database shard.
+    """
+    for shard in shard_router.shard_names():
+        with shard_router.engine(shard).begin() as connection:
+            create_task_search_index(connection)
+            rebuild_task_search_index(connection)
+        click.echo(f"Task search index rebuilt on shard '{shard}'.")
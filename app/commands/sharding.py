@@ -0,0 +1,100 @@
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import select, text
+
+from app.utils import move_coalescer, shard_router
+
+
+def copy_rows(connection, table, rows: list[dict], overrides=None) -> dict:
+    """
+        Function: copy_rows
+
+        Description:
+        Inserts rows read from another shard into a table, keeping their IDs when none of them is already taken on the
+        destination and letting the database assign new ones otherwise.
+
+        Parameters:
+        - connection: The SQLAlchemy connection of the destination shard.
+        - table (Table): The table to insert into.
+        - rows (list[dict]): The rows to insert.
+        - overrides (callable, optional): Called with each row, returns the column values to replace.
+
+        Returns:
+        dict: The mapping from the source ID to the destination ID of each row.
+    """
+    ids = [row["id"] for row in rows]
+    taken = connection.execute(select(table.c.id).where(table.c.id.in_(ids))).first() is not None
+
+    mapping = {}
+    for row in rows:
+        values = {**row, **(overrides(row) if overrides else {})}
+        if taken:
+            values.pop("id")
+        result = connection.execute(table.insert().values(**values))
+        mapping[row["id"]] = result.inserted_primary_key[0]
+
+    if not taken and rows and connection.dialect.name == "postgresql":
+        connection.execute(text(f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                                f"COALESCE((SELECT MAX(id) FROM {table.name}), 0) + 1, false)"))
+    return mapping
+
+
+@click.command("shard-rebalance")
+@click.argument("username")
+@click.argument("shard")
+@with_appcontext
+def shard_rebalance(username: str, shard: str):
+    """
+        Command: flask shard-rebalance USERNAME SHARD
+
+        Description:
+        Moves the board (task categories, tasks and archived tasks) of a user to another database shard. The rows are
+        copied to the target shard, the directory entry of the user is switched to it, and only then are the rows
+        deleted from the source shard, so an interrupted run never loses data and can be retried. IDs are kept unless
+        they are already taken on the target shard, in which case new ones are assigned. Requests of the user served
+        during the move may see the board of the source shard.
+    """
+    from app.models import ArchivedTask, Task, TaskCategory
+    from app.repositories.user_repository import UserRepository
+
+    user_repository = UserRepository()
+    user = user_repository.get_by_name(username)
+    if user is None:
+        raise click.ClickException(f"User '{username}' not found.")
+    if shard not in shard_router.shard_names():
+        raise click.ClickException(f"Unknown shard '{shard}', expected one of: "
+                                   f"{', '.join(shard_router.shard_names())}.")
+
+    source = shard_router.shard_for(user)
+    if source == shard:
+        click.echo(f"The board of '{username}' is already on shard '{shard}'.")
+        return
+
+    move_coalescer.flush(user.id)
+    shard_router.ensure_user(user, shard)
+
+    categories_table, tasks_table, archive_table = TaskCategory.__table__, Task.__table__, ArchivedTask.__table__
+    with shard_router.engine(source).connect() as connection:
+        categories = connection.execute(
+            select(categories_table).where(categories_table.c.user_id == user.id)).mappings().all()
+        tasks = connection.execute(select(tasks_table).where(tasks_table.c.user_id == user.id)).mappings().all()
+        archived_tasks = connection.execute(
+            select(archive_table).where(archive_table.c.user_id == user.id)).mappings().all()
+
+    with shard_router.engine(shard).begin() as connection:
+        category_ids = copy_rows(connection, categories_table, [dict(row) for row in categories])
+        copy_rows(connection, tasks_table, [dict(row) for row in tasks],
+                  lambda row: {"category_id": category_ids.get(row["category_id"])})
+        copy_rows(connection, archive_table, [dict(row) for row in archived_tasks],
+                  lambda row: {"category_id": category_ids.get(row["category_id"])})
+
+    user.shard_key = shard
+    user_repository.update(user)
+
+    with shard_router.engine(source).begin() as connection:
+        connection.execute(tasks_table.delete().where(tasks_table.c.user_id == user.id))
+        connection.execute(archive_table.delete().where(archive_table.c.user_id == user.id))
+        connection.execute(categories_table.delete().where(categories_table.c.user_id == user.id))
+
+    click.echo(f"Moved {len(categories)} task categories, {len(tasks)} tasks and {len(archived_tasks)} archived tasks "
+               f"of '{username}' from shard '{source}' to shard '{shard}'.")
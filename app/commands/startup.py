@@ -0,0 +1,81 @@
+import subprocess
+import sys
+
+import click
+from flask import current_app
+
+
+def parse_import_times(output: str) -> list[tuple[str, int, int]]:
+    """
+        Function: parse_import_times
+
+        Description:
+        Parses the report written to stderr by "python -X importtime".
+
+        Parameters:
+        - output (str): The raw stderr output of the interpreter.
+
+        Returns:
+        list[tuple[str, int, int]]: A list of (module, self_us, cumulative_us) tuples in import order.
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def profile_imports(module: str) -> list[tuple[str, int, int]]:
+    """
+        Function: profile_imports
+
+        Description:
+        Imports a module in a fresh interpreter with "-X importtime", so the modules already imported by the caller
+        are timed as well.
+
+        Parameters:
+        - module (str): The module imported, e.g. "wsgi".
+
+        Returns:
+        list[tuple[str, int, int]]: A list of (module, self_us, cumulative_us) tuples in import order.
+
+        Raises:
+        RuntimeError: If the module cannot be imported.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse_import_times(result.stderr)
+
+
+@click.command("startup-profile")
+@click.option("--module", default="wsgi", help="Module imported to boot the application.")
+@click.option("--budget-ms", type=int, default=None, help="Fails when the boot exceeds this budget.")
+@click.option("--top", type=int, default=15, help="Number of slowest imports to display.")
+def startup_profile(module, budget_ms, top):
+    """
+        Command: flask startup-profile
+
+        Description:
+        Boots the application in a fresh interpreter with "-X importtime", prints the slowest imports and compares the
+        total boot time against the budget (STARTUP_IMPORT_BUDGET_MS unless --budget-ms is given). Exits with status 1
+        when the budget is exceeded, so it can be used as a regression check in CI.
+    """
+    if budget_ms is None:
+        budget_ms = current_app.config["STARTUP_IMPORT_BUDGET_MS"]
+
+    try:
+        rows = profile_imports(module)
+    except RuntimeError as error:
+        raise click.ClickException(str(error))
+    total_ms = sum(self_us for _, self_us, _ in rows) / 1000
+
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        click.echo(f"{self_us / 1000:9.1f} ms self {cumulative_us / 1000:9.1f} ms total  {name}")
+    click.echo(f"Boot of '{module}' took {total_ms:.1f} ms (budget {budget_ms} ms).")
+
+    if total_ms > budget_ms:
+        raise click.ClickException("Startup import budget exceeded.")
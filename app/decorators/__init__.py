@@ -1 +1,2 @@
 from .auth_decorator import token_required
+from .validation_decorator import validate_request
@@ -1,14 +1,20 @@
 import jwt
-from flask import request
+from flask import current_app, request
 from six import wraps
 
-from app import app
+from app.middlewares.rate_limit import user_rate_limit_response
 from app.repositories.user_repository import UserRepository
+from app.services.token_revocation_service import token_revocation_service
+from app.utils import shard_router
 
 
 def token_required(f):
     """
-        Decorator function to enforce authentication via JWT token.
+        Decorator function to enforce authentication via JWT token. Revoked tokens are rejected, usually without any
+        query (see TokenRevocationService). Requests over the rate limit of the user are rejected with "429 Too Many
+        Requests" before the user is loaded. The board queries of the decorated function are routed to the database
+        shard of the authenticated user. Only an invalid token is answered with "401 Unauthorized": a failure of the
+        database or of a backend while checking it is raised, and answered as a server error.
 
         Parameters:
         - f: The function to decorate.
@@ -31,16 +37,26 @@ def token_required(f):
             }, 401
 
         try:
-            data = jwt.decode(token, app.config['SECRET_KEY'], algorithms=["HS256"])
-            current_user = user_repository.get_by_id(data['id'])
-            if current_user is None:
-                return {
-                    "message": "Invalid or missing Authentication token!",
-                }, 401
-        except Exception as e:
-            print(e)
+            data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"],
+                              options={"require": ["id"]})
+        except jwt.InvalidTokenError as e:
+            current_app.logger.info("Rejected authentication token: %s", e)
             return {"message": "Invalid or missing Authentication token!"}, 401
 
+        rate_limited = user_rate_limit_response(data["id"])
+        if rate_limited is not None:
+            return rate_limited
+        if "jti" in data and token_revocation_service.is_revoked(data["jti"]):
+            return {
+                "message": "Invalid or missing Authentication token!",
+            }, 401
+        current_user = user_repository.get_by_id(data['id'])
+        if current_user is None:
+            return {
+                "message": "Invalid or missing Authentication token!",
+            }, 401
+        shard_router.activate(current_user)
+
         return f(current_user=current_user, *args, **kwargs)
 
     return decorator
@@ -0,0 +1,106 @@
+from flask import request
+from flask_restx import Namespace
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from six import wraps
+
+QUERY_PARAMETER_KEYWORDS = ("description", "default", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+                            "enum", "items")
+
+
+def swagger_schema(schema: dict) -> dict:
+    """
+        Converts the JSON Schema generated by pydantic to the Swagger 2.0 dialect rendered by flask-restx, which has no
+        "null" type: the optional fields ("anyOf" a type or "null") are documented with their type.
+
+        Parameters:
+        - schema (dict): The JSON Schema of a pydantic model or of one of its fields.
+
+        Returns:
+        The Swagger 2.0 schema.
+    """
+    variants = [variant for variant in schema.get("anyOf", ()) if variant.get("type") != "null"]
+    if len(variants) == 1:
+        schema = {**{keyword: value for keyword, value in schema.items() if keyword != "anyOf"}, **variants[0]}
+    if "properties" in schema:
+        schema = {**schema, "properties": {name: swagger_schema(field) for name, field in schema["properties"].items()}}
+    return schema
+
+
+def query_parameters(schema: dict) -> dict:
+    """
+        Documents the fields of the JSON Schema of a query string model as Swagger 2.0 query parameters.
+
+        Parameters:
+        - schema (dict): The JSON Schema of the query string model.
+
+        Returns:
+        The parameters, by name, as expected by api.doc(params=...).
+    """
+    required = set(schema.get("required", ()))
+    parameters = {}
+    for name, field in swagger_schema(schema)["properties"].items():
+        parameter = {"in": "query", "type": field.get("type", "string"), "required": name in required}
+        parameter.update({keyword: field[keyword] for keyword in QUERY_PARAMETER_KEYWORDS if keyword in field})
+        if parameter["type"] == "array":
+            parameter["collectionFormat"] = "csv"
+        parameters[name] = parameter
+    return parameters
+
+
+def validate_request(api: Namespace, body: type[BaseModel] = None, query: type[BaseModel] = None):
+    """
+        Decorator function validating the JSON body and the query string of a request against the DTOs of app.dtos,
+        and documenting them in the OpenAPI document of the namespace from the same models.
+
+        The validators are compiled once, when the route is declared (TypeAdapter), and the raw body is parsed and
+        validated in a single pass (validate_json), without building an intermediate dictionary. An empty body is
+        validated as an empty object. The validated models are available as request.body_params and
+        request.query_params. Invalid requests are answered with "400 Bad Request" and the errors of each part
+        ({"validation_error": {"body_params": [...], "query_params": [...]}}), without calling the decorated function.
+
+        Parameters:
+        - api (Namespace): The namespace of the route, in which the body model is registered.
+        - body (type[BaseModel]): The model of the JSON body (optional).
+        - query (type[BaseModel]): The model of the query string (optional).
+
+        Returns:
+        The decorator.
+    """
+    body_adapter = TypeAdapter(body) if body is not None else None
+    query_adapter = TypeAdapter(query) if query is not None else None
+
+    documentation = []
+    if body_adapter is not None:
+        documentation.append(api.expect(api.schema_model(body.__name__, swagger_schema(body_adapter.json_schema()))))
+    if query_adapter is not None:
+        documentation.append(api.doc(params=query_parameters(query_adapter.json_schema())))
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            errors = {}
+            request.body_params, request.query_params = None, None
+
+            if query_adapter is not None:
+                try:
+                    request.query_params = query_adapter.validate_python(request.args.to_dict())
+                except ValidationError as error:
+                    errors["query_params"] = error.errors(include_url=False, include_context=False,
+                                                          include_input=False)
+
+            if body_adapter is not None:
+                try:
+                    request.body_params = body_adapter.validate_json(request.get_data() or b"{}")
+                except ValidationError as error:
+                    errors["body_params"] = error.errors(include_url=False, include_context=False,
+                                                         include_input=False)
+
+            if errors:
+                return {"validation_error": errors}, 400
+            return f(*args, **kwargs)
+
+        for document in documentation:
+            wrapper = document(wrapper)
+        return wrapper
+
+    return decorator
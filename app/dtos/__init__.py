@@ -1,3 +1,5 @@
 from .auth_dto import AuthenticationResponseModel, AuthenticationModel, RegisterNewAuthenticationModel
-from .task_category_dto import RegisterNewTaskCategoryModel, UpdateTaskCategoryModel
-from .task_dto import RegisterNewTaskModel, UpdateTaskModel
+from .task_category_dto import (RegisterNewTaskCategoryModel, UpdateTaskCategoryModel, TaskCategoryFieldsQueryModel,
+                                TaskCategoryQueryModel)
+from .task_dto import (RegisterNewTaskModel, UpdateTaskModel, RestoreTaskModel, TaskFieldsQueryModel,
+                       SearchTaskQueryModel, ArchivedTaskFieldsQueryModel, ArchivedTaskQueryModel)
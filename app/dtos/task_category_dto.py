@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+
+from app.utils.fieldsets import TASK_CATEGORY_FIELDS, TASK_FIELDS, parse_fieldset
 
 
 class RegisterNewTaskCategoryModel(BaseModel):
@@ -27,3 +29,34 @@ class UpdateTaskCategoryModel(BaseModel):
 
     title: Optional[str] = None
     order: Optional[int] = None
+
+
+class TaskCategoryFieldsQueryModel(BaseModel):
+    """
+        Represents the query string selecting the fields of the task categories returned.
+
+        Attributes:
+        - fields (Optional[tuple[str, ...]]): The only fields of the task categories to return, "tasks.<field>"
+          selecting fields of their tasks, e.g. "id,title,tasks.id,tasks.title" (optional, all of them by default).
+    """
+
+    fields: Optional[tuple[str, ...]] = Field(
+        None, description=f"Fields to return, some of: {', '.join(TASK_CATEGORY_FIELDS)}, or tasks.<field> for the "
+                          f"fields of the tasks: {', '.join(TASK_FIELDS)}")
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def parse_fields(cls, value):
+        return parse_fieldset(value, TASK_CATEGORY_FIELDS, {"tasks": TASK_FIELDS})
+
+
+class TaskCategoryQueryModel(TaskCategoryFieldsQueryModel):
+    """
+        Represents the query string of the task category endpoints.
+
+        Attributes:
+        - exclude_tasks (bool): If true, the tasks within the categories are excluded from the result.
+        - fields (Optional[tuple[str, ...]]): The only fields of the task categories to return (optional).
+    """
+
+    exclude_tasks: bool = Field(False, description="Exclude the tasks of the task categories")
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+
+from app.utils.fieldsets import ARCHIVED_TASK_FIELDS, TASK_FIELDS, own_fields, parse_fieldset
 
 
 class RegisterNewTaskModel(BaseModel):
@@ -35,3 +37,84 @@ class UpdateTaskModel(BaseModel):
     description: Optional[str] = None
     category_id: Optional[str] = None
     order: Optional[int] = None
+
+
+class RestoreTaskModel(BaseModel):
+    """
+        Represents the data model for restoring an archived task.
+
+        Attributes:
+        - category_id (Optional[str]): The ID of the category to restore the task to. Defaults to the category the task
+          was archived from.
+    """
+
+    category_id: Optional[str] = None
+
+
+class TaskFieldsQueryModel(BaseModel):
+    """
+        Represents the query string of the task endpoints.
+
+        Attributes:
+        - fields (Optional[tuple[str, ...]]): The only fields of the tasks to return, e.g. "id,title,order" (optional,
+          all of them by default).
+    """
+
+    fields: Optional[tuple[str, ...]] = Field(None, description=f"Fields to return, some of: {', '.join(TASK_FIELDS)}")
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def parse_fields(cls, value):
+        return None if value is None else own_fields(parse_fieldset(value, TASK_FIELDS), TASK_FIELDS)
+
+
+class SearchTaskQueryModel(TaskFieldsQueryModel):
+    """
+        Represents the query string of the task search.
+
+        Attributes:
+        - q (str): The words searched in the task titles and descriptions.
+        - page (int): The 1-based page of results.
+        - per_page (int): The number of results per page (1-100).
+        - fields (Optional[tuple[str, ...]]): The only fields of the tasks to return (optional).
+    """
+
+    q: str = Field(description="Words searched in task titles and descriptions")
+    page: int = Field(1, ge=1, description="Page of results")
+    per_page: int = Field(20, ge=1, le=100, description="Results per page (1-100)")
+
+
+class ArchivedTaskFieldsQueryModel(BaseModel):
+    """
+        Represents the query string of the archived task endpoints.
+
+        Attributes:
+        - fields (Optional[tuple[str, ...]]): The only fields of the archived tasks to return, e.g. "id,title"
+          (optional, all of them by default).
+    """
+
+    fields: Optional[tuple[str, ...]] = Field(
+        None, description=f"Fields to return, some of: {', '.join(ARCHIVED_TASK_FIELDS)}")
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def parse_fields(cls, value):
+        if value is None:
+            return None
+        return own_fields(parse_fieldset(value, ARCHIVED_TASK_FIELDS), ARCHIVED_TASK_FIELDS)
+
+
+class ArchivedTaskQueryModel(ArchivedTaskFieldsQueryModel):
+    """
+        Represents the query string of the archived task list.
+
+        Attributes:
+        - q (Optional[str]): The words searched in the archived task titles and descriptions (optional).
+        - page (int): The 1-based page of results.
+        - per_page (int): The number of results per page (1-100).
+        - fields (Optional[tuple[str, ...]]): The only fields of the archived tasks to return (optional).
+    """
+
+    q: Optional[str] = Field(None, description="Words searched in task titles and descriptions")
+    page: int = Field(1, ge=1, description="Page of results")
+    per_page: int = Field(20, ge=1, le=100, description="Results per page (1-100)")
@@ -0,0 +1,4 @@
+from .compression import init_compression
+from .idempotency import init_idempotency
+from .admission import init_admission_control
+from .rate_limit import init_rate_limiting, rate_limit_response, user_rate_limit_response
@@ -0,0 +1,119 @@
+import time
+
+from flask import Flask, g, request
+
+from app.utils import AdmissionController
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+EXPENSIVE_ROUTES = {
+    ("POST", "/auth/login"),
+    ("POST", "/auth/register"),
+}
+REORDER_ROUTES = {
+    ("PUT", "/task/<int:id>"),
+    ("PUT", "/task-category/<string:id>"),
+}
+
+
+def route_class() -> str:
+    """
+        Function: route_class
+
+        Description:
+        Classifies the current request by its cost: "expensive" for the password hashing of /auth/login and
+        /auth/register and for the moves, which rewrite the order of every task (or category) around the one moved,
+        "read" for the other GET, HEAD and OPTIONS requests, and "write" for the rest.
+
+        Returns:
+        str: The route class of the request.
+    """
+    rule = request.url_rule.rule if request.url_rule else None
+    if (request.method, rule) in EXPENSIVE_ROUTES:
+        return "expensive"
+    if (request.method, rule) in REORDER_ROUTES:
+        body = request.get_json(silent=True)
+        if isinstance(body, dict) and body.get("order") is not None:
+            return "expensive"
+    if request.method in READ_METHODS:
+        return "read"
+    return "write"
+
+
+def queued_for_ms(header: str) -> float | None:
+    """
+        Function: queued_for_ms
+
+        Description:
+        Computes how long the request waited before reaching the worker from the "X-Request-Start" header set by the
+        reverse proxy, as "t=<timestamp>" in seconds, milliseconds or microseconds.
+
+        Parameters:
+        - header (str): The value of the header.
+
+        Returns:
+        float | None: The waiting time in milliseconds, or None if the header is malformed.
+    """
+    try:
+        started_at = float(header.strip().removeprefix("t="))
+    except ValueError:
+        return None
+    if started_at > 1e14:
+        started_at /= 1e6
+    elif started_at > 1e11:
+        started_at /= 1e3
+    return max(0.0, (time.time() - started_at) * 1000)
+
+
+def init_admission_control(app: Flask):
+    """
+        Function: init_admission_control
+
+        Description:
+        This function is responsible for shedding the load of the Flask application under spikes, answering the
+        requests a worker cannot serve right away with a fast "503 Service Unavailable" and a "Retry-After" header
+        instead of letting them pile up latency for everyone.
+
+        Each worker process serves at most ADMISSION_MAX_IN_FLIGHT requests at the same time, and at most
+        ADMISSION_ROUTE_CLASS_LIMITS requests of each route class (see route_class). The last ADMISSION_READ_RESERVED
+        slots are kept for cheap reads, so the board keeps loading while logins and moves are saturated. These limits
+        only apply in the gevent mode: a sync worker serves one request at a time, and its waiting requests queue in
+        front of it. Requests that already waited more than ADMISSION_MAX_QUEUE_MS there, according to the
+        "X-Request-Start" header of a reverse proxy such as nginx, are rejected as well, since their client has likely
+        given up; uWSGI serving HTTP itself, as in the Docker image, sets no such header, so the check needs that proxy.
+        Set ADMISSION_CONTROL_ENABLED to False to disable it.
+
+        It must be installed before the other request hooks, so rejected requests do no other work.
+
+        Parameters:
+        - app (Flask): The Flask application instance whose requests will be admitted.
+
+        Returns:
+        None
+    """
+    if not app.config["ADMISSION_CONTROL_ENABLED"]:
+        return
+
+    controller = AdmissionController(app.config["ADMISSION_MAX_IN_FLIGHT"], app.config["ADMISSION_READ_RESERVED"],
+                                     app.config["ADMISSION_ROUTE_CLASS_LIMITS"])
+    max_queue_ms = app.config["ADMISSION_MAX_QUEUE_MS"]
+    rejection = ({"message": "The server is busy, please retry later"}, 503,
+                 {"Retry-After": str(app.config["ADMISSION_RETRY_AFTER_SECONDS"])})
+    app.extensions["admission_controller"] = controller
+
+    @app.before_request
+    def admit_request():
+        request_start = request.headers.get("X-Request-Start")
+        if max_queue_ms and request_start and (queued_for_ms(request_start) or 0) > max_queue_ms:
+            return rejection
+
+        admission_class = route_class()
+        if not controller.acquire(admission_class):
+            return rejection
+        g.admission_class = admission_class
+        return None
+
+    @app.teardown_request
+    def release_admission(error=None):
+        admission_class = g.pop("admission_class", None)
+        if admission_class is not None:
+            controller.release(admission_class)
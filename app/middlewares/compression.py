@@ -0,0 +1,135 @@
+import gzip
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+COMPRESSORS = {
+    "zstd": (_zstd, "COMPRESSION_ZSTD_LEVEL"),
+    "br": (_brotli, "COMPRESSION_BROTLI_LEVEL"),
+    "gzip": (_gzip, "COMPRESSION_GZIP_LEVEL"),
+}
+
+
+def available_encodings(preferred: list[str]) -> list[str]:
+    """
+        Function: available_encodings
+
+        Description:
+        Filters the configured content encodings down to the ones whose library is installed. gzip is always
+        available; brotli needs the "Brotli" package and zstd the "zstandard" package.
+
+        Parameters:
+        - preferred (list[str]): The configured encodings, in order of preference.
+
+        Returns:
+        list[str]: The usable encodings, in order of preference.
+    """
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [encoding for encoding in preferred if installed.get(encoding)]
+
+
+def negotiate_encoding(accept_encoding: str, encodings: list[str]) -> str | None:
+    """
+        Function: negotiate_encoding
+
+        Description:
+        Picks the content encoding of the response from the client's "Accept-Encoding" header. The encoding with the
+        highest quality value wins and ties are broken by the server preference order; "q=0" excludes an encoding and
+        "*" stands for any encoding that is not listed explicitly.
+
+        Parameters:
+        - accept_encoding (str): The value of the "Accept-Encoding" request header.
+        - encodings (list[str]): The encodings the server can produce, in order of preference.
+
+        Returns:
+        str | None: The selected encoding, or None if the response must not be compressed.
+    """
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            qualities[name.strip()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    candidates = [(qualities.get(encoding, wildcard), -index, encoding) for index, encoding in enumerate(encodings)]
+    candidates = [candidate for candidate in candidates if candidate[0] > 0]
+    return max(candidates)[2] if candidates else None
+
+
+def init_compression(app: Flask):
+    """
+        Function: init_compression
+
+        Description:
+        This function is responsible for enabling negotiated compression of the responses of the Flask application.
+        Responses whose mimetype is listed in COMPRESSION_MIMETYPES and whose body is at least COMPRESSION_MIN_SIZE
+        bytes are compressed with the best encoding accepted by the client among COMPRESSION_ENCODINGS (zstd, br,
+        gzip). The levels are tuned for a low CPU cost per request and can be changed with COMPRESSION_ZSTD_LEVEL,
+        COMPRESSION_BROTLI_LEVEL and COMPRESSION_GZIP_LEVEL. Set COMPRESSION_ENABLED to False to disable it, e.g. when a
+        reverse proxy already compresses the responses.
+
+        Parameters:
+        - app (Flask): The Flask application instance whose responses will be compressed.
+
+        Returns:
+        None
+    """
+    if not app.config["COMPRESSION_ENABLED"]:
+        return
+
+    encodings = available_encodings(app.config["COMPRESSION_ENCODINGS"])
+    mimetypes = set(app.config["COMPRESSION_MIMETYPES"])
+    min_size = app.config["COMPRESSION_MIN_SIZE"]
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        response.vary.add("Accept-Encoding")
+        if (response.direct_passthrough or response.is_streamed or response.status_code < 200
+                or response.status_code in (204, 206, 304) or "Content-Encoding" in response.headers
+                or response.mimetype not in mimetypes or request.method == "HEAD"):
+            return response
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        encoding = negotiate_encoding(request.headers.get("Accept-Encoding", ""), encodings)
+        if encoding is None:
+            return response
+
+        compress, level_key = COMPRESSORS[encoding]
+        response.set_data(compress(data, app.config[level_key]))
+        response.headers["Content-Encoding"] = encoding
+        if response.get_etag()[0]:
+            etag, _ = response.get_etag()
+            response.set_etag(f"{etag}-{encoding}", weak=True)
+        return response
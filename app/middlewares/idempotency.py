@@ -0,0 +1,199 @@
+import hashlib
+import time
+from datetime import timedelta
+
+import jwt
+from flask import Flask, Response, current_app, g, request
+from sqlalchemy import and_, select
+from sqlalchemy.exc import IntegrityError
+
+MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+# Responses telling the client to retry later or with other credentials, which a retry with the same key must not get
+# back for IDEMPOTENCY_TTL_SECONDS.
+RELEASED_STATUSES = {401, 403, 409, 429}
+# The authentication endpoints, whose responses (tokens) are never stored.
+EXCLUDED_PATH_PREFIXES = ("/auth/",)
+REPLAYED_HEADERS = ("Location", "Retry-After")
+PURGE_INTERVAL_SECONDS = 300
+
+
+def request_scope() -> str:
+    """
+        Function: request_scope
+
+        Description:
+        Identifies who sent the current request, so idempotency keys of different users never collide. The bearer token
+        is only decoded here; it is still fully verified by the token_required decorator of the endpoint.
+
+        Returns:
+        str: "user:<id>" for a request with a valid bearer token, "anonymous" otherwise.
+    """
+    token = request.headers.get("Authorization", "").split(" ")[-1]
+    if token:
+        try:
+            return f"user:{jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])['id']}"
+        except Exception:
+            pass
+    return "anonymous"
+
+
+def request_fingerprint() -> str:
+    """
+        Function: request_fingerprint
+
+        Description:
+        Hashes what makes the current request unique (method, path, query string and body), so that a key reused for a
+        different request is rejected instead of replaying an unrelated response.
+
+        Returns:
+        str: The hexadecimal SHA-256 of the request.
+    """
+    digest = hashlib.sha256()
+    for part in (request.method.encode(), request.path.encode(), request.query_string, request.get_data(cache=True)):
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def claim_idempotency_key(scope: str, key: str, fingerprint: str) -> dict | None:
+    """
+        Function: claim_idempotency_key
+
+        Description:
+        Records a request as in flight under its idempotency key, unless the key is already taken. The unique index on
+        (scope, key) makes the claim atomic across threads, workers and hosts. Expired records, and in-flight records
+        older than IDEMPOTENCY_IN_FLIGHT_TIMEOUT_SECONDS (their worker died), are replaced.
+
+        Parameters:
+        - scope (str): Who sent the request (see request_scope).
+        - key (str): The value of the "Idempotency-Key" header.
+        - fingerprint (str): The fingerprint of the request (see request_fingerprint).
+
+        Returns:
+        dict | None: None if the key has been claimed by this request, otherwise the record of the request that holds
+        it.
+    """
+    from app import db
+    from app.models import IdempotencyKey
+    from app.models.task import utcnow
+
+    table = IdempotencyKey.__table__
+    config = current_app.config
+    while True:
+        now = utcnow()
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(table.insert().values(
+                    scope=scope, key=key, fingerprint=fingerprint, status=IdempotencyKey.IN_FLIGHT, created_at=now,
+                    expires_at=now + timedelta(seconds=config["IDEMPOTENCY_TTL_SECONDS"])))
+            return None
+        except IntegrityError:
+            pass
+
+        with db.engine.begin() as connection:
+            record = connection.execute(
+                select(table).where(table.c.scope == scope, table.c.key == key)).mappings().first()
+            if record is None:
+                continue
+
+            abandoned_before = now - timedelta(seconds=config["IDEMPOTENCY_IN_FLIGHT_TIMEOUT_SECONDS"])
+            if record["expires_at"] <= now or (record["status"] == IdempotencyKey.IN_FLIGHT
+                                               and record["created_at"] <= abandoned_before):
+                connection.execute(table.delete().where(
+                    and_(table.c.id == record["id"], table.c.created_at == record["created_at"])))
+                continue
+            return dict(record)
+
+
+def init_idempotency(app: Flask):
+    """
+        Function: init_idempotency
+
+        Description:
+        This function is responsible for making the mutating endpoints (POST, PUT, PATCH and DELETE) of the Flask
+        application idempotent for the clients that send an "Idempotency-Key" header, such as mobile clients retrying
+        after a timeout.
+
+        The first request with a given key runs normally and its response is stored in the "idempotency_key" table for
+        IDEMPOTENCY_TTL_SECONDS, if its body is at most IDEMPOTENCY_MAX_RESPONSE_BYTES. Retries with the same key get
+        the stored response back, with an "Idempotency-Replayed: true" header, without running the endpoint again.
+        A retry received while the first request is still in flight is rejected with "409 Conflict" and a
+        "Retry-After" header, and reusing a key for a different request is rejected with "422 Unprocessable Entity".
+        Server errors (5xx), authentication and rate limit rejections (RELEASED_STATUSES) and oversized responses are
+        not stored, so their retries run again. The authentication endpoints ignore the header, so their tokens are
+        never stored. Keys are scoped to the user of the bearer token. Set IDEMPOTENCY_ENABLED to False to disable it.
+
+        Parameters:
+        - app (Flask): The Flask application instance whose mutating endpoints will be made idempotent.
+
+        Returns:
+        None
+    """
+    if not app.config["IDEMPOTENCY_ENABLED"]:
+        return
+
+    from app import db
+    from app.models import IdempotencyKey
+    from app.models.task import utcnow
+
+    table = IdempotencyKey.__table__
+    max_response_bytes = app.config["IDEMPOTENCY_MAX_RESPONSE_BYTES"]
+    purge = {"at": 0.0}
+
+    def release(claim: tuple[str, str]):
+        with db.engine.begin() as connection:
+            connection.execute(table.delete().where(table.c.scope == claim[0], table.c.key == claim[1],
+                                                    table.c.status == IdempotencyKey.IN_FLIGHT))
+
+    @app.before_request
+    def check_idempotency_key():
+        key = request.headers.get("Idempotency-Key")
+        if key is None or request.method not in MUTATING_METHODS or request.path.startswith(EXCLUDED_PATH_PREFIXES):
+            return None
+        if not 0 < len(key) <= 255:
+            return {"message": "The Idempotency-Key header must have between 1 and 255 characters"}, 400
+
+        if time.monotonic() - purge["at"] > PURGE_INTERVAL_SECONDS:
+            purge["at"] = time.monotonic()
+            with db.engine.begin() as connection:
+                connection.execute(table.delete().where(table.c.expires_at <= utcnow()))
+
+        scope, fingerprint = request_scope(), request_fingerprint()
+        record = claim_idempotency_key(scope, key, fingerprint)
+        if record is None:
+            g.idempotency_claim = (scope, key)
+            return None
+
+        if record["fingerprint"] != fingerprint:
+            return {"message": "The Idempotency-Key has already been used for a different request"}, 422
+        if record["status"] == IdempotencyKey.IN_FLIGHT:
+            return {"message": "A request with this Idempotency-Key is still in progress"}, 409, {"Retry-After": "1"}
+
+        response = Response(record["response_body"], status=record["response_status"],
+                            mimetype=record["response_mimetype"], headers=record["response_headers"])
+        response.headers["Idempotency-Replayed"] = "true"
+        return response
+
+    @app.after_request
+    def store_idempotent_response(response: Response) -> Response:
+        claim = g.pop("idempotency_claim", None)
+        if claim is None:
+            return response
+
+        if (response.status_code >= 500 or response.status_code in RELEASED_STATUSES or response.direct_passthrough
+                or response.is_streamed or response.calculate_content_length() > max_response_bytes):
+            release(claim)
+            return response
+
+        headers = {name: response.headers[name] for name in REPLAYED_HEADERS if name in response.headers}
+        with db.engine.begin() as connection:
+            connection.execute(table.update().where(table.c.scope == claim[0], table.c.key == claim[1]).values(
+                status=IdempotencyKey.COMPLETED, response_status=response.status_code,
+                response_mimetype=response.mimetype, response_body=response.get_data(), response_headers=headers))
+        return response
+
+    @app.teardown_request
+    def release_idempotency_key(error=None):
+        claim = g.pop("idempotency_claim", None)
+        if claim is not None:
+            release(claim)
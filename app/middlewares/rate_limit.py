@@ -0,0 +1,81 @@
+import math
+
+from flask import Flask, current_app, request
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from app.utils.rate_limiter import rate_limiter
+
+
+def rate_limit_response(key: str, rate: float, burst: float):
+    """
+        Function: rate_limit_response
+
+        Description:
+        Takes a token from the rate limit bucket of a key for the current request.
+
+        Parameters:
+        - key (str): Identifies the bucket, e.g. "user:42" or "ip:203.0.113.7".
+        - rate (float): The number of requests allowed per second.
+        - burst (float): The number of requests allowed at once.
+
+        Returns:
+        The "429 Too Many Requests" response, with a "Retry-After" header, if the key is over its limit, or else None.
+    """
+    if not current_app.config["RATE_LIMIT_ENABLED"]:
+        return None
+
+    retry_after = rate_limiter.retry_after(key, rate, burst)
+    if not retry_after:
+        return None
+    return {"message": "Too many requests, please retry later"}, 429, {"Retry-After": str(math.ceil(retry_after))}
+
+
+def user_rate_limit_response(user_id: int):
+    """
+        Function: user_rate_limit_response
+
+        Description:
+        Applies the per-user rate limit (RATE_LIMIT_USER_RATE and RATE_LIMIT_USER_BURST) to the current request. Called
+        by token_required once the token identifies the user.
+
+        Parameters:
+        - user_id (int): The ID of the authenticated user.
+
+        Returns:
+        The "429 Too Many Requests" response if the user is over their limit, or else None.
+    """
+    config = current_app.config
+    return rate_limit_response(f"user:{user_id}", config["RATE_LIMIT_USER_RATE"], config["RATE_LIMIT_USER_BURST"])
+
+
+def init_rate_limiting(app: Flask):
+    """
+        Function: init_rate_limiting
+
+        Description:
+        This function is responsible for applying the per-IP rate limit (RATE_LIMIT_IP_RATE and RATE_LIMIT_IP_BURST) to
+        every request of the Flask application, right after admission control (see init_admission_control) and before
+        any other work, so a single client cannot flood the API, even without a token. The per-user limit of the
+        authenticated endpoints is applied by token_required (see user_rate_limit_response). Set RATE_LIMIT_ENABLED
+        to False to disable both.
+
+        The client IP address is the address of the peer, unless TRUSTED_PROXY_COUNT reverse proxies are trusted to
+        set the "X-Forwarded-For" header, in which case the application is wrapped with Werkzeug's ProxyFix so it is
+        read from that header.
+
+        Parameters:
+        - app (Flask): The Flask application instance whose requests will be rate limited.
+
+        Returns:
+        None
+    """
+    if app.config["TRUSTED_PROXY_COUNT"]:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["TRUSTED_PROXY_COUNT"])
+    if not app.config["RATE_LIMIT_ENABLED"]:
+        return
+
+    rate, burst = app.config["RATE_LIMIT_IP_RATE"], app.config["RATE_LIMIT_IP_BURST"]
+
+    @app.before_request
+    def limit_client_address():
+        return rate_limit_response(f"ip:{request.remote_addr}", rate, burst)
@@ -1,3 +1,8 @@
 from .task import Task
 from .task_category import TaskCategory
 from .user import User
+from .archived_task import ArchivedTask
+from .job import Job
+from .idempotency_key import IdempotencyKey
+from .revoked_token import RevokedToken
+from .records import TaskRecord, TaskCategoryRecord
@@ -0,0 +1,57 @@
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Index
+
+from app import db
+from app.models.task import utcnow
+
+
+class ArchivedTask(db.Model):
+    """
+        Represents an archived task in the database. Archived tasks live in the "task_archive" table, out of the
+        "task" table read by the boards, until they are restored.
+
+        Attributes:
+        - id (int): The unique identifier for the archived task.
+        - task_id (int): The ID the task had before it was archived, reused on restore when still free.
+        - title (str): The title of the task.
+        - description (str): The description of the task.
+        - order (int): The order the task had in its category.
+        - category_id (int): The ID of the category the task belonged to, exposed as a string by the API.
+        - user_id (int): The ID of the user who owns the task.
+        - updated_at (datetime): When the task was last modified before it was archived (UTC).
+        - archived_at (datetime): When the task was archived (UTC).
+    """
+
+    __tablename__ = "task_archive"
+    __table_args__ = (
+        Index("ix_task_archive_user_id_archived_at", "user_id", "archived_at"),
+        Index("ix_task_archive_category_id", "category_id"),
+        {"info": {"sharded": True}},
+    )
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    title = Column(String(128), nullable=False)
+    description = Column(String)
+    order = Column(Integer)
+    category_id = Column(Integer, ForeignKey("task_category.id"))
+    user_id = Column(Integer, ForeignKey("user.id"))
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, nullable=False, default=utcnow)
+
+    def to_dict(self, fields: tuple[str, ...] = None):
+        """
+            Converts the archived task object to a dictionary.
+
+            Parameters:
+            - fields (tuple[str, ...]): The fields to include (optional, all of them by default). The other columns are
+              not read, so they may be left unloaded (load_only).
+
+            Returns:
+            A dictionary representation of the archived task object.
+        """
+        data = {name: getattr(self, name) for name in fields or [field.name for field in self.__table__.c]}
+        if "category_id" in data:
+            data["category_id"] = str(self.category_id) if self.category_id is not None else None
+        for name in ("updated_at", "archived_at"):
+            if name in data:
+                data[name] = data[name].isoformat() if data[name] is not None else None
+        return data
@@ -0,0 +1,42 @@
+from sqlalchemy import JSON, Column, DateTime, Integer, LargeBinary, String, Index
+
+from app import db
+
+
+class IdempotencyKey(db.Model):
+    """
+        Represents a request received with an "Idempotency-Key" header, and its response once completed.
+
+        Attributes:
+        - id (int): The unique identifier for the record.
+        - scope (str): Who sent the request: "user:<id>" for authenticated requests, "anonymous" otherwise.
+        - key (str): The value of the "Idempotency-Key" header.
+        - fingerprint (str): The SHA-256 of the method, path, query string and body of the request.
+        - status (str): "in_flight" while the request is being processed, "completed" once its response is stored.
+        - response_status (int): The HTTP status code of the stored response.
+        - response_mimetype (str): The mimetype of the stored response.
+        - response_body (bytes): The body of the stored response.
+        - response_headers (dict): The headers of the stored response that are replayed, such as "Location".
+        - created_at (datetime): When the request was received (UTC).
+        - expires_at (datetime): When the record is forgotten (UTC).
+    """
+
+    IN_FLIGHT = "in_flight"
+    COMPLETED = "completed"
+
+    __tablename__ = "idempotency_key"
+    __table_args__ = (
+        Index("ix_idempotency_key_scope_key", "scope", "key", unique=True),
+        Index("ix_idempotency_key_expires_at", "expires_at"),
+    )
+    id = Column(Integer, primary_key=True)
+    scope = Column(String(64), nullable=False)
+    key = Column(String(255), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    status = Column(String(16), nullable=False)
+    response_status = Column(Integer)
+    response_mimetype = Column(String(128))
+    response_body = Column(LargeBinary)
+    response_headers = Column(JSON)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,61 @@
+from sqlalchemy import JSON, Column, DateTime, Integer, String, Text, ForeignKey, Index
+
+from app import db
+from app.models.task import utcnow
+
+
+class Job(db.Model):
+    """
+        Represents a background job in the database. Jobs are queued by the API and run by "flask jobs-worker".
+
+        Attributes:
+        - id (int): The unique identifier for the job.
+        - name (str): The name of the job handler (see JobService.handlers).
+        - payload (dict): The arguments of the job handler.
+        - status (str): "queued", "running", "succeeded" or "failed".
+        - attempts (int): How many times the job has been started.
+        - max_attempts (int): How many times the job is started before it is marked as failed.
+        - result (dict): What the job handler returned, once succeeded.
+        - error (str): The error of the last failed attempt.
+        - user_id (int): The ID of the user who queued the job.
+        - run_after (datetime): When the job may be started (UTC), pushed back after a failed attempt.
+        - started_at (datetime): When the last attempt was started (UTC).
+        - created_at (datetime): When the job was queued (UTC).
+        - updated_at (datetime): When the job was last modified (UTC).
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    __tablename__ = "job"
+    __table_args__ = (
+        Index("ix_job_status_run_after", "status", "run_after"),
+        Index("ix_job_user_id_created_at", "user_id", "created_at"),
+    )
+    id = Column(Integer, primary_key=True)
+    name = Column(String(64), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String(16), nullable=False, default=QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    result = Column(JSON)
+    error = Column(Text)
+    user_id = Column(Integer, ForeignKey("user.id"))
+    run_after = Column(DateTime, nullable=False, default=utcnow)
+    started_at = Column(DateTime)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    updated_at = Column(DateTime, nullable=False, default=utcnow, onupdate=utcnow)
+
+    def to_dict(self):
+        """
+            Converts the job object to a dictionary.
+
+            Returns:
+            A dictionary representation of the job object.
+        """
+        data = {field.name: getattr(self, field.name) for field in self.__table__.c if field.name != "run_after"}
+        for name in ("started_at", "created_at", "updated_at"):
+            data[name] = data[name].isoformat() if data[name] is not None else None
+        return data
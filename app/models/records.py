@@ -0,0 +1,102 @@
+from app.models.task import Task
+from app.models.task_category import TaskCategory
+from app.utils.fieldsets import TASK_CATEGORY_FIELDS, TASK_FIELDS, nested_fields, own_fields
+
+
+class TaskRecord:
+    """
+        Read-only, lightweight copy of a task row, loaded with a Core select() instead of the ORM: it is not tracked by
+        the session (no identity map, no change tracking), so the list endpoints can serialize large boards cheaply.
+        Only some of the columns may be selected (sparse fieldsets), the others being None.
+
+        Attributes:
+        - COLUMNS (tuple): The columns to select, in the order of the constructor parameters.
+        - id, title, description, order, category_id, user_id, updated_at: The values of the task columns.
+    """
+
+    __slots__ = ("id", "title", "description", "order", "category_id", "user_id", "updated_at")
+    COLUMNS = (Task.id, Task.title, Task.description, Task.order, Task.category_id, Task.user_id, Task.updated_at)
+
+    def __init__(self, id=None, title=None, description=None, order=None, category_id=None, user_id=None,
+                 updated_at=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.order = order
+        self.category_id = category_id
+        self.user_id = user_id
+        self.updated_at = updated_at
+
+    @classmethod
+    def columns(cls, fields: tuple[str, ...] = None) -> tuple:
+        """
+            Returns the columns to select for the given fields (optional, all of them by default).
+        """
+        return cls.COLUMNS if fields is None else tuple(getattr(Task, name) for name in fields)
+
+    def to_dict(self, fields: tuple[str, ...] = None):
+        """
+            Converts the task record to a dictionary, the same way as Task.to_dict.
+
+            Parameters:
+            - fields (tuple[str, ...]): The fields to include (optional, all of them by default).
+
+            Returns:
+            A dictionary representation of the task record.
+        """
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "order": self.order,
+            "category_id": str(self.category_id) if self.category_id is not None else None,
+            "user_id": self.user_id,
+            "updated_at": self.updated_at.isoformat() if self.updated_at is not None else None,
+        }
+        return data if fields is None else {name: data[name] for name in fields}
+
+
+class TaskCategoryRecord:
+    """
+        Read-only, lightweight copy of a task category row and its task records, loaded with a Core select() instead of
+        the ORM.
+
+        Attributes:
+        - COLUMNS (tuple): The columns to select, in the order of the constructor parameters.
+        - id, title, order, user_id: The values of the task category columns.
+        - tasks (list[TaskRecord]): The task records of the category, empty when the tasks were not loaded.
+    """
+
+    __slots__ = ("id", "title", "order", "user_id", "tasks")
+    COLUMNS = (TaskCategory.id, TaskCategory.title, TaskCategory.order, TaskCategory.user_id)
+
+    def __init__(self, id=None, title=None, order=None, user_id=None):
+        self.id = id
+        self.title = title
+        self.order = order
+        self.user_id = user_id
+        self.tasks = []
+
+    def to_dict(self, exclude_tasks=False, fields: tuple[str, ...] = None):
+        """
+            Converts the task category record to a dictionary, the same way as TaskCategory.to_dict.
+
+            Parameters:
+            - exclude_tasks (bool): If True, tasks associated with the category will be excluded from the dictionary.
+            - fields (tuple[str, ...]): The fields to include, "tasks.<field>" selecting fields of the tasks (optional,
+              all of them by default).
+
+            Returns:
+            A dictionary representation of the task category record.
+        """
+        data = {
+            "id": str(self.id),
+            "title": self.title,
+            "order": self.order,
+            "user_id": self.user_id,
+        }
+        names = own_fields(fields, TASK_CATEGORY_FIELDS)
+        if "tasks" in names:
+            task_fields = None if fields is None else nested_fields(fields, "tasks", TASK_FIELDS)
+            data["tasks"] = [] if exclude_tasks else [task.to_dict(task_fields) for task in self.tasks]
+        return data if fields is None else {name: data[name] for name in names}
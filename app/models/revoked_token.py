@@ -0,0 +1,30 @@
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Index
+
+from app import db
+from app.models.task import utcnow
+
+
+class RevokedToken(db.Model):
+    """
+        Represents a revoked authentication token in the database. The record is kept until the token expires.
+
+        Attributes:
+        - id (int): The unique identifier for the record.
+        - jti (str): The unique identifier ("jti" claim) of the revoked token.
+        - user_id (int): The ID of the user the token was issued to.
+        - expires_at (datetime): When the token expires (UTC), after which the record can be deleted.
+        - revoked_at (datetime): When the token was revoked (UTC), indexed so the workers can load the recent
+          revocations.
+    """
+
+    __tablename__ = "revoked_token"
+    __table_args__ = (
+        Index("ix_revoked_token_jti", "jti", unique=True),
+        Index("ix_revoked_token_expires_at", "expires_at"),
+        Index("ix_revoked_token_revoked_at", "revoked_at"),
+    )
+    id = Column(Integer, primary_key=True)
+    jti = Column(String(64), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id"))
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=False, default=utcnow)
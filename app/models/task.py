@@ -1,6 +1,16 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Index, event
 
 from app import db
+from app.utils.search import create_task_search_index
+
+
+def utcnow() -> datetime:
+    """
+        Returns the current UTC time as a naive datetime, the way the timestamps of the tasks are stored.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class Task(db.Model):
@@ -12,23 +22,50 @@ class Task(db.Model):
         - title (str): The title of the task.
         - description (str): The description of the task.
         - order (int): The order of the task.
-        - category_id (str): The ID of the category to which the task belongs.
+        - category_id (int): The ID of the category to which the task belongs, exposed as a string by the API.
         - user_id (int): The ID of the user who owns the task.
+        - updated_at (datetime): When the task was created, or last edited or moved by its user (UTC), used by the
+          archive policy. Set by TaskService on the task itself only: the other tasks of a category renumbered by a
+          move keep theirs.
     """
 
     __tablename__ = "task"
+    __table_args__ = (
+        Index("ix_task_user_id_order", "user_id", "order"),
+        Index("ix_task_user_id_category_id_order", "user_id", "category_id", "order"),
+        Index("ix_task_user_id_title", "user_id", "title", postgresql_ops={"title": "text_pattern_ops"}),
+        {"info": {"sharded": True}},
+    )
     id = Column(Integer, primary_key=True)
     title = Column(String(128), nullable=False)
     description = Column(String)
     order = Column(Integer)
-    category_id = Column(String, ForeignKey("task_category.id"))
+    category_id = Column(Integer, ForeignKey("task_category.id"))
     user_id = Column(Integer, ForeignKey("user.id"))
+    updated_at = Column(DateTime, default=utcnow)
 
-    def to_dict(self):
+    def to_dict(self, fields: tuple[str, ...] = None):
         """
             Converts the task object to a dictionary.
 
+            Parameters:
+            - fields (tuple[str, ...]): The fields to include (optional, all of them by default). The other columns are
+              not read, so they may be left unloaded (load_only).
+
             Returns:
             A dictionary representation of the task object.
         """
-        return {field.name: getattr(self, field.name) for field in self.__table__.c}
+        data = {name: getattr(self, name) for name in fields or [field.name for field in self.__table__.c]}
+        if "category_id" in data:
+            data["category_id"] = str(self.category_id) if self.category_id is not None else None
+        if "updated_at" in data:
+            data["updated_at"] = self.updated_at.isoformat() if self.updated_at is not None else None
+        return data
+
+
+@event.listens_for(Task.__table__, "after_create")
+def create_task_search_index_after_create(target, connection, **kwargs):
+    """
+        Creates the full-text search index right after the "task" table, so "flask create-db" provisions it as well.
+    """
+    create_task_search_index(connection)
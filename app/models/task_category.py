@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Index, false, func, select
 from sqlalchemy.orm import relationship
 
 from app import db
+from app.utils.fieldsets import TASK_CATEGORY_FIELDS, TASK_FIELDS, nested_fields, own_fields
 
 
 class TaskCategory(db.Model):
@@ -9,33 +10,123 @@ class TaskCategory(db.Model):
          Represents a task category in the database.
 
          Attributes:
-         - id (str): The unique identifier for the task category.
+         - id (int): The unique identifier for the task category, exposed as a string by the API.
+         - legacy_id (str): The former 64-character hexadecimal identifier of categories created before integer keys,
+           still accepted by the API so existing clients keep working.
          - title (str): The title of the task category.
          - order (int): The order of the task category.
          - user_id (int): The ID of the user who owns the task category.
-         - tasks (relationship): Relationship with Task objects associated with the category.
+         - task_count (int): The number of tasks in the category, kept up to date by TaskService in the transaction
+           that adds, removes or moves a task, so the board summary does not count the tasks.
+         - tasks_updated_at (datetime): When a task of the category was last created, modified, moved or removed
+           (UTC).
+         - tasks (relationship): Relationship with Task objects associated with the category, ordered by their order.
     """
     __tablename__ = "task_category"
-    id = Column(String(64), primary_key=True)
+    __table_args__ = (
+        Index("ix_task_category_user_id_order", "user_id", "order"),
+        {"info": {"sharded": True}},
+    )
+    id = Column(Integer, primary_key=True)
+    legacy_id = Column(String(64), unique=True)
     title = Column(String(128), nullable=False)
     order = Column(Integer)
     user_id = Column(Integer, ForeignKey("user.id"))
-    tasks = relationship("Task", backref="category")
+    task_count = Column(Integer, default=0)
+    tasks_updated_at = Column(DateTime)
+    tasks = relationship("Task", backref="category", order_by="[Task.order, Task.id]")
 
-    def to_dict(self, exclude_tasks=False):
+    def to_dict(self, exclude_tasks=False, fields: tuple[str, ...] = None):
         """
             Converts the task category object to a dictionary.
 
             Parameters:
             - exclude_tasks (bool): If True, tasks associated with the category will be excluded from the dictionary.
+            - fields (tuple[str, ...]): The fields to include, "tasks.<field>" selecting fields of the tasks (optional,
+              all of them by default). See parse_fieldset.
 
             Returns:
             A dictionary representation of the task category object.
         """
-        data = {field.name: getattr(self, field.name) for field in self.__table__.c}
-        if not exclude_tasks:
-            data["tasks"] = [task.to_dict() for task in self.tasks]
-        else:
-            data["tasks"] = []
+        names = own_fields(fields, TASK_CATEGORY_FIELDS)
+        data = {name: getattr(self, name) for name in names if name != "tasks"}
+        if "id" in data:
+            data["id"] = str(self.id)
+        if "tasks" in names:
+            task_fields = nested_fields(fields, "tasks", TASK_FIELDS)
+            data["tasks"] = [] if exclude_tasks else [task.to_dict(task_fields) for task in self.tasks]
 
         return data
+
+    @staticmethod
+    def task_count_expression():
+        """
+            Builds the SQL expression counting the tasks of the task category, correlated to the task category of the
+            enclosing statement, to initialize or repair the "task_count" counter.
+
+            Returns:
+            The SQLAlchemy scalar subquery counting the tasks of the task category.
+        """
+        from app.models.task import Task
+
+        return select(func.count(Task.id)).where(Task.category_id == TaskCategory.id).scalar_subquery()
+
+    @staticmethod
+    def parse_key(id: int | str) -> tuple[str, int | str] | None:
+        """
+            Parses the identifier of a task category received from the API, which is either the integer key (as a
+            string or an int) or the 64-character legacy key of a migrated category.
+
+            Parameters:
+            - id (int | str): The identifier of the task category.
+
+            Returns:
+            tuple[str, int | str] | None: The name of the column holding the key ("id" or "legacy_id") and the key, or
+            None if the identifier is malformed.
+        """
+        id = str(id)
+        if len(id) == 64:
+            return "legacy_id", id
+        if id.isdigit():
+            return "id", int(id)
+        return None
+
+    @staticmethod
+    def key_criterion(id: int | str):
+        """
+            Builds the SQL criterion matching a task category by the identifier received from the API (see parse_key).
+
+            Parameters:
+            - id (int | str): The identifier of the task category.
+
+            Returns:
+            The SQLAlchemy criterion matching the task category, or a false criterion if the identifier is malformed.
+        """
+        key = TaskCategory.parse_key(id)
+        if key is None:
+            return false()
+        column, value = key
+        return getattr(TaskCategory, column) == value
+
+    @staticmethod
+    def key_value(id: int | str):
+        """
+            Converts the identifier of a task category received from the API (see parse_key) into a value comparable
+            with the integer key of the task category, e.g. in a filter on Task.category_id.
+
+            Parameters:
+            - id (int | str): The identifier of the task category.
+
+            Returns:
+            The integer key, or a scalar subquery resolving a legacy key to the integer key.
+
+            Raises:
+            ValueError: If the identifier is malformed.
+        """
+        key = TaskCategory.parse_key(id)
+        if key is None:
+            raise ValueError(f"Invalid task category identifier: {id!r}")
+        column, value = key
+        if column == "id":
+            return value
+        return select(TaskCategory.id).where(TaskCategory.legacy_id == value).scalar_subquery()
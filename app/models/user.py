@@ -11,10 +11,12 @@ class User(db.Model):
         - id (int): The unique identifier for the user.
         - username (str): The username of the user.
         - password_hash (str): The hashed password of the user.
+        - shard_key (str): The name of the database shard holding the board of the user (None for the main database).
     """
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(64), unique=True, nullable=False)
     password_hash = db.Column(db.String(255))
+    shard_key = db.Column(db.String(32))
 
     def set_password(self, password):
         """
@@ -0,0 +1,208 @@
+from datetime import datetime
+
+from sqlalchemy import delete, desc, func, insert, literal, or_, select, update
+from sqlalchemy.orm import load_only
+
+from app import db
+from app.interfaces.repository_interface import RepositoryInterface
+from app.models import ArchivedTask, Task, TaskCategory, User
+from app.models.task import utcnow
+from app.utils import cache_registry, tokenize_search_query
+
+
+class ArchivedTaskRepository(RepositoryInterface):
+    ARCHIVED_COLUMNS = ["task_id", "title", "description", "order", "category_id", "user_id", "updated_at"]
+
+    def get_all(self, query: str | None, page: int, per_page: int, current_user: User,
+                fields: tuple[str, ...] | None = None) -> tuple[list[ArchivedTask], int]:
+        """
+            Retrieves the archived tasks of the current user, most recently archived first, optionally searched by title
+            and description.
+
+            The archive is cold storage: instead of the full-text index of the active tasks, every word of the query is
+            matched with a case-insensitive LIKE within the archived tasks of the user.
+
+            Parameters:
+            - query (str | None): The free-text search query (optional). Every word must appear in the title or the
+              description.
+            - page (int): The 1-based page of results to retrieve.
+            - per_page (int): The maximum number of results per page.
+            - current_user (User): The current authenticated user.
+            - fields (tuple[str, ...] | None): The only columns to load, the others being deferred (optional).
+
+            Returns:
+            A tuple with the page of ArchivedTask objects and the total number of matching archived tasks.
+        """
+        statement = select(ArchivedTask).where(ArchivedTask.user_id == current_user.id)
+        for token in tokenize_search_query(query or ""):
+            pattern = f"%{token}%"
+            statement = statement.where(or_(ArchivedTask.title.ilike(pattern), ArchivedTask.description.ilike(pattern)))
+
+        total = db.session.execute(select(func.count()).select_from(statement.subquery())).scalar_one()
+        page_statement = (statement.order_by(desc(ArchivedTask.archived_at), desc(ArchivedTask.id))
+                          .limit(per_page).offset((page - 1) * per_page))
+        if fields is not None:
+            page_statement = page_statement.options(self._load_only(fields))
+        return list(db.session.execute(page_statement).scalars().all()), total
+
+    def get_by_id(self, id: int, current_user: User, fields: tuple[str, ...] | None = None) -> ArchivedTask | None:
+        """
+            Retrieves a specific archived task by its ID.
+
+            Parameters:
+            - id (int): The ID of the archived task to retrieve.
+            - current_user (User): The current authenticated user.
+            - fields (tuple[str, ...] | None): The only columns to load, the others being deferred (optional).
+
+            Returns:
+            The ArchivedTask object corresponding to the specified ID, or None if not found.
+        """
+        query = ArchivedTask.query.filter_by(id=id, user_id=current_user.id)
+        if fields is not None:
+            query = query.options(self._load_only(fields))
+        return query.first()
+
+    @staticmethod
+    def _load_only(fields: tuple[str, ...]):
+        return load_only(*(getattr(ArchivedTask, name) for name in fields))
+
+    def get_by_name(self, title: str):
+        """
+            Placeholder method. Not implemented.
+        """
+        pass
+
+    def get_by_order(self, order: int):
+        """
+            Placeholder method. Not implemented.
+        """
+        pass
+
+    def create(self, archived_task: ArchivedTask) -> ArchivedTask:
+        """
+            Creates a new archived task.
+
+            Parameters:
+            - archived_task (ArchivedTask): The ArchivedTask object to create.
+
+            Returns:
+            The created ArchivedTask object.
+        """
+        db.session.add(archived_task)
+        db.session.commit()
+        return archived_task
+
+    def update(self, archived_task: ArchivedTask):
+        """
+            Updates an existing archived task.
+
+            Parameters:
+            - archived_task (ArchivedTask): The ArchivedTask object to update.
+        """
+        db.session.commit()
+
+    def delete(self, id: int):
+        """
+            Deletes a specific archived task by its ID.
+
+            Parameters:
+            - id (int): The ID of the archived task to delete.
+
+            Returns:
+            True if deletion was successful, False otherwise.
+        """
+        archived_task = db.session.get(ArchivedTask, id)
+        if archived_task:
+            db.session.delete(archived_task)
+            db.session.commit()
+            return True
+        return False
+
+    def delete_all_by_category(self, category_id: int):
+        """
+            Deletes the archived tasks of a task category, within the transaction of the caller (no commit).
+
+            Parameters:
+            - category_id (int): The ID of the task category.
+        """
+        ArchivedTask.query.filter_by(category_id=category_id).delete()
+
+    def archive(self, task: Task) -> ArchivedTask:
+        """
+            Moves a task from the "task" table to the archive in a single transaction.
+
+            Parameters:
+            - task (Task): The Task object to archive.
+
+            Returns:
+            The created ArchivedTask object.
+        """
+        archived_task = ArchivedTask(**{name: getattr(task, name if name != "task_id" else "id")
+                                        for name in self.ARCHIVED_COLUMNS})
+        db.session.add(archived_task)
+        db.session.delete(task)
+        db.session.commit()
+        return archived_task
+
+    def restore(self, archived_task: ArchivedTask, category: TaskCategory) -> Task:
+        """
+            Moves an archived task back to the "task" table in a single transaction, at the end of the given category.
+            The task gets its former ID back unless it has been taken in the meantime.
+
+            Parameters:
+            - archived_task (ArchivedTask): The ArchivedTask object to restore.
+            - category (TaskCategory): The category the task is restored to.
+
+            Returns:
+            The restored Task object.
+        """
+        last_order = db.session.execute(select(func.max(Task.order)).where(Task.category_id == category.id)).scalar()
+        task_id = archived_task.task_id if db.session.get(Task, archived_task.task_id) is None else None
+        task = Task(id=task_id, title=archived_task.title, description=archived_task.description,
+                    order=(last_order or 0) + 1, category_id=category.id, user_id=archived_task.user_id)
+        db.session.add(task)
+        db.session.delete(archived_task)
+        db.session.commit()
+        return task
+
+    def archive_stale(self, category_titles: list[str], updated_before: datetime, batch_size: int) -> int:
+        """
+            Archives the tasks of the categories with the given titles that have not been updated since the given time,
+            for every user of the current shard, in transactions of at most batch_size tasks. Tasks without an update
+            time (created before it was recorded) are stamped with the current time first, so their delay starts now.
+            The task counters of the categories are recounted in the transaction that archives their tasks, and the
+            cached boards of their users are invalidated once it is committed.
+
+            Parameters:
+            - category_titles (list[str]): The titles of the categories holding completed tasks.
+            - updated_before (datetime): The update time (UTC) before which a task is archived.
+            - batch_size (int): The maximum number of tasks archived per transaction.
+
+            Returns:
+            The number of archived tasks.
+        """
+        db.session.execute(update(Task).where(Task.updated_at.is_(None)).values(updated_at=utcnow()))
+        db.session.commit()
+
+        archived = 0
+        while True:
+            task_ids = db.session.execute(
+                select(Task.id).join(TaskCategory, TaskCategory.id == Task.category_id)
+                .where(TaskCategory.title.in_(category_titles), Task.updated_at < updated_before)
+                .order_by(Task.id).limit(batch_size)).scalars().all()
+            if not task_ids:
+                return archived
+
+            columns = [Task.id if name == "task_id" else getattr(Task, name) for name in self.ARCHIVED_COLUMNS]
+            db.session.execute(insert(ArchivedTask).from_select(
+                [*self.ARCHIVED_COLUMNS, "archived_at"],
+                select(*columns, literal(utcnow(), ArchivedTask.archived_at.type)).where(Task.id.in_(task_ids))))
+            owners = db.session.execute(select(Task.category_id, Task.user_id).where(Task.id.in_(task_ids))
+                                        .distinct()).all()
+            db.session.execute(delete(Task).where(Task.id.in_(task_ids)))
+            db.session.execute(update(TaskCategory).where(TaskCategory.id.in_({row.category_id for row in owners}))
+                               .values(task_count=TaskCategory.task_count_expression(), tasks_updated_at=utcnow()),
+                               execution_options={"synchronize_session": False})
+            db.session.commit()
+            cache_registry.invalidate(*{f"board:{row.user_id}" for row in owners})
+            archived += len(task_ids)
@@ -0,0 +1,129 @@
+from datetime import datetime
+
+from sqlalchemy import and_, asc, desc, or_, select, update
+
+from app import db
+from app.interfaces.repository_interface import RepositoryInterface
+from app.models import Job, User
+from app.models.task import utcnow
+
+
+class JobRepository(RepositoryInterface):
+    def get_all(self, current_user: User, limit: int = 50) -> list[Job]:
+        """
+            Retrieves the most recent jobs queued by the current user.
+
+            Parameters:
+            - current_user (User): The current authenticated user.
+            - limit (int): The maximum number of jobs to retrieve.
+
+            Returns:
+            A list of Job objects, most recent first.
+        """
+        return (Job.query.filter_by(user_id=current_user.id).order_by(desc(Job.created_at), desc(Job.id))
+                .limit(limit).all())
+
+    def get_by_id(self, id: int, current_user: User) -> Job | None:
+        """
+            Retrieves a specific job by its ID.
+
+            Parameters:
+            - id (int): The ID of the job to retrieve.
+            - current_user (User): The current authenticated user.
+
+            Returns:
+            The Job object corresponding to the specified ID, or None if not found.
+        """
+        return Job.query.filter_by(id=id, user_id=current_user.id).first()
+
+    def get_by_name(self, name: str):
+        """
+            Placeholder method. Not implemented.
+        """
+        pass
+
+    def get_by_order(self, order: int):
+        """
+            Placeholder method. Not implemented.
+        """
+        pass
+
+    def create(self, job: Job) -> Job:
+        """
+            Creates a new job.
+
+            Parameters:
+            - job (Job): The Job object to create.
+
+            Returns:
+            The created Job object.
+        """
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    def update(self, job: Job):
+        """
+            Updates an existing job.
+
+            Parameters:
+            - job (Job): The Job object to update.
+        """
+        db.session.commit()
+
+    def delete(self, id: int):
+        """
+            Deletes a specific job by its ID.
+
+            Parameters:
+            - id (int): The ID of the job to delete.
+
+            Returns:
+            True if deletion was successful, False otherwise.
+        """
+        job = db.session.get(Job, id)
+        if job:
+            db.session.delete(job)
+            db.session.commit()
+            return True
+        return False
+
+    def claim_next(self, started_before: datetime) -> Job | None:
+        """
+            Claims the next job to run: the oldest queued job that is due, or a running job started before the given
+            time (its worker is assumed dead) that has attempts left. Running jobs without attempts left are marked as
+            failed first.
+
+            The job is claimed with a conditional update on its status and start time, so concurrent workers, in this
+            process or another one, never run the same attempt twice.
+
+            Parameters:
+            - started_before (datetime): The start time (UTC) before which a running job is considered abandoned.
+
+            Returns:
+            The claimed Job object, already marked as running, or None if no job is due.
+        """
+        now = utcnow()
+        abandoned = and_(Job.status == Job.RUNNING, Job.started_at < started_before)
+        db.session.execute(update(Job).where(abandoned, Job.attempts >= Job.max_attempts)
+                           .values(status=Job.FAILED, error="The job timed out"))
+        db.session.commit()
+
+        while True:
+            candidate = db.session.execute(
+                select(Job.id, Job.status, Job.started_at)
+                .where(or_(and_(Job.status == Job.QUEUED, Job.run_after <= now), abandoned))
+                .order_by(asc(Job.run_after), asc(Job.id)).limit(1)).first()
+            if candidate is None:
+                return None
+
+            claimed = db.session.execute(
+                update(Job)
+                .where(Job.id == candidate.id, Job.status == candidate.status,
+                       Job.started_at.is_(None) if candidate.started_at is None
+                       else Job.started_at == candidate.started_at)
+                .values(status=Job.RUNNING, attempts=Job.attempts + 1, started_at=now, updated_at=now)
+                .execution_options(synchronize_session=False))
+            db.session.commit()
+            if claimed.rowcount == 1:
+                return db.session.get(Job, candidate.id, populate_existing=True)
@@ -0,0 +1,96 @@
+from datetime import datetime
+
+from sqlalchemy import delete, select
+
+from app import db
+from app.interfaces.repository_interface import RepositoryInterface
+from app.models import RevokedToken
+
+
+class RevokedTokenRepository(RepositoryInterface):
+    def get_all(self, expires_after: datetime) -> list[str]:
+        """
+            Retrieves the revoked tokens that have not expired yet.
+
+            Parameters:
+            - expires_after (datetime): The current time (UTC).
+
+            Returns:
+            A list of the unique identifiers ("jti" claim) of the tokens.
+        """
+        return list(db.session.scalars(select(RevokedToken.jti).where(RevokedToken.expires_at > expires_after)))
+
+    def get_since(self, revoked_after: datetime) -> list[str]:
+        """
+            Retrieves the tokens revoked since the given time.
+
+            Parameters:
+            - revoked_after (datetime): The time (UTC) from which revocations are retrieved, included.
+
+            Returns:
+            A list of the unique identifiers ("jti" claim) of the tokens.
+        """
+        return list(db.session.scalars(select(RevokedToken.jti).where(RevokedToken.revoked_at >= revoked_after)))
+
+    def get_by_id(self, id: int):
+        """
+            Retrieves a specific revoked token by its ID.
+
+            Parameters:
+            - id (int): The ID of the record to retrieve.
+
+            Returns:
+            The RevokedToken object corresponding to the specified ID, or None if not found.
+        """
+        return db.session.get(RevokedToken, id)
+
+    def get_by_name(self, jti: str) -> RevokedToken | None:
+        """
+            Retrieves a revoked token by its unique identifier ("jti" claim).
+
+            Parameters:
+            - jti (str): The unique identifier of the token.
+
+            Returns:
+            The RevokedToken object corresponding to the specified identifier, or None if the token is not revoked.
+        """
+        return RevokedToken.query.filter_by(jti=jti).first()
+
+    def get_by_order(self, order: int):
+        """
+            Placeholder method. Not implemented.
+        """
+        pass
+
+    def create(self, revoked_token: RevokedToken) -> RevokedToken:
+        """
+            Creates a new revoked token.
+
+            Parameters:
+            - revoked_token (RevokedToken): The RevokedToken object to create.
+
+            Returns:
+            The created RevokedToken object.
+        """
+        db.session.add(revoked_token)
+        db.session.commit()
+        return revoked_token
+
+    def update(self, revoked_token: RevokedToken):
+        """
+            Updates an existing revoked token.
+
+            Parameters:
+            - revoked_token (RevokedToken): The RevokedToken object to update.
+        """
+        db.session.commit()
+
+    def delete(self, expires_before: datetime):
+        """
+            Deletes the revoked tokens that have expired, since they are rejected by their expiry anyway.
+
+            Parameters:
+            - expires_before (datetime): The current time (UTC).
+        """
+        db.session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= expires_before))
+        db.session.commit()
@@ -1,47 +1,260 @@
-from sqlalchemy import asc
-from sqlalchemy.orm import joinedload
+from sqlalchemy import (JSON, String, asc, bindparam, cast, event, func, literal, literal_column, select, type_coerce,
+                        update)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import load_only, selectinload
 
 from app import db
 from app.interfaces.repository_interface import RepositoryInterface
-from app.models import TaskCategory, User
-from app.repositories.task_repository import TaskRepository
+from app.models import ArchivedTask, Task, TaskCategory, TaskCategoryRecord, TaskRecord, User
+from app.models.task import utcnow
+from app.repositories.archived_task_repository import ArchivedTaskRepository
+from app.utils import (TASK_CATEGORY_FIELDS, TASK_FIELDS, ShardedSession, cache_registry, cached, cached_statement,
+                       nested_fields, own_fields)
+
+BOARD_MODELS = (Task, TaskCategory, ArchivedTask)
+
+
+@event.listens_for(ShardedSession, "after_flush")
+def collect_changed_boards(session, flush_context):
+    # The cached boards of the users whose tasks or categories were written are invalidated once the transaction is
+    # committed, so a board is never cached with changes that could still be rolled back.
+    changed = session.info.setdefault("changed_boards", set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, BOARD_MODELS) and instance.user_id is not None:
+            changed.add(instance.user_id)
+
+
+@event.listens_for(ShardedSession, "after_commit")
+def invalidate_changed_boards(session):
+    changed = session.info.pop("changed_boards", None)
+    if changed:
+        cache_registry.invalidate(*(f"board:{user_id}" for user_id in changed))
+
+
+@event.listens_for(ShardedSession, "after_rollback")
+def forget_changed_boards(session):
+    session.info.pop("changed_boards", None)
 
 
 class TaskCategoryRepository(RepositoryInterface):
-    def get_all(self, exclude_tasks: bool, current_user: User) -> list[TaskCategory]:
+    def get_all(self, exclude_tasks: bool, current_user: User,
+                fields: tuple[str, ...] | None = None) -> list[TaskCategory]:
         """
             Retrieves all task categories associated with the current user.
 
             Parameters:
             - exclude_tasks (bool): If true, tasks within the categories will be excluded from the result.
             - current_user (User): The current authenticated user.
+            - fields (tuple[str, ...] | None): The fields to load, "tasks.<field>" selecting the only columns of the
+              tasks to load (optional, all of them by default).
 
             Returns:
             A list of TaskCategory objects representing all task categories associated with the current user.
         """
-        if not exclude_tasks:
-            return (TaskCategory.query.filter_by(user_id=current_user.id).options(joinedload(TaskCategory.tasks))
-                    .order_by(asc(TaskCategory.order)).all())
-        else:
-            return TaskCategory.query.filter_by(user_id=current_user.id).order_by(asc(TaskCategory.order)).all()
+        load_tasks = not exclude_tasks and nested_fields(fields, "tasks", TASK_FIELDS) is not None
+        statement = self._all_statement(load_tasks, fields if load_tasks else None)
+        return list(db.session.execute(statement, {"user_id": current_user.id}).scalars().all())
+
+    @staticmethod
+    @cached_statement
+    def _all_statement(load_tasks: bool, fields: tuple[str, ...] | None):
+        statement = (select(TaskCategory).where(TaskCategory.user_id == bindparam("user_id"))
+                     .order_by(asc(TaskCategory.order)))
+        if load_tasks:
+            statement = statement.options(TaskCategoryRepository._load_tasks(fields))
+        return statement
+
+    def get_all_records(self, exclude_tasks: bool, current_user: User,
+                        fields: tuple[str, ...] | None = None) -> list[TaskCategoryRecord]:
+        """
+            Retrieves all task categories associated with the current user as read-only records, with Core select()
+            statements that bypass the ORM identity map and change tracking. The tasks of all the categories are loaded
+            by a single second statement, ordered by their order.
+
+            Parameters:
+            - exclude_tasks (bool): If true, tasks within the categories will be excluded from the result.
+            - current_user (User): The current authenticated user.
+            - fields (tuple[str, ...] | None): The fields to select, "tasks.<field>" selecting the only columns of the
+              tasks to select (optional, all of them by default). Tasks are not loaded when none is selected.
+
+            Returns:
+            A list of TaskCategoryRecord objects representing all task categories associated with the current user.
+        """
+        rows = db.session.execute(self._records_statement(), {"user_id": current_user.id})
+        task_categories = [TaskCategoryRecord(*row) for row in rows]
+        task_fields = nested_fields(fields, "tasks", TASK_FIELDS)
+        if exclude_tasks or task_fields is None or not task_categories:
+            return task_categories
+
+        by_id = {task_category.id: task_category for task_category in task_categories}
+        rows = db.session.execute(self._task_records_statement(None if fields is None else task_fields),
+                                  {"user_id": current_user.id, "category_ids": list(by_id)})
+        for row in rows:
+            by_id[row.category_id].tasks.append(TaskRecord(*row) if fields is None else TaskRecord(**row._mapping))
+        return task_categories
+
+    @staticmethod
+    @cached_statement
+    def _records_statement():
+        return (select(*TaskCategoryRecord.COLUMNS).where(TaskCategory.user_id == bindparam("user_id"))
+                .order_by(asc(TaskCategory.order)))
+
+    @staticmethod
+    @cached_statement
+    def _task_records_statement(task_fields: tuple[str, ...] | None):
+        columns = TaskRecord.COLUMNS if task_fields is None else (*TaskRecord.columns(task_fields), Task.category_id)
+        return (select(*columns)
+                .where(Task.user_id == bindparam("user_id"),
+                       Task.category_id.in_(bindparam("category_ids", expanding=True)))
+                .order_by(asc(Task.order), asc(Task.id)))
+
+    @cached("board", "CACHE_BOARD_TTL_SECONDS", key=lambda self, current_user, fields=None: (current_user.id, fields),
+            tags=lambda self, current_user, fields=None: [f"user:{current_user.id}", f"board:{current_user.id}"])
+    def get_board(self, current_user: User, fields: tuple[str, ...] | None = None) -> list[dict]:
+        """
+            Retrieves the board of the current user, i.e. all of their task categories with their tasks, already
+            serialized like TaskCategory.to_dict, with a single statement. The board is cached for
+            CACHE_BOARD_TTL_SECONDS, until a change to the tasks or categories of the user is committed.
+
+            The database builds the JSON array of the tasks of each category, ordered by their order: with
+            json_group_array on SQLite and json_agg on PostgreSQL. Other dialects fall back to loading the tasks of all
+            the categories with a second statement (selectinload).
+
+            Only the selected fields are read and serialized by the database, so e.g. the descriptions of the tasks are
+            not read when only their titles are requested. The statement is built once per process for each dialect
+            and fieldset.
+
+            Parameters:
+            - current_user (User): The current authenticated user.
+            - fields (tuple[str, ...] | None): The fields to include, "tasks.<field>" selecting fields of the tasks
+              (optional, all of them by default).
+
+            Returns:
+            A list of dictionaries representing the task categories of the current user, ordered by their order.
+        """
+        task_fields = nested_fields(fields, "tasks", TASK_FIELDS)
+        dialect = db.session.get_bind(mapper=TaskCategory).dialect.name
+        if dialect not in ("sqlite", "postgresql"):
+            return [task_category.to_dict(fields=fields)
+                    for task_category in self.get_all(task_fields is None, current_user, fields)]
+
+        names, statement = self._board_statement(dialect, fields)
+        rows = db.session.execute(statement, {"user_id": current_user.id})
+        board = [dict(zip(names, row)) for row in rows]
+        if "id" in names:
+            for task_category in board:
+                task_category["id"] = str(task_category["id"])
+        return board
+
+    @staticmethod
+    @cached_statement
+    def _board_statement(dialect: str, fields: tuple[str, ...] | None) -> tuple[tuple[str, ...], object]:
+        columns = {name: getattr(TaskCategory, name) for name in own_fields(fields, TASK_CATEGORY_FIELDS)
+                   if name != "tasks"}
+        task_fields = nested_fields(fields, "tasks", TASK_FIELDS)
+        if task_fields is not None:
+            tasks = (TaskCategoryRepository._sqlite_board_tasks(task_fields) if dialect == "sqlite"
+                     else TaskCategoryRepository._postgresql_board_tasks(task_fields))
+            columns["tasks"] = type_coerce(tasks, JSON)
+
+        statement = (select(*columns.values()).where(TaskCategory.user_id == bindparam("user_id"))
+                     .order_by(asc(TaskCategory.order)))
+        return tuple(columns), statement
+
+    @staticmethod
+    def _task_json_fields(task, updated_at, fields: tuple[str, ...]) -> list:
+        converted = {"category_id": lambda: cast(task.category_id, String), "updated_at": lambda: updated_at}
+        return [value for name in fields
+                for value in (literal(name), converted[name]() if name in converted else task[name])]
+
+    @staticmethod
+    def _sqlite_board_tasks(fields: tuple[str, ...]):
+        # json_group_array has no ORDER BY before SQLite 3.44, but aggregates the rows of an ordered subquery in order.
+        ordered = (select(*(Task.__table__.c[name] for name in fields))
+                   .where(Task.user_id == bindparam("user_id"), Task.category_id == TaskCategory.id)
+                   .order_by(asc(Task.order), asc(Task.id)).correlate(TaskCategory).subquery("ordered_task"))
+        task = ordered.c
+        updated_at = func.replace(task.updated_at, " ", "T") if "updated_at" in fields else None
+        json_fields = TaskCategoryRepository._task_json_fields(task, updated_at, fields)
+        return select(func.json_group_array(func.json_object(*json_fields))).select_from(ordered).scalar_subquery()
+
+    @staticmethod
+    def _postgresql_board_tasks(fields: tuple[str, ...]):
+        task = Task.__table__.c
+        updated_at = func.to_char(task.updated_at, 'YYYY-MM-DD"T"HH24:MI:SS.US')
+        json_fields = TaskCategoryRepository._task_json_fields(task, updated_at, fields)
+        tasks = func.json_agg(aggregate_order_by(func.json_build_object(*json_fields), asc(task.order), asc(task.id)))
+        return (select(func.coalesce(tasks, literal_column("'[]'::json")))
+                .where(task.user_id == bindparam("user_id"), task.category_id == TaskCategory.id)
+                .correlate(TaskCategory).scalar_subquery())
 
-    def get_by_id(self, id: str, exclude_tasks: bool, current_user: User) -> TaskCategory:
+    def get_by_id(self, id: int | str, exclude_tasks: bool, current_user: User,
+                  fields: tuple[str, ...] | None = None) -> TaskCategory:
         """
            Retrieves a specific task category by its ID.
 
            Parameters:
-           - id (str): The ID of the task category to retrieve.
+           - id (int | str): The ID of the task category to retrieve, either the integer key or a legacy key.
            - exclude_tasks (bool): If true, tasks within the category will be excluded from the result.
            - current_user (User): The current authenticated user.
+           - fields (tuple[str, ...] | None): The fields to load, "tasks.<field>" selecting the only columns of the
+             tasks to load (optional, all of them by default).
 
            Returns:
            The TaskCategory object corresponding to the specified ID, or None if not found.
         """
-        if not exclude_tasks:
-            return TaskCategory.query.filter_by(id=id, user_id=current_user.id).options(
-                joinedload(TaskCategory.tasks)).first()
-        else:
-            return TaskCategory.query.filter_by(id=id, user_id=current_user.id).first()
+        key = TaskCategory.parse_key(id)
+        if key is None:
+            return None
+        column, value = key
+        load_tasks = not exclude_tasks and nested_fields(fields, "tasks", TASK_FIELDS) is not None
+        statement = self._by_key_statement(column, load_tasks, fields if load_tasks else None)
+        return db.session.execute(statement, {"key": value, "user_id": current_user.id}).scalar()
+
+    @staticmethod
+    @cached_statement
+    def _by_key_statement(column: str, load_tasks: bool, fields: tuple[str, ...] | None):
+        statement = (select(TaskCategory)
+                     .where(getattr(TaskCategory, column) == bindparam("key"),
+                            TaskCategory.user_id == bindparam("user_id")).limit(1))
+        if load_tasks:
+            statement = statement.options(TaskCategoryRepository._load_tasks(fields))
+        return statement
+
+    @staticmethod
+    def _load_tasks(fields: tuple[str, ...] | None):
+        if fields is None:
+            return selectinload(TaskCategory.tasks)
+        return selectinload(TaskCategory.tasks).load_only(
+            *TaskRecord.columns(nested_fields(fields, "tasks", TASK_FIELDS)))
+
+    @cached("task-category-id", "CACHE_TASK_CATEGORY_TTL_SECONDS",
+            key=lambda self, id, current_user: (str(id), current_user.id),
+            tags=lambda self, id, current_user: [f"user:{current_user.id}", f"task-category:{current_user.id}"])
+    def get_id_by_key(self, id: int | str, current_user: User) -> int | None:
+        """
+           Retrieves the integer ID of a task category of the current user, e.g. to check that a task may be added to
+           it. The result is cached for CACHE_TASK_CATEGORY_TTL_SECONDS, until a category of the user is deleted.
+
+           Parameters:
+           - id (int | str): The ID of the task category, either the integer key or a legacy key.
+           - current_user (User): The current authenticated user.
+
+           Returns:
+           The integer ID of the task category, or None if the current user has no such category.
+        """
+        key = TaskCategory.parse_key(id)
+        if key is None:
+            return None
+        column, value = key
+        return db.session.execute(self._id_by_key_statement(column),
+                                  {"key": value, "user_id": current_user.id}).scalar()
+
+    @staticmethod
+    @cached_statement
+    def _id_by_key_statement(column: str):
+        return select(TaskCategory.id).where(getattr(TaskCategory, column) == bindparam("key"),
+                                             TaskCategory.user_id == bindparam("user_id"))
 
     def get_by_name(self, title: str):
         """
@@ -60,7 +273,72 @@ class TaskCategoryRepository(RepositoryInterface):
            Returns:
            The TaskCategory object corresponding to the specified order, or None if not found.
         """
-        return TaskCategory.query.filter_by(order=order, user_id=current_user.id).first()
+        return db.session.execute(self._by_order_statement(), {"order": order, "user_id": current_user.id}).scalar()
+
+    @staticmethod
+    @cached_statement
+    def _by_order_statement():
+        return (select(TaskCategory).where(TaskCategory.order == bindparam("order"),
+                                           TaskCategory.user_id == bindparam("user_id")).limit(1))
+
+    def count_tasks(self, id: int) -> int:
+        """
+            Counts the active tasks of a specific task category.
+
+            Parameters:
+            - id (int): The ID of the task category.
+
+            Returns:
+            The number of tasks of the task category.
+        """
+        return db.session.execute(self._count_tasks_statement(), {"category_id": id}).scalar_one()
+
+    @staticmethod
+    @cached_statement
+    def _count_tasks_statement():
+        return select(func.count()).select_from(Task).where(Task.category_id == bindparam("category_id"))
+
+    def get_summary(self, current_user: User) -> list[dict]:
+        """
+            Retrieves the summary of the board of the current user: the title and the task counters of each task
+            category, read from the denormalized counters with a single indexed query, without reading the tasks.
+
+            Parameters:
+            - current_user (User): The current authenticated user.
+
+            Returns:
+            A list of dictionaries representing the task categories of the current user, ordered by their order.
+        """
+        rows = db.session.execute(self._summary_statement(), {"user_id": current_user.id})
+        return [{"id": str(id), "title": title, "order": order, "task_count": task_count,
+                 "tasks_updated_at": tasks_updated_at.isoformat() if tasks_updated_at is not None else None}
+                for id, title, order, task_count, tasks_updated_at in rows]
+
+    @staticmethod
+    @cached_statement
+    def _summary_statement():
+        return (select(TaskCategory.id, TaskCategory.title, TaskCategory.order, TaskCategory.task_count,
+                       TaskCategory.tasks_updated_at)
+                .where(TaskCategory.user_id == bindparam("user_id")).order_by(asc(TaskCategory.order)))
+
+    def update_task_count(self, id: int, delta: int):
+        """
+            Adds delta to the task counter of a task category and stamps its tasks update time, within the transaction
+            of the caller (no commit), so the counter is committed along with the change of the tasks. The counter is
+            updated in SQL, so concurrent changes do not overwrite each other.
+
+            Parameters:
+            - id (int): The ID of the task category.
+            - delta (int): The number of tasks added (positive), removed (negative), or 0 when a task only changed.
+        """
+        db.session.execute(self._update_task_count_statement(), {"category_id": id, "delta": delta, "now": utcnow()},
+                           execution_options={"synchronize_session": False})
+
+    @staticmethod
+    @cached_statement
+    def _update_task_count_statement():
+        return (update(TaskCategory).where(TaskCategory.id == bindparam("category_id"))
+                .values(task_count=TaskCategory.task_count + bindparam("delta"), tasks_updated_at=bindparam("now")))
 
     def create(self, category: TaskCategory) -> TaskCategory:
         """
@@ -87,7 +365,9 @@ class TaskCategoryRepository(RepositoryInterface):
 
     def delete(self, id: str, current_user: User):
         """
-            Deletes a specific task category by its ID.
+            Deletes a specific task category by its ID, along with its active and archived tasks. The tasks are deleted
+            with bulk statements rather than loaded and deleted one by one, so huge categories take a single
+            transaction.
 
             Parameters:
             - id (str): The ID of the task category to delete.
@@ -96,13 +376,13 @@ class TaskCategoryRepository(RepositoryInterface):
             Returns:
             True if deletion was successful, False otherwise.
         """
-        category = self.get_by_id(id, False, current_user)
+        category = self.get_by_id(id, True, current_user)
         if category:
-            task_repository = TaskRepository()
-            for task in category.tasks:
-                task_repository.delete(task.id)
+            Task.query.filter_by(category_id=category.id).delete()
+            ArchivedTaskRepository().delete_all_by_category(category.id)
 
             db.session.delete(category)
             db.session.commit()
+            cache_registry.invalidate(f"task-category:{current_user.id}")
             return True
         return False
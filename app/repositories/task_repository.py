@@ -1,42 +1,115 @@
 from typing import Optional
 
-from sqlalchemy import asc
+from sqlalchemy import asc, bindparam, column, desc, func, literal_column, or_, select, table, text
+from sqlalchemy.orm import load_only
 
 from app import db
 from app.interfaces.repository_interface import RepositoryInterface
-from app.models import Task, User
+from app.models import Task, TaskCategory, TaskRecord, User
+from app.utils import (tokenize_search_query, build_fts5_match_query, build_tsquery, build_filter_criteria,
+                       build_sort_clauses, cached_statement)
 
 
 class TaskRepository(RepositoryInterface):
-    def get_all(self, category_id: Optional[int], current_user: User) -> list:
+    FILTERABLE_COLUMNS = {
+        "id": Task.id,
+        "title": Task.title,
+        "description": Task.description,
+        "order": Task.order,
+        "category_id": (Task.category_id, TaskCategory.key_value),
+    }
+    SORTABLE_COLUMNS = {
+        "id": Task.id,
+        "title": Task.title,
+        "order": Task.order,
+        "category_id": Task.category_id,
+    }
+
+    def get_all(self, category_id: Optional[int], current_user: User, query_args: Optional[dict] = None) -> list:
         """
             Retrieves all tasks associated with the current user.
 
             Parameters:
             - category_id (Optional[int]): The ID of the category to filter tasks by (optional).
             - current_user (User): The current authenticated user.
+            - query_args (Optional[dict]): Filter and sort query string arguments (optional), restricted to the
+              FILTERABLE_COLUMNS and SORTABLE_COLUMNS whitelists. See build_filter_criteria and build_sort_clauses.
 
             Returns:
             A list of Task objects representing all tasks associated with the current user.
+
+            Raises:
+            ValueError: If the query arguments reference an unknown field or operator, or carry an invalid value.
         """
-        if category_id:
-            return (Task.query.filter_by(user_id=current_user.id, category_id=category_id).order_by(asc(Task.order))
-                    .all())
-        else:
-            return Task.query.filter_by(user_id=current_user.id).order_by(asc(Task.order)).all()
+        query_args = query_args or {}
+        statement = self._list_statement(False, None, bool(category_id), query_args.get("sort"))
+        criteria = build_filter_criteria(query_args, self.FILTERABLE_COLUMNS)
+        if criteria:
+            statement = statement.where(*criteria)
+        return list(db.session.execute(statement, {"user_id": current_user.id, "category_id": category_id})
+                    .scalars().all())
+
+    def get_all_records(self, category_id: Optional[int], current_user: User, query_args: Optional[dict] = None,
+                        fields: Optional[tuple[str, ...]] = None) -> list[TaskRecord]:
+        """
+            Retrieves all tasks associated with the current user as read-only records, with a Core select() that
+            bypasses the ORM identity map and change tracking. Filters and sorts like get_all.
 
-    def get_by_id(self, id, current_user: User) -> Task | None:
+            Parameters:
+            - category_id (Optional[int]): The ID of the category to filter tasks by (optional).
+            - current_user (User): The current authenticated user.
+            - query_args (Optional[dict]): Filter and sort query string arguments (optional).
+            - fields (Optional[tuple[str, ...]]): The only columns to select (optional, all of them by default).
+
+            Returns:
+            A list of TaskRecord objects representing all tasks associated with the current user.
+
+            Raises:
+            ValueError: If the query arguments reference an unknown field or operator, or carry an invalid value.
+        """
+        query_args = query_args or {}
+        statement = self._list_statement(True, fields, bool(category_id), query_args.get("sort"))
+        criteria = build_filter_criteria(query_args, self.FILTERABLE_COLUMNS)
+        if criteria:
+            statement = statement.where(*criteria)
+        rows = db.session.execute(statement, {"user_id": current_user.id, "category_id": category_id})
+        if fields is None:
+            return [TaskRecord(*row) for row in rows]
+        return [TaskRecord(**row._mapping) for row in rows]
+
+    @staticmethod
+    @cached_statement
+    def _list_statement(records: bool, fields: Optional[tuple[str, ...]], by_category: bool, sort: Optional[str]):
+        # Built once per process for each shape of the list; the user and category are bound at execution, and the
+        # filters of the query string, whose values vary, are added to the cached statement.
+        statement = select(*TaskRecord.columns(fields)) if records else select(Task)
+        statement = statement.where(Task.user_id == bindparam("user_id"))
+        if by_category:
+            statement = statement.where(Task.category_id == bindparam("category_id"))
+        order_by = build_sort_clauses(sort, TaskRepository.SORTABLE_COLUMNS, [asc(Task.order)])
+        return statement.order_by(*order_by, asc(Task.id))
+
+    def get_by_id(self, id, current_user: User, fields: Optional[tuple[str, ...]] = None) -> Task | None:
         """
             Retrieves a specific task by its ID.
 
             Parameters:
             - id (str): The ID of the task to retrieve.
             - current_user (User): The current authenticated user.
+            - fields (Optional[tuple[str, ...]]): The only columns to load, the others being deferred (optional).
 
             Returns:
             The Task object corresponding to the specified ID, or None if not found.
         """
-        return Task.query.filter_by(id=id, user_id=current_user.id).first()
+        return db.session.execute(self._by_id_statement(fields), {"id": id, "user_id": current_user.id}).scalar()
+
+    @staticmethod
+    @cached_statement
+    def _by_id_statement(fields: Optional[tuple[str, ...]]):
+        statement = select(Task).where(Task.id == bindparam("id"), Task.user_id == bindparam("user_id")).limit(1)
+        if fields is not None:
+            statement = statement.options(load_only(*TaskRecord.columns(fields)))
+        return statement
 
     def get_by_name(self, title: str):
         """
@@ -50,6 +123,55 @@ class TaskRepository(RepositoryInterface):
         """
         return Task.query.filter_by(title=title).first()
 
+    def search(self, query: str, page: int, per_page: int, current_user: User,
+               fields: Optional[tuple[str, ...]] = None) -> tuple[list[Task], int]:
+        """
+            Searches the tasks of the current user by title and description using the full-text index.
+
+            On SQLite the FTS5 "task_fts" table is matched and ranked with bm25; on PostgreSQL the "search_vector"
+            column is matched and ranked with ts_rank_cd. Other dialects fall back to a case-insensitive LIKE.
+
+            Parameters:
+            - query (str): The free-text search query. Every word must match as a prefix.
+            - page (int): The 1-based page of results to retrieve.
+            - per_page (int): The maximum number of results per page.
+            - current_user (User): The current authenticated user.
+            - fields (Optional[tuple[str, ...]]): The only columns to load, the others being deferred (optional).
+
+            Returns:
+            A tuple with the page of Task objects, best match first, and the total number of matching tasks.
+        """
+        tokens = tokenize_search_query(query)
+        if not tokens:
+            return [], 0
+
+        dialect = db.session.get_bind().dialect.name
+        statement = select(Task).where(Task.user_id == current_user.id)
+        params = {}
+        if dialect == "sqlite":
+            task_fts = table("task_fts", column("rowid"))
+            statement = (statement.join(task_fts, task_fts.c.rowid == Task.id)
+                         .where(text("task_fts MATCH :match_query")))
+            rank = func.bm25(literal_column("task_fts"))
+            params["match_query"] = build_fts5_match_query(tokens)
+        elif dialect == "postgresql":
+            search_vector = literal_column("task.search_vector")
+            ts_query = func.to_tsquery("simple", build_tsquery(tokens))
+            statement = statement.where(search_vector.op("@@")(ts_query))
+            rank = desc(func.ts_rank_cd(search_vector, ts_query))
+        else:
+            for token in tokens:
+                pattern = f"%{token}%"
+                statement = statement.where(or_(Task.title.ilike(pattern), Task.description.ilike(pattern)))
+            rank = asc(Task.id)
+
+        total = db.session.execute(select(func.count()).select_from(statement.subquery()), params).scalar_one()
+        page_statement = statement.order_by(rank, asc(Task.id)).limit(per_page).offset((page - 1) * per_page)
+        if fields is not None:
+            page_statement = page_statement.options(load_only(*TaskRecord.columns(fields)))
+        tasks = db.session.execute(page_statement, params).scalars().all()
+        return list(tasks), total
+
     def get_by_order(self, order: int, current_user: User):
         """
             Retrieves a task by its order for the current user.
@@ -61,7 +183,12 @@ class TaskRepository(RepositoryInterface):
             Returns:
             The Task object corresponding to the specified order, or None if not found.
         """
-        return Task.query.filter_by(order=order, user_id=current_user.id).first()
+        return db.session.execute(self._by_order_statement(), {"order": order, "user_id": current_user.id}).scalar()
+
+    @staticmethod
+    @cached_statement
+    def _by_order_statement():
+        return select(Task).where(Task.order == bindparam("order"), Task.user_id == bindparam("user_id")).limit(1)
 
     def create(self, task: Task) -> Task:
         """
@@ -1,6 +1,7 @@
 from app import db
 from app.interfaces.repository_interface import RepositoryInterface
 from app.models import User
+from app.utils import cache_registry, cached
 
 
 class UserRepository(RepositoryInterface):
@@ -13,9 +14,12 @@ class UserRepository(RepositoryInterface):
          """
         return User.query.all()
 
+    @cached("user", "CACHE_USER_TTL_SECONDS", key=lambda self, id: int(id), tags=lambda self, id: [f"user:{int(id)}"],
+            restore=lambda user: db.session.merge(user, load=False))
     def get_by_id(self, id: int):
         """
-            Retrieves a specific user by their ID.
+            Retrieves a specific user by their ID, cached for CACHE_USER_TTL_SECONDS since every authenticated request
+            loads its user.
 
             Parameters:
             - id (int): The ID of the user to retrieve.
@@ -61,6 +65,7 @@ class UserRepository(RepositoryInterface):
             - user: The User object to update.
         """
         db.session.commit()
+        cache_registry.invalidate(f"user:{user.id}")
 
     def delete(self, id):
         """
@@ -73,3 +78,4 @@ class UserRepository(RepositoryInterface):
         if user:
             db.session.delete(user)
             db.session.commit()
+            cache_registry.invalidate(f"user:{id}")
@@ -1,8 +1,7 @@
 from flask import Blueprint, request
-from flask_pydantic import validate
 from flask_restx import Resource, Namespace, fields
 
-from app.decorators import token_required
+from app.decorators import token_required, validate_request
 from app.dtos import RegisterNewAuthenticationModel, AuthenticationModel
 from app.services import AuthService
 
@@ -24,14 +23,6 @@ BaseResponseModel = api.model("BaseResponseModel",
                                   "message": fields.String,
                               })
 
-
-# Register Model
-RegisterModel = api.model("RegisterModel",
-                          {
-                              "username": fields.String,
-                              "password": fields.String
-                          })
-
 # Register Success Model
 RegisterProfileModel = api.model("RegisterProfileModel", {
     "username": fields.String
@@ -72,8 +63,7 @@ class Register(Resource):
 
     @api.response(201, "User has been created", RegisterSuccessModel)
     @api.response(409, "Username already exists", BaseResponseModel)
-    @api.expect(RegisterModel)
-    @validate(body=RegisterNewAuthenticationModel)
+    @validate_request(api, body=RegisterNewAuthenticationModel)
     def post(self):
         """
             Method: post(self)
@@ -91,10 +81,8 @@ class Register(Resource):
             - @api.response(409, "Username already exists", BaseResponseModel): Indicates that if the registration fails
               due to the username already existing, the response will have HTTP status code 409 and will be accompanied
               by a BaseResponseModel instance.
-            - @api.expect(RegisterModel): Specifies the expected JSON schema for the request body, using the
-              RegisterModel.
-            - @validate(body=RegisterNewAuthenticationModel): Validates the request body against the
-              RegisterNewAuthenticationModel schema.
+            - @validate_request(api, body=RegisterNewAuthenticationModel): Validates the request body against the
+              RegisterNewAuthenticationModel schema, which also documents it.
 
             Returns:
             The result of the register method called from the auth_service.
@@ -105,13 +93,6 @@ class Register(Resource):
         return auth_service.register(username, password)
 
 
-# Login Model
-LoginModel = api.model("LoginModel",
-                       {
-                           "username": fields.String,
-                           "password": fields.String
-                       })
-
 # Login Success Model
 LoginSuccessModel = api.model("LoginSuccessModel",
                               {
@@ -148,8 +129,7 @@ class Login(Resource):
 
     @api.response(200, "User has been logged", LoginSuccessModel)
     @api.response(404, "Invalid username or password", BaseResponseModel)
-    @api.expect(LoginModel)
-    @validate(body=AuthenticationModel)
+    @validate_request(api, body=AuthenticationModel)
     def post(self):
         """
             Method: post(self)
@@ -167,8 +147,8 @@ class Login(Resource):
             - @api.response(404, "Invalid username or password", BaseResponseModel): Indicates that if the
               authentication fails due to invalid credentials, the response will have HTTP status code 404 and will be
               accompanied by a BaseResponseModel instance.
-            - @api.expect(LoginModel): Specifies the expected JSON schema for the request body, using the LoginModel.
-            - @validate(body=AuthenticationModel): Validates the request body against the AuthenticationModel schema.
+            - @validate_request(api, body=AuthenticationModel): Validates the request body against the
+              AuthenticationModel schema, which also documents it.
 
             Returns:
             The result of the login method called from the auth_service.
@@ -236,3 +216,46 @@ class Profile(Resource):
 
         return {"message": "User profile has been searched",
                 "result": {"username": current_user.username}}, 200
+
+
+@api.route("/logout")
+class Logout(Resource):
+    """
+        Decorator: @api.route("/logout")
+
+        Description:
+        Specifies the route "/logout" for the Logout resource within the API.
+
+        Class: Logout(Resource)
+
+        Description:
+        This class represents the Logout resource in the API. It handles HTTP POST requests revoking the authentication
+        token of the request, which is rejected from then on instead of at its expiry.
+
+        Responses:
+        - 200: User has been logged out. Returns a BaseResponseModel instance.
+        - 400: The token was issued before tokens could be revoked. Returns a BaseResponseModel instance.
+        - 401: Invalid or missing Authentication token. Returns a BaseResponseModel instance.
+    """
+
+    @api.response(200, "User has been logged out", BaseResponseModel)
+    @api.response(400, "This token was issued before tokens could be revoked and expires on its own", BaseResponseModel)
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @token_required
+    def post(self, current_user):
+        """
+            Method: post(self, current_user)
+
+            Description:
+            Handles HTTP POST requests to the "/logout" endpoint. It revokes the bearer token of the request through the
+            logout method of the auth_service.
+
+            Parameters:
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            The result of the logout method called from the auth_service.
+        """
+
+        return auth_service.logout(request.headers["Authorization"].split(" ")[-1])
@@ -0,0 +1,149 @@
+from flask import Blueprint
+from flask_restx import Resource, Namespace, fields
+
+from app.decorators import token_required
+from app.services import JobService
+
+authorizations = {
+    "Bearer Auth": {
+        "type": "apiKey",
+        "in": "header",
+        "name": "Authorization"
+    }
+}
+api = Namespace("Jobs", description="Background jobs of the users", authorizations=authorizations)
+
+bp = Blueprint("job", __name__)
+job_service = JobService()
+
+# Base Response Model
+BaseResponseModel = api.model("BaseResponseModel",
+                              {
+                                  "message": fields.String,
+                              })
+
+# Job Model
+JobModel = api.model("JobModel",
+                     {
+                         "id": fields.Integer,
+                         "name": fields.String,
+                         "payload": fields.Raw,
+                         "status": fields.String(enum=["queued", "running", "succeeded", "failed"]),
+                         "attempts": fields.Integer,
+                         "max_attempts": fields.Integer,
+                         "result": fields.Raw,
+                         "error": fields.String,
+                         "user_id": fields.Integer,
+                         "started_at": fields.DateTime,
+                         "created_at": fields.DateTime,
+                         "updated_at": fields.DateTime
+                     })
+
+
+@api.route("")
+class Jobs(Resource):
+    """
+        Decorator: @api.route("")
+
+        Description:
+        Specifies the route "" (root) for the Jobs resource within the API.
+
+        Class: Jobs(Resource)
+
+        Description:
+        This class represents the Jobs resource in the API. It handles HTTP GET requests listing the background jobs
+        queued by the authenticated user.
+
+        Method: get(self, current_user)
+
+        Description:
+        Handles HTTP GET requests to the root endpoint. It retrieves the 50 most recent jobs of the authenticated user.
+
+        Parameters:
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the job search along with the jobs' information.
+    """
+
+    @api.response(200, "Jobs has been searched", [JobModel])
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @token_required
+    def get(self, current_user):
+        """
+            Method: get(self, current_user)
+
+            Description:
+            Handles HTTP GET requests to the root endpoint. It retrieves the most recent jobs of the authenticated user,
+            most recent first.
+
+            Parameters:
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the job search along with the jobs'
+            information.
+        """
+
+        jobs = job_service.get_all(current_user)
+        return {"message": "Jobs has been searched", "result": [job.to_dict() for job in jobs]}, 200
+
+
+@api.route("/<int:id>")
+class Job(Resource):
+    """
+        Decorator: @api.route("/<int:id>")
+
+        Description:
+        Specifies the route "/<int:id>" for the Job resource within the API. The "<int:id>" part represents the job ID
+        in the URL.
+
+        Class: Job(Resource)
+
+        Description:
+        This class represents the Job resource in the API. It handles HTTP GET requests polling the status of a
+        background job, as returned in the "Location" header of the "202 Accepted" responses.
+
+        Method: get(self, id, current_user)
+
+        Description:
+        Handles HTTP GET requests to the "/<int:id>" endpoint. It retrieves the job with the provided ID for the
+        authenticated user.
+
+        Parameters:
+        - id (int): The ID of the job to retrieve.
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the job search along with the job's information,
+        or a message indicating that the job was not found.
+    """
+
+    @api.response(200, "Job has been searched", JobModel)
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.response(404, "Job not found or you don't have permission to view it", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @token_required
+    def get(self, id, current_user):
+        """
+            Method: get(self, id, current_user)
+
+            Description:
+            Handles HTTP GET requests to the "/<int:id>" endpoint. It retrieves the status, and once finished the result
+            or error, of the job with the provided ID.
+
+            Parameters:
+            - id (int): The ID of the job to retrieve.
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the job search along with the job's
+            information, or a message indicating that the job was not found.
+        """
+
+        job = job_service.get_by_id(id, current_user)
+        if job:
+            return {"message": "Job has been searched", "result": job.to_dict()}, 200
+        else:
+            return {"message": "Job not found or you don't have permission to view it"}, 404
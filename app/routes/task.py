@@ -1,9 +1,9 @@
 from flask import Blueprint, request
-from flask_pydantic import validate
 from flask_restx import Resource, Namespace, fields
 
-from app.decorators import token_required
-from app.dtos.task_dto import RegisterNewTaskModel, UpdateTaskModel
+from app.decorators import token_required, validate_request
+from app.dtos.task_dto import (RegisterNewTaskModel, UpdateTaskModel, RestoreTaskModel, TaskFieldsQueryModel,
+                               SearchTaskQueryModel, ArchivedTaskFieldsQueryModel, ArchivedTaskQueryModel)
 from app.services import TaskService
 
 authorizations = {
@@ -32,18 +32,16 @@ TaskModel = api.model("TaskModel",
                           "order": fields.Integer,
                           "description": fields.String(required=False),
                           "category_id": fields.String,
-                          "user_id": fields.Integer
+                          "user_id": fields.Integer,
+                          "updated_at": fields.DateTime
                       })
 
-
-# Register Model
-RegisterModel = api.model("TaskRegisterModel",
-                          {
-                              "title": fields.String,
-                              "description": fields.String,
-                              "order": fields.Integer,
-                              "category_id": fields.String,
-                          })
+# Task List Query Parameters
+task_list_params = {
+    "<field>": "Equality filter on id, title, description, order or category_id",
+    "<field>__<operator>": "Filter with operator eq, ne, lt, lte, gt, gte, in (comma separated), prefix or isnull",
+    "sort": "Comma separated sort fields (id, title, order, category_id), prefixed by '-' for descending order",
+}
 
 
 @api.route("")
@@ -98,10 +96,10 @@ class Tasks(Resource):
         - @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel): Indicates that if the
           authentication fails or no token is provided, the response will have HTTP status code 401 and will be
           accompanied by a BaseResponseModel instance.
-        - @api.expect(RegisterModel): Specifies the expected JSON schema for the request body, using the RegisterModel.
         - @api.doc(security="Bearer Auth"): Specifies the security requirements for accessing this endpoint, indicating
           that a Bearer token is required.
-        - @validate(body=RegisterNewTaskModel): Validates the request body against the RegisterNewTaskModel schema.
+        - @validate_request(api, body=RegisterNewTaskModel, query=TaskFieldsQueryModel): Validates the request body
+          against the RegisterNewTaskModel schema, and the "fields" query parameter, which also documents them.
         - @token_required: Enforces authentication for accessing the endpoint.
 
         Returns:
@@ -110,8 +108,10 @@ class Tasks(Resource):
     """
 
     @api.response(200, "Tasks has been searched", [TaskModel])
+    @api.response(400, "Invalid filter or sort arguments", BaseResponseModel)
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
-    @api.doc(security="Bearer Auth")
+    @api.doc(security="Bearer Auth", params=task_list_params)
+    @validate_request(api, query=TaskFieldsQueryModel)
     @token_required
     def get(self, current_user):
         """
@@ -144,6 +144,14 @@ class Tasks(Resource):
             Handles HTTP GET requests to the root endpoint. It retrieves all tasks for the authenticated user. Returns
             appropriate responses based on the authentication outcome.
 
+            The list can be filtered and sorted in SQL through the query string: "<field>=<value>" or
+            "<field>__<operator>=<value>" predicates (operators eq, ne, lt, lte, gt, gte, in, prefix and isnull) on id,
+            title, description, order and category_id, and "sort=-order,title" for multi-key sorting. For example
+            "?title__prefix=Buy&order__gte=2&description__isnull=false&sort=category_id,-order".
+
+            The "fields" query parameter (sparse fieldset), e.g. "?fields=id,title,order", restricts the result, and the
+            columns read from the database, to the given fields.
+
             Parameters:
             - current_user: The current authenticated user obtained from the token.
 
@@ -152,14 +160,19 @@ class Tasks(Resource):
             information.
         """
 
-        tasks = task_service.get_all(None, current_user=current_user)
-        return {"message": "Tasks has been searched", "result": [task.to_dict() for task in tasks]}, 200
+        fields = request.query_params.fields
+        try:
+            tasks = task_service.get_all_records(None, current_user=current_user, query_args=request.args,
+                                                 fields=fields)
+        except ValueError as error:
+            return {"message": str(error)}, 400
+        return {"message": "Tasks has been searched", "result": [task.to_dict(fields) for task in tasks]}, 200
 
     @api.response(200, "Task has been created", TaskModel)
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
-    @api.expect(RegisterModel)
+    @api.response(400, "Task category not found", BaseResponseModel)
     @api.doc(security="Bearer Auth")
-    @validate(body=RegisterNewTaskModel)
+    @validate_request(api, body=RegisterNewTaskModel, query=TaskFieldsQueryModel)
     @token_required
     def post(self, current_user):
         """
@@ -175,21 +188,17 @@ class Tasks(Resource):
             Specifies the response format for failed authentication. The response has HTTP status code 401 and is
             accompanied by a BaseResponseModel instance indicating the authentication failure.
 
-            Decorator: @api.expect(RegisterModel)
-
-            Description:
-            Specifies the expected JSON schema for the request body when creating a new task, using the RegisterModel.
-
             Decorator: @api.doc(security="Bearer Auth")
 
             Description:
             Specifies the security requirements for accessing this endpoint, indicating that a Bearer token is required
             for authentication.
 
-            Decorator: @validate(body=RegisterNewTaskModel)
+            Decorator: @validate_request(api, body=RegisterNewTaskModel, query=TaskFieldsQueryModel)
 
             Description:
-            Validates the request body against the RegisterNewTaskModel schema before processing the request.
+            Validates the request body against the RegisterNewTaskModel schema, and the "fields" query parameter
+            selecting the fields of the task returned, before processing the request, and documents them.
 
             Decorator: @token_required
 
@@ -214,20 +223,83 @@ class Tasks(Resource):
         description = request.body_params.description
         order = request.body_params.order
         category_id = request.body_params.category_id
-        task = task_service.create(title, description, order, category_id, current_user)
-        return {"message": "Task has been created", "result": task.to_dict()}, 201
+        try:
+            task = task_service.create(title, description, order, category_id, current_user)
+        except ValueError as error:
+            return {"message": str(error)}, 400
+        return {"message": "Task has been created", "result": task.to_dict(request.query_params.fields)}, 201
 
 
-# Task Update Model
-TaskUpdateModel = api.model("TaskUpdateModel",
+# Task Search Model
+TaskSearchModel = api.model("TaskSearchModel",
                             {
-                                "title": fields.String(required=False),
-                                "description": fields.String(required=False),
-                                "order": fields.Integer(required=False),
-                                "category_id": fields.Integer(required=False),
+                                "message": fields.String,
+                                "result": fields.Nested(TaskModel, as_list=True),
+                                "total": fields.Integer,
+                                "page": fields.Integer,
+                                "per_page": fields.Integer
                             })
 
 
+@api.route("/search")
+class TaskSearch(Resource):
+    """
+        Decorator: @api.route("/search")
+
+        Description:
+        Specifies the route "/search" for the TaskSearch resource within the API.
+
+        Class: TaskSearch(Resource)
+
+        Description:
+        This class represents the TaskSearch resource in the API. It handles HTTP GET requests that search the tasks of
+        the authenticated user by title and description through the full-text index.
+
+        Method: get(self, current_user)
+
+        Description:
+        Handles HTTP GET requests to the "/search" endpoint. Every word of the "q" query parameter must match a word
+        prefix of the task title or description. Results are ranked by relevance and paginated with the "page" and
+        "per_page" query parameters.
+
+        Parameters:
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the search along with the page of matching tasks,
+        the total number of matches and the pagination arguments.
+    """
+
+    @api.response(200, "Tasks has been searched", TaskSearchModel)
+    @api.response(400, "Invalid search arguments", BaseResponseModel)
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @validate_request(api, query=SearchTaskQueryModel)
+    @token_required
+    def get(self, current_user):
+        """
+            Method: get(self, current_user)
+
+            Description:
+            Handles HTTP GET requests to the "/search" endpoint. It searches the tasks of the authenticated user and
+            returns the requested page of results, best match first.
+
+            Parameters:
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the task search along with the page of tasks,
+            the total number of matches and the pagination arguments.
+        """
+
+        args = request.query_params
+        tasks, total = task_service.search(args.q, args.page, args.per_page, current_user, args.fields)
+        return {"message": "Tasks has been searched", "result": [task.to_dict(args.fields) for task in tasks],
+                "total": total,
+                "page": args.page, "per_page": args.per_page}, 200
+
+
+
 @api.route("/<int:id>")
 class Task(Resource):
     """
@@ -293,12 +365,12 @@ class Task(Resource):
           format for failed authentication.
         - @api.response(404, "Task not found or you don't have permission to view it", BaseResponseModel): Indicates the
           response format when the task is not found or the user doesn't have permission to view it.
-        - @api.expect(TaskUpdateModel): Specifies the expected JSON schema for the request body when updating a task,
-          using the TaskUpdateModel.
         - @api.doc(security="Bearer Auth"): Specifies the security requirements for accessing this endpoint, indicating
           that a Bearer token is required for authentication.
-        - @validate(body=UpdateTaskModel): Validates the request body against the UpdateTaskModel schema when updating a
-          task.
+        - @validate_request(api, query=TaskFieldsQueryModel): Validates the "fields" query parameter selecting the
+          fields of the task returned, which also documents it.
+        - @validate_request(api, body=UpdateTaskModel, query=TaskFieldsQueryModel): Validates the request body against
+          the UpdateTaskModel schema when updating a task, which also documents it.
         - @token_required: Enforces authentication for accessing the endpoint by requiring a valid authentication token.
     """
 
@@ -306,6 +378,7 @@ class Task(Resource):
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
     @api.response(404, "Task not found or you don't have permission to view it", BaseResponseModel)
     @api.doc(security="Bearer Auth")
+    @validate_request(api, query=TaskFieldsQueryModel)
     @token_required
     def get(self, id, current_user):
         """
@@ -333,6 +406,12 @@ class Task(Resource):
             Specifies the security requirements for accessing this endpoint, indicating that a Bearer token is required
             for authentication.
 
+            Decorator: @validate_request(api, query=TaskFieldsQueryModel)
+
+            Description:
+            Validates the "fields" query parameter, e.g. "?fields=id,title", which restricts the task returned, and the
+            columns read from the database, to the given fields.
+
             Decorator: @token_required
 
             Description:
@@ -354,18 +433,18 @@ class Task(Resource):
             it.
         """
 
-        task = task_service.get_by_id(id, current_user)
+        fields = request.query_params.fields
+        task = task_service.get_by_id(id, current_user, fields)
         if task:
-            return {"message": "Task has been searched", "result": task.to_dict()}, 200
+            return {"message": "Task has been searched", "result": task.to_dict(fields)}, 200
         else:
             return {"message": "Task not found or you don't have permission to view it"}, 404
 
     @api.response(200, "Task has been updated", TaskModel)
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
     @api.response(404, "Task not found or you don't have permission to view it", BaseResponseModel)
-    @api.expect(TaskUpdateModel)
     @api.doc(security="Bearer Auth")
-    @validate(body=UpdateTaskModel)
+    @validate_request(api, body=UpdateTaskModel, query=TaskFieldsQueryModel)
     @token_required
     def put(self, id, current_user):
         """
@@ -387,21 +466,17 @@ class Task(Resource):
             Specifies the response format when the task is not found or the user doesn't have permission to view it. The
             response has HTTP status code 404 and is accompanied by a BaseResponseModel instance.
 
-            Decorator: @api.expect(TaskUpdateModel)
-
-            Description:
-            Specifies the expected JSON schema for the request body when updating a task, using the TaskUpdateModel.
-
             Decorator: @api.doc(security="Bearer Auth")
 
             Description:
             Specifies the security requirements for accessing this endpoint, indicating that a Bearer token is required
             for authentication.
 
-            Decorator: @validate(body=UpdateTaskModel)
+            Decorator: @validate_request(api, body=UpdateTaskModel, query=TaskFieldsQueryModel)
 
             Description:
-            Validates the request body against the UpdateTaskModel schema before processing the request.
+            Validates the request body against the UpdateTaskModel schema, and the "fields" query parameter selecting
+            the fields of the task returned, before processing the request, and documents them.
 
             Decorator: @token_required
 
@@ -431,7 +506,7 @@ class Task(Resource):
 
         task = task_service.update(id, title, description, order, category_id, current_user)
         if task:
-            return {"message": "Task has been updated", "result": task.to_dict()}, 200
+            return {"message": "Task has been updated", "result": task.to_dict(request.query_params.fields)}, 200
         else:
             return {"message": "Task not found or you don't have permission to update it"}, 404
 
@@ -491,3 +566,270 @@ class Task(Resource):
             return {"message": "Task has been deleted"}, 200
         else:
             return {"message": "Task not found or you don't have permission to delete it"}, 404
+
+
+# Archived Task Model
+ArchivedTaskModel = api.model("ArchivedTaskModel",
+                              {
+                                  "id": fields.Integer,
+                                  "task_id": fields.Integer,
+                                  "title": fields.String,
+                                  "order": fields.Integer,
+                                  "description": fields.String(required=False),
+                                  "category_id": fields.String,
+                                  "user_id": fields.Integer,
+                                  "updated_at": fields.DateTime,
+                                  "archived_at": fields.DateTime
+                              })
+
+# Archived Task List Model
+ArchivedTaskListModel = api.model("ArchivedTaskListModel",
+                                  {
+                                      "message": fields.String,
+                                      "result": fields.Nested(ArchivedTaskModel, as_list=True),
+                                      "total": fields.Integer,
+                                      "page": fields.Integer,
+                                      "per_page": fields.Integer
+                                  })
+
+
+@api.route("/<int:id>/archive")
+class TaskArchive(Resource):
+    """
+        Decorator: @api.route("/<int:id>/archive")
+
+        Description:
+        Specifies the route "/<int:id>/archive" for the TaskArchive resource within the API.
+
+        Class: TaskArchive(Resource)
+
+        Description:
+        This class represents the TaskArchive resource in the API. It handles HTTP POST requests that move a task of the
+        authenticated user out of its board, to the archive.
+
+        Method: post(self, id, current_user)
+
+        Description:
+        Handles HTTP POST requests to the "/<int:id>/archive" endpoint. It archives the task with the provided ID.
+
+        Parameters:
+        - id (int): The ID of the task to archive.
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the task archiving along with the archived task's
+        information, or a message indicating that the task was not found.
+    """
+
+    @api.response(200, "Task has been archived", ArchivedTaskModel)
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.response(404, "Task not found or you don't have permission to archive it", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @validate_request(api, query=ArchivedTaskFieldsQueryModel)
+    @token_required
+    def post(self, id, current_user):
+        """
+            Method: post(self, id, current_user)
+
+            Description:
+            Handles HTTP POST requests to the "/<int:id>/archive" endpoint. It moves the task with the provided ID to
+            the archive. The archived task keeps its former ID in "task_id".
+
+            Parameters:
+            - id (int): The ID of the task to archive.
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the task archiving along with the archived
+            task's information, or a message indicating that the task was not found.
+        """
+
+        archived_task = task_service.archive(id, current_user)
+        if archived_task:
+            return {"message": "Task has been archived",
+                    "result": archived_task.to_dict(request.query_params.fields)}, 200
+        else:
+            return {"message": "Task not found or you don't have permission to archive it"}, 404
+
+
+@api.route("/archive")
+class ArchivedTasks(Resource):
+    """
+        Decorator: @api.route("/archive")
+
+        Description:
+        Specifies the route "/archive" for the ArchivedTasks resource within the API.
+
+        Class: ArchivedTasks(Resource)
+
+        Description:
+        This class represents the ArchivedTasks resource in the API. It handles HTTP GET requests that list or search
+        the archived tasks of the authenticated user.
+
+        Method: get(self, current_user)
+
+        Description:
+        Handles HTTP GET requests to the "/archive" endpoint. Archived tasks are listed most recently archived first.
+        When the "q" query parameter is given, every one of its words must appear in the task title or description.
+        Results are paginated with the "page" and "per_page" query parameters.
+
+        Parameters:
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the search along with the page of archived tasks,
+        the total number of matches and the pagination arguments.
+    """
+
+    @api.response(200, "Archived tasks has been searched", ArchivedTaskListModel)
+    @api.response(400, "Invalid search arguments", BaseResponseModel)
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @validate_request(api, query=ArchivedTaskQueryModel)
+    @token_required
+    def get(self, current_user):
+        """
+            Method: get(self, current_user)
+
+            Description:
+            Handles HTTP GET requests to the "/archive" endpoint. It lists or searches the archived tasks of the
+            authenticated user and returns the requested page.
+
+            Parameters:
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the search along with the page of archived
+            tasks, the total number of matches and the pagination arguments.
+        """
+
+        args = request.query_params
+        archived_tasks, total = task_service.get_archived(args.q, args.page, args.per_page, current_user, args.fields)
+        return {"message": "Archived tasks has been searched",
+                "result": [archived_task.to_dict(args.fields) for archived_task in archived_tasks], "total": total,
+                "page": args.page, "per_page": args.per_page}, 200
+
+
+@api.route("/archive/<int:id>")
+class ArchivedTask(Resource):
+    """
+        Decorator: @api.route("/archive/<int:id>")
+
+        Description:
+        Specifies the route "/archive/<int:id>" for the ArchivedTask resource within the API. The "<int:id>" part
+        represents the archived task ID in the URL.
+
+        Class: ArchivedTask(Resource)
+
+        Description:
+        This class represents the ArchivedTask resource in the API. It handles HTTP GET requests related to individual
+        archived tasks.
+
+        Method: get(self, id, current_user)
+
+        Description:
+        Handles HTTP GET requests to the "/archive/<int:id>" endpoint. It retrieves the archived task with the provided
+        ID for the authenticated user.
+
+        Parameters:
+        - id (int): The ID of the archived task to retrieve.
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the search along with the archived task's
+        information, or a message indicating that the archived task was not found.
+    """
+
+    @api.response(200, "Archived task has been searched", ArchivedTaskModel)
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.response(404, "Archived task not found or you don't have permission to view it", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @validate_request(api, query=ArchivedTaskFieldsQueryModel)
+    @token_required
+    def get(self, id, current_user):
+        """
+            Method: get(self, id, current_user)
+
+            Description:
+            Handles HTTP GET requests to the "/archive/<int:id>" endpoint. It retrieves the archived task with the
+            provided ID for the authenticated user.
+
+            Parameters:
+            - id (int): The ID of the archived task to retrieve.
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the search along with the archived task's
+            information, or a message indicating that the archived task was not found.
+        """
+
+        fields = request.query_params.fields
+        archived_task = task_service.get_archived_by_id(id, current_user, fields)
+        if archived_task:
+            return {"message": "Archived task has been searched", "result": archived_task.to_dict(fields)}, 200
+        else:
+            return {"message": "Archived task not found or you don't have permission to view it"}, 404
+
+
+@api.route("/archive/<int:id>/restore")
+class ArchivedTaskRestore(Resource):
+    """
+        Decorator: @api.route("/archive/<int:id>/restore")
+
+        Description:
+        Specifies the route "/archive/<int:id>/restore" for the ArchivedTaskRestore resource within the API.
+
+        Class: ArchivedTaskRestore(Resource)
+
+        Description:
+        This class represents the ArchivedTaskRestore resource in the API. It handles HTTP POST requests that move an
+        archived task back to the board of the authenticated user.
+
+        Method: post(self, id, current_user)
+
+        Description:
+        Handles HTTP POST requests to the "/archive/<int:id>/restore" endpoint. The task is restored at the end of the
+        category given in the request body, or of the category it was archived from, and gets its former ID back when
+        it is still free.
+
+        Parameters:
+        - id (int): The ID of the archived task to restore.
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the task restoring along with the restored task's
+        information, or a message indicating that the archived task or the category was not found.
+    """
+
+    @api.response(200, "Task has been restored", TaskModel)
+    @api.response(400, "Task category not found", BaseResponseModel)
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.response(404, "Archived task not found or you don't have permission to restore it", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @validate_request(api, body=RestoreTaskModel, query=TaskFieldsQueryModel)
+    @token_required
+    def post(self, id, current_user):
+        """
+            Method: post(self, id, current_user)
+
+            Description:
+            Handles HTTP POST requests to the "/archive/<int:id>/restore" endpoint. It moves the archived task with the
+            provided ID back to the board of the authenticated user.
+
+            Parameters:
+            - id (int): The ID of the archived task to restore.
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the task restoring along with the restored
+            task's information, or a message indicating that the archived task or the category was not found.
+        """
+
+        try:
+            task = task_service.restore(id, request.body_params.category_id, current_user)
+        except ValueError as error:
+            return {"message": str(error)}, 400
+        if task:
+            return {"message": "Task has been restored", "result": task.to_dict(request.query_params.fields)}, 200
+        else:
+            return {"message": "Archived task not found or you don't have permission to restore it"}, 404
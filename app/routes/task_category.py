@@ -1,11 +1,13 @@
-from flask import Blueprint, request
-from flask_pydantic import validate
-from flask_restx import Resource, Namespace, fields, reqparse
+from flask import Blueprint, current_app, request
+from flask_restx import Resource, Namespace, fields
 
-from app.decorators import token_required
-from app.dtos.task_category_dto import RegisterNewTaskCategoryModel, UpdateTaskCategoryModel
+from app.decorators import token_required, validate_request
+from app.dtos.task_category_dto import (RegisterNewTaskCategoryModel, UpdateTaskCategoryModel, TaskCategoryQueryModel,
+                                        TaskCategoryFieldsQueryModel)
+from app.routes.job import JobModel
 from app.routes.task import TaskModel
 from app.services.task_category_service import TaskCategoryService
+from app.utils import single_flight
 
 authorizations = {
     "Bearer Auth": {
@@ -35,13 +37,15 @@ TaskCategoryModel = api.model("TaskCategoryModel",
                                   "tasks": fields.Nested(TaskModel, as_list=True),
                               })
 
-
-# Register Model
-TaskCategoryRegisterModel = api.model("TaskCategoryRegisterModel",
-                                      {
-                                          "title": fields.String,
-                                          "order": fields.Integer
-                                      })
+# Task Category Summary Model
+TaskCategorySummaryModel = api.model("TaskCategorySummaryModel",
+                                     {
+                                         "id": fields.String,
+                                         "title": fields.String,
+                                         "order": fields.Integer,
+                                         "task_count": fields.Integer,
+                                         "tasks_updated_at": fields.DateTime
+                                     })
 
 
 @api.route("")
@@ -74,8 +78,10 @@ class TasksCategory(Resource):
         Requires a valid access token obtained through authentication.
 
         Request Parameters:
-        - exclude_tasks (string, optional): If set to "true", tasks within the categories will be excluded from the
+        - exclude_tasks (boolean, optional): If set to true, tasks within the categories will be excluded from the
           result.
+        - fields (string, optional): Comma separated fields to return, "tasks.<field>" selecting fields of the tasks,
+          e.g. "id,title,tasks.id,tasks.title". Only these columns are read from the database.
 
         Method: post(self, current_user)
 
@@ -113,20 +119,23 @@ class TasksCategory(Resource):
           - exclude_tasks (boolean, optional): If the exclude_tasks query parameter is set to "true",
           tasks within the category will be excluded from the result.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.parser = reqparse.RequestParser()
-        self.parser.add_argument("exclude_tasks", type=str, default="false", help="Return tasks in tasks categories")
-
     @api.response(200, "All tasks categories related to this user", [TaskCategoryModel])
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
     @api.doc(security="Bearer Auth")
+    @validate_request(api, query=TaskCategoryQueryModel)
     @token_required
     def get(self, current_user):
         """
             Handles HTTP GET requests to retrieve all task categories related to the current user.
             Returns appropriate responses based on the query parameters.
 
+            Identical requests of the same user received while the board is being loaded (several tabs, reconnecting
+            clients) wait for that load and share its result instead of querying the database again (see
+            SingleFlight and the SINGLE_FLIGHT_* settings).
+
+            The "fields" query parameter (sparse fieldset) restricts the result, and the columns read from the
+            database, to the given fields.
+
             Parameters:
             - current_user: User object representing the current authenticated user.
 
@@ -146,19 +155,28 @@ class TasksCategory(Resource):
             A JSON object containing a message indicating the success of the search operation,
             along with the list of task categories.
         """
-        args = self.parser.parse_args()
-        exclude_tasks = True if args["exclude_tasks"] == "true" else False
-        tasks_categories = task_category_service.get_all(exclude_tasks, current_user)
-        return {"message": "Tasks Categories has been searched", "result": [categories.to_dict(exclude_tasks=
-                                                                                               exclude_tasks) for
-                                                                            categories in
-                                                                            tasks_categories]}, 200
+        exclude_tasks = request.query_params.exclude_tasks
+        fields = request.query_params.fields
+
+        def load_board():
+            if not exclude_tasks:
+                return task_category_service.get_board(current_user, fields)
+            tasks_categories = task_category_service.get_all_records(exclude_tasks, current_user, fields)
+            return [categories.to_dict(exclude_tasks=exclude_tasks, fields=fields) for categories in tasks_categories]
+
+        config = current_app.config
+        if config["SINGLE_FLIGHT_ENABLED"]:
+            key = f"task-category:{current_user.id}:{sorted(request.args.items(multi=True))}"
+            result = single_flight.do(key, load_board, config["SINGLE_FLIGHT_TIMEOUT_SECONDS"],
+                                      config["SINGLE_FLIGHT_SHARED_DIR"] or None)
+        else:
+            result = load_board()
+        return {"message": "Tasks Categories has been searched", "result": result}, 200
 
     @api.response(200, "Task Category has been created", TaskCategoryModel)
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
-    @api.expect(TaskCategoryRegisterModel)
     @api.doc(security="Bearer Auth")
-    @validate(body=RegisterNewTaskCategoryModel)
+    @validate_request(api, body=RegisterNewTaskCategoryModel, query=TaskCategoryQueryModel)
     @token_required
     def post(self, current_user):
         """
@@ -198,18 +216,62 @@ class TasksCategory(Resource):
         title = request.body_params.title
         order = request.body_params.order
         task_category = task_category_service.create(title, order, current_user)
-        args = self.parser.parse_args()
-        exclude_tasks = True if args["exclude_tasks"] == "true" else False
+        exclude_tasks = request.query_params.exclude_tasks
+        fields = request.query_params.fields
         return {"message": "Task Category has been created",
-                "result": task_category.to_dict(exclude_tasks=exclude_tasks)}, 201
+                "result": task_category.to_dict(exclude_tasks=exclude_tasks, fields=fields)}, 201
 
 
-# Task Update Model
-TaskCategoryUpdateModel = api.model("TaskCategoryUpdateModel",
-                                    {
-                                        "title": fields.String(required=False),
-                                        "order": fields.Integer(required=False)
-                                    })
+@api.route("/summary")
+class TasksCategorySummary(Resource):
+    """
+        Decorator: @api.route("/summary")
+
+        Description:
+        Specifies the route "/summary" for the TasksCategorySummary resource within the API.
+
+        Class: TasksCategorySummary(Resource)
+
+        Description:
+        This class represents the board summary in the API. It handles HTTP GET requests returning the title and the
+        task counters of each task category of the authenticated user, without their tasks.
+
+        Method: get(self, current_user)
+
+        Description:
+        Handles HTTP GET requests to the "/summary" endpoint. It retrieves the task categories of the authenticated
+        user, ordered by their order, with their number of tasks and the time their tasks were last changed.
+
+        Parameters:
+        - current_user: The current authenticated user obtained from the token.
+
+        Returns:
+        A dictionary containing a message indicating the success of the search along with the summary of each task
+        category.
+    """
+
+    @api.response(200, "Tasks Categories summary has been searched", [TaskCategorySummaryModel])
+    @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
+    @api.doc(security="Bearer Auth")
+    @token_required
+    def get(self, current_user):
+        """
+            Method: get(self, current_user)
+
+            Description:
+            Handles HTTP GET requests to the "/summary" endpoint. It retrieves the task counters of the task categories
+            of the authenticated user, read from the task categories alone.
+
+            Parameters:
+            - current_user: The current authenticated user obtained from the token.
+
+            Returns:
+            A dictionary containing a message indicating the success of the search along with the summary of each task
+            category.
+        """
+
+        summary = task_category_service.get_summary(current_user)
+        return {"message": "Tasks Categories summary has been searched", "result": summary}, 200
 
 
 @api.route("/<string:id>")
@@ -246,6 +308,8 @@ class TaskCategory(Resource):
 
         Request Parameters:
         - exclude_tasks (boolean, optional): If set to true, tasks within the category will be excluded from the result.
+        - fields (string, optional): Comma separated fields to return, "tasks.<field>" selecting fields of the tasks,
+          e.g. "id,title,tasks.id,tasks.title". Only these columns are read from the database.
 
         Method: put(self, id, current_user)
 
@@ -307,15 +371,11 @@ class TaskCategory(Resource):
         Authorization:
         Requires a valid access token obtained through authentication.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.parser = reqparse.RequestParser()
-        self.parser.add_argument("exclude_tasks", type=bool, default=False, help="Return tasks in tasks categories")
-
     @api.response(200, "Task Category found", TaskCategoryModel)
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
     @api.response(404, "Task Category not found or you don't have permission to view it", BaseResponseModel)
     @api.doc(security="Bearer Auth")
+    @validate_request(api, query=TaskCategoryQueryModel)
     @token_required
     def get(self, id, current_user):
         """
@@ -343,22 +403,23 @@ class TaskCategory(Resource):
             Request Parameters:
             - exclude_tasks (boolean, optional): If set to true, tasks within the category will be excluded from the
               result.
+            - fields (string, optional): Comma separated fields to return, "tasks.<field>" selecting fields of the
+              tasks. Only these columns are read from the database.
         """
-        args = self.parser.parse_args()
-        exclude_tasks = True if args["exclude_tasks"] == "true" else False
-        task_category = task_category_service.get_by_id(id, exclude_tasks, current_user)
+        exclude_tasks = request.query_params.exclude_tasks
+        fields = request.query_params.fields
+        task_category = task_category_service.get_by_id(id, exclude_tasks, current_user, fields)
         if task_category:
-            return {"message": "Task Category has been searched", "result": task_category.to_dict(exclude_tasks=
-                                                                                                  exclude_tasks)}, 200
+            return {"message": "Task Category has been searched",
+                    "result": task_category.to_dict(exclude_tasks=exclude_tasks, fields=fields)}, 200
         else:
             return {"message": "Task Category not found or you don't have permission to view it"}, 404
 
     @api.response(200, "Task Category has been updated", TaskCategoryModel)
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
     @api.response(404,  "Task Category not found or you don't have permission to view it", BaseResponseModel)
-    @api.expect(TaskCategoryUpdateModel)
     @api.doc(security="Bearer Auth")
-    @validate(body=UpdateTaskCategoryModel)
+    @validate_request(api, body=UpdateTaskCategoryModel, query=TaskCategoryFieldsQueryModel)
     @token_required
     def put(self, id, current_user):
         """
@@ -391,20 +452,25 @@ class TaskCategory(Resource):
             Authorization:
             Requires a valid access token obtained through authentication.
 
+            Request Parameters:
+            - fields (string, optional): Comma separated fields to return.
+
             Returns:
             A JSON object containing a message indicating the success of the update operation,
             along with the updated task category details.
         """
         title = request.body_params.title
         order = request.body_params.order
+        fields = request.query_params.fields
         task_category = task_category_service.update(id, title, order, current_user)
         if task_category:
-            return {"message": "Task Category has been updated", "result": task_category.to_dict(exclude_tasks=
-                                                                                                 True)}, 200
+            return {"message": "Task Category has been updated",
+                    "result": task_category.to_dict(exclude_tasks=True, fields=fields)}, 200
         else:
             return {"message":  "Task Category not found or you don't have permission to update it"}, 404
 
     @api.response(200, "Task Category has been deleted", BaseResponseModel)
+    @api.response(202, "Task Category deletion has been scheduled", JobModel)
     @api.response(401, "Invalid or missing Authentication token!", BaseResponseModel)
     @api.response(404, "Task Category not found or you don't have permission to delete it", BaseResponseModel)
     @api.doc(security="Bearer Auth")
@@ -412,7 +478,8 @@ class TaskCategory(Resource):
     def delete(self, id, current_user):
         """
             Handles HTTP DELETE requests to delete a specific task category by its ID.
-            Returns appropriate responses based on the deletion outcome.
+            Returns appropriate responses based on the deletion outcome. Categories holding many tasks are deleted by a
+            background job: the job is returned right away, and its status can be polled at the "Location" URL.
 
             Parameters:
             - id (string): The ID of the task category to delete.
@@ -421,6 +488,8 @@ class TaskCategory(Resource):
             Responses:
             - 200: Task Category has been deleted.
               Body: BaseResponseModel
+            - 202: Task Category deletion has been scheduled.
+              Body: JobModel
             - 401: Invalid or missing Authentication token.
               Body: BaseResponseModel
             - 404: Task Category not found or you don't have permission to delete it.
@@ -432,6 +501,11 @@ class TaskCategory(Resource):
             Authorization:
             Requires a valid access token obtained through authentication.
         """
+        job = task_category_service.schedule_delete(id, current_user)
+        if job:
+            return ({"message": "Task Category deletion has been scheduled", "result": job.to_dict()}, 202,
+                    {"Location": f"/job/{job.id}"})
+
         success = task_category_service.delete(id, current_user)
         if success:
             return {"message": "Task Category has been deleted"}, 200
@@ -1,3 +1,5 @@
 from .auth_service import AuthService
 from .task_category_service import TaskCategoryService
 from .task_service import TaskService
+from .job_service import JobService
+from .token_revocation_service import TokenRevocationService, token_revocation_service
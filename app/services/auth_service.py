@@ -1,10 +1,14 @@
 from datetime import datetime, timedelta, timezone
 import re
+import uuid
+
 import jwt
+from flask import current_app
 
-from app import app
 from app.models import User
 from app.repositories.user_repository import UserRepository
+from app.services.token_revocation_service import token_revocation_service
+from app.utils import shard_router
 
 
 class AuthService:
@@ -24,6 +28,7 @@ class AuthService:
         - login(self, username, password): Authenticates a user with the provided username and password. It retrieves
           the user from the repository, checks if the password matches, generates a JWT token for authentication, and
           returns the token if authentication is successful.
+        - logout(self, token): Revokes an authentication token before its expiry.
         - get_all(self): Retrieves all users from the repository.
 
         Attributes:
@@ -43,8 +48,8 @@ class AuthService:
             Description:
             Registers a new user with the provided username and password. It validates the username to ensure it is
             alphanumeric, checks if the username already exists in the system, creates a new user instance, sets the
-            password, and persists the user in the database. Additionally, it initializes task categories and tasks for
-            the newly registered user.
+            password, and persists the user in the database. The user is then assigned to a database shard, which will
+            hold their board. Additionally, it initializes task categories and tasks for the newly registered user.
 
             Parameters:
             - username (str): The username of the new user.
@@ -65,6 +70,11 @@ class AuthService:
         user.set_password(password)
         self.user_repository.create(user)
 
+        user.shard_key = shard_router.place(user.id)
+        self.user_repository.update(user)
+        shard_router.ensure_user(user, user.shard_key)
+        shard_router.activate(user)
+
         from app.services import TaskService, TaskCategoryService
         task_category_service = TaskCategoryService()
         task_service = TaskService()
@@ -79,8 +89,9 @@ class AuthService:
             Description:
             Authenticates a user with the provided username and password. It retrieves the user from the repository
             based on the username provided, checks if the password matches with the stored password hash, generates a
-            JWT token with a specified expiration time, and returns the token if the authentication is successful. If
-            the authentication fails due to an invalid username or password, an appropriate error message is returned.
+            JWT token with a specified expiration time and a unique identifier ("jti" claim, used to revoke it), and
+            returns the token if the authentication is successful. If the authentication fails due to an invalid
+            username or password, an appropriate error message is returned.
 
             Parameters:
             - username (str): The username of the user trying to log in.
@@ -94,12 +105,33 @@ class AuthService:
         user = self.user_repository.get_by_name(username)
         if user and user.check_password(password):
             token = jwt.encode(
-                {"id": user.id, "exp": datetime.now(timezone.utc) + timedelta(minutes=45)},
-                app.config["SECRET_KEY"], "HS256")
+                {"id": user.id, "jti": uuid.uuid4().hex, "exp": datetime.now(timezone.utc) + timedelta(minutes=45)},
+                current_app.config["SECRET_KEY"], "HS256")
             return {"message": "User has been logged", "result": token}, 200
         else:
             return {"message": "Invalid username or password"}, 401
 
+    def logout(self, token):
+        """
+            Method: logout
+
+            Description:
+            Revokes an authentication token, so it is rejected by token_required from now on instead of at its expiry.
+
+            Parameters:
+            - token (str): The JWT token to revoke.
+
+            Returns:
+            dict: A dictionary containing a message indicating the result of the logout along with an HTTP status code.
+        """
+
+        data = jwt.decode(token, current_app.config["SECRET_KEY"], algorithms=["HS256"])
+        if "jti" not in data:
+            return {"message": "This token was issued before tokens could be revoked and expires on its own"}, 400
+
+        token_revocation_service.revoke(data)
+        return {"message": "User has been logged out"}, 200
+
     def get_all(self):
         """
             Method: get_all
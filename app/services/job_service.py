@@ -0,0 +1,164 @@
+from datetime import timedelta
+
+from flask import current_app
+
+from app import db
+from app.models import Job, User
+from app.models.task import utcnow
+from app.repositories.job_repository import JobRepository
+from app.repositories.user_repository import UserRepository
+from app.utils import shard_router
+
+
+class JobService:
+    """
+        Class: JobService
+
+        Description:
+        This class provides the background jobs of the Todo-List API. Heavy operations are queued as jobs in the "job"
+        table by the request that triggers them, which answers "202 Accepted" right away, and run later by the worker
+        started with "flask jobs-worker".
+
+        Methods:
+        - __init__(self): Constructor method initializing the job and user repositories.
+        - handlers(self) -> dict: The job handlers, by name.
+        - enqueue(self, name: str, payload: dict, current_user: User) -> Job: Queues a new job.
+        - get_all(self, current_user: User) -> list[Job]: Retrieves the most recent jobs of the user.
+        - get_by_id(self, id: int, current_user: User) -> Job | None: Retrieves a job by its ID.
+        - run_next(self) -> Job | None: Claims and runs the next due job.
+
+        Attributes:
+        - job_repository: An instance of JobRepository for accessing job data.
+        - user_repository: An instance of UserRepository for loading the user of a job.
+
+        Note:
+        - A failed attempt is retried up to JOB_MAX_ATTEMPTS times, after JOB_RETRY_BACKOFF_SECONDS doubled at every
+          attempt. An attempt still running after JOB_TIMEOUT_SECONDS is considered abandoned and started again.
+        - Job handlers may run more than once, so they must be idempotent.
+    """
+
+    def __init__(self):
+        self.job_repository = JobRepository()
+        self.user_repository = UserRepository()
+
+    def handlers(self) -> dict:
+        """
+            Method: handlers
+
+            Description:
+            Returns the job handlers, by name. Each handler is called with the payload of the job and the user who
+            queued it, and returns the JSON-serializable result of the job.
+
+            Returns:
+            dict: The mapping from job names to handlers.
+        """
+
+        from app.services.task_category_service import TaskCategoryService
+
+        return {
+            "task_category.delete": lambda payload, current_user: {
+                "deleted": TaskCategoryService().delete(payload["id"], current_user),
+            },
+        }
+
+    def enqueue(self, name: str, payload: dict, current_user: User) -> Job:
+        """
+            Method: enqueue
+
+            Description:
+            Queues a new job for the given current user.
+
+            Parameters:
+            - name (str): The name of the job handler.
+            - payload (dict): The JSON-serializable arguments of the job handler.
+            - current_user (User): The current user queuing the job.
+
+            Returns:
+            Job: The queued job.
+
+            Raises:
+            ValueError: If no job handler has the given name.
+        """
+
+        if name not in self.handlers():
+            raise ValueError(f"Unknown job '{name}'")
+
+        job = Job(name=name, payload=payload, status=Job.QUEUED, attempts=0,
+                  max_attempts=current_app.config["JOB_MAX_ATTEMPTS"], user_id=current_user.id)
+        return self.job_repository.create(job)
+
+    def get_all(self, current_user: User) -> list[Job]:
+        """
+            Method: get_all
+
+            Description:
+            Retrieves the most recent jobs queued by the given current user.
+
+            Parameters:
+            - current_user (User): The current user whose jobs are retrieved.
+
+            Returns:
+            list[Job]: The jobs, most recent first.
+        """
+
+        return self.job_repository.get_all(current_user)
+
+    def get_by_id(self, id: int, current_user: User) -> Job | None:
+        """
+            Method: get_by_id
+
+            Description:
+            Retrieves a job by its ID for the given current user.
+
+            Parameters:
+            - id (int): The ID of the job to retrieve.
+            - current_user (User): The current user for whom the job is retrieved.
+
+            Returns:
+            Job | None: The job retrieved based on the provided ID. Returns None if no job is found.
+        """
+
+        return self.job_repository.get_by_id(id, current_user)
+
+    def run_next(self) -> Job | None:
+        """
+            Method: run_next
+
+            Description:
+            Claims the next due job and runs its handler against the database shard of its user. On success the result
+            is stored; on failure the job is queued again with an exponential backoff, or marked as failed once it has
+            no attempts left.
+
+            Returns:
+            Job | None: The job that was run, or None if no job is due.
+        """
+
+        config = current_app.config
+        job = self.job_repository.claim_next(utcnow() - timedelta(seconds=config["JOB_TIMEOUT_SECONDS"]))
+        if job is None:
+            return None
+
+        try:
+            current_user = self.user_repository.get_by_id(job.user_id)
+            if current_user is None:
+                raise LookupError(f"User {job.user_id} not found")
+            shard_router.activate(current_user)
+
+            handler = self.handlers().get(job.name)
+            if handler is None:
+                raise LookupError(f"Unknown job '{job.name}'")
+            job.result = handler(job.payload, current_user)
+            job.status = Job.SUCCEEDED
+            job.error = None
+        except Exception as error:
+            db.session.rollback()
+            job.error = f"{type(error).__name__}: {error}"
+            if job.attempts < job.max_attempts:
+                job.status = Job.QUEUED
+                job.run_after = utcnow() + timedelta(
+                    seconds=config["JOB_RETRY_BACKOFF_SECONDS"] * 2 ** (job.attempts - 1))
+            else:
+                job.status = Job.FAILED
+
+        self.job_repository.update(job)
+        return job
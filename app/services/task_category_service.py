@@ -1,10 +1,10 @@
-import hashlib
-import time
 from typing import Optional
 
-from app.models import TaskCategory, User
+from flask import current_app
+
+from app.models import Job, TaskCategory, TaskCategoryRecord, User
 from app.repositories.task_category_repository import TaskCategoryRepository
-from app.utils import move_element_and_update_order
+from app.utils import move_element_and_update_order, move_coalescer
 
 
 class TaskCategoryService:
@@ -22,14 +22,22 @@ class TaskCategoryService:
           categories ('Todo', 'In Progress', 'Done').
         - get_all(self, exclude_tasks: bool, current_user: User) -> list[TaskCategory]: Retrieves all task categories
           optionally excluding tasks associated with them.
-        - get_by_id(self, id: str, exclude_tasks: Optional[bool], current_user: User) -> TaskCategory: Retrieves a task
-          category by its ID optionally excluding tasks associated with it.
+        - get_all_records(self, exclude_tasks: bool, current_user: User, fields: Optional[tuple[str, ...]] = None) ->
+          list[TaskCategoryRecord]: Same as get_all, as read-only records for serialization.
+        - get_board(self, current_user: User, fields: Optional[tuple[str, ...]] = None) -> list[dict]: Retrieves all
+          task categories with their tasks, serialized by the database.
+        - get_summary(self, current_user: User) -> list[dict]: Retrieves the title and task counters of all task
+          categories.
+        - get_by_id(self, id: str, exclude_tasks: Optional[bool], current_user: User, fields: Optional[tuple[str, ...]]
+          = None) -> TaskCategory: Retrieves a task category by its ID optionally excluding tasks associated with it.
         - get_by_order(self, order: int, current_user: User): Retrieves a task category by its order.
         - create(self, title: str, order: int, current_user: User) -> TaskCategory: Creates a new task category with the
           provided title and order.
         - update(self, id: str, title: Optional[str], order: Optional[int], current_user: User) -> TaskCategory: Updates
           an existing task category with the provided ID, title, and/or order.
         - delete(self, id: str, current_user: User) -> bool: Deletes a task category with the provided ID.
+        - schedule_delete(self, id: str, current_user: User) -> Job | None: Queues the deletion of a task category with
+          many tasks as a background job.
 
         Attributes:
         - task_category_repository: An instance of TaskCategoryRepository for accessing task category data.
@@ -38,6 +46,8 @@ class TaskCategoryService:
         - This class assumes the existence of a User instance for operations that require a current user.
         - The 'move_element_and_update_order' function is utilized within the 'update' method for reordering task
           categories.
+        - Task moves of the current user still buffered by the 'move_coalescer' are persisted before task categories
+          are read or changed.
     """
     def __init__(self):
         self.task_category_repository = TaskCategoryRepository()
@@ -77,9 +87,71 @@ class TaskCategoryService:
             list[TaskCategory]: A list containing all task categories retrieved from the repository.
         """
 
+        move_coalescer.flush(current_user.id)
         return self.task_category_repository.get_all(exclude_tasks, current_user)
 
-    def get_by_id(self, id: str, exclude_tasks: Optional[bool], current_user: User) -> TaskCategory:
+    def get_all_records(self, exclude_tasks: bool, current_user: User,
+                        fields: Optional[tuple[str, ...]] = None) -> list[TaskCategoryRecord]:
+        """
+            Method: get_all_records
+
+            Description:
+            Retrieves all task categories like get_all, as read-only records that are cheaper to load and serialize
+            than TaskCategory objects. Used by the board endpoint, which only serializes the board.
+
+            Parameters:
+            - exclude_tasks (bool): If True, tasks associated with the task categories will be excluded from the result.
+            - current_user (User): The current user for whom the task categories are retrieved.
+            - fields (Optional[tuple[str, ...]]): The only fields to load, "tasks.<field>" selecting fields of the
+              tasks, pushed down to SQL (optional, all of them by default).
+
+            Returns:
+            list[TaskCategoryRecord]: A list containing all task categories retrieved from the repository.
+        """
+
+        move_coalescer.flush(current_user.id)
+        return self.task_category_repository.get_all_records(exclude_tasks, current_user, fields)
+
+    def get_board(self, current_user: User, fields: Optional[tuple[str, ...]] = None) -> list[dict]:
+        """
+            Method: get_board
+
+            Description:
+            Retrieves all task categories with their tasks, already serialized by the database as the API returns
+            them, with a single query.
+
+            Parameters:
+            - current_user (User): The current user for whom the board is retrieved.
+            - fields (Optional[tuple[str, ...]]): The only fields to read and serialize, "tasks.<field>" selecting
+              fields of the tasks (optional, all of them by default).
+
+            Returns:
+            list[dict]: A list containing the serialized task categories, and their tasks, ordered by their order.
+        """
+
+        move_coalescer.flush(current_user.id)
+        return self.task_category_repository.get_board(current_user, fields)
+
+    def get_summary(self, current_user: User) -> list[dict]:
+        """
+            Method: get_summary
+
+            Description:
+            Retrieves the title, number of tasks and last task change time of all task categories, from the counters
+            maintained by TaskService, without reading the tasks.
+
+            Parameters:
+            - current_user (User): The current user for whom the summary is retrieved.
+
+            Returns:
+            list[dict]: A list containing the summary of each task category, ordered by their order.
+        """
+
+        move_coalescer.flush(current_user.id)
+        return self.task_category_repository.get_summary(current_user)
+
+    def get_by_id(self, id: str, exclude_tasks: Optional[bool], current_user: User,
+                  fields: Optional[tuple[str, ...]] = None) -> TaskCategory:
         """
             Method: get_by_id
 
@@ -91,12 +163,15 @@ class TaskCategoryService:
             - exclude_tasks (Optional[bool]): If True, tasks associated with the task category will be excluded from the
               result.
             - current_user (User): The current user for whom the task category is retrieved.
+            - fields (Optional[tuple[str, ...]]): The only fields to load, "tasks.<field>" selecting the columns of the
+              tasks to load (optional, all of them by default).
 
             Returns:
             TaskCategory: The task category retrieved based on the provided ID.
         """
 
-        return self.task_category_repository.get_by_id(id, exclude_tasks, current_user)
+        move_coalescer.flush(current_user.id)
+        return self.task_category_repository.get_by_id(id, exclude_tasks, current_user, fields)
 
     def get_by_order(self, order: int, current_user: User):
         """
@@ -131,8 +206,7 @@ class TaskCategoryService:
             TaskCategory: The newly created task category instance.
         """
 
-        id_task_category = hashlib.sha256(f"{title}{time.time()}".encode()).hexdigest()
-        task_category = TaskCategory(id=id_task_category, title=title, order=order, user_id=current_user.id)
+        task_category = TaskCategory(title=title, order=order, user_id=current_user.id)
         self.task_category_repository.create(task_category)
         return task_category
 
@@ -186,5 +260,35 @@ class TaskCategoryService:
             bool: True if the task category is successfully deleted, False otherwise.
         """
 
-        task_category = self.get_by_id(id, False, current_user)
+        task_category = self.get_by_id(id, True, current_user)
+        if task_category is None:
+            return False
         return self.task_category_repository.delete(task_category.id, current_user)
+
+    def schedule_delete(self, id: str, current_user: User) -> Job | None:
+        """
+            Method: schedule_delete
+
+            Description:
+            Queues the deletion of a task category with the provided ID as a background job when the category holds at
+            least TASK_CATEGORY_BACKGROUND_DELETE_MIN_TASKS tasks, so the request does not wait for it. Smaller
+            categories, and every category when the setting is 0, are left to the inline delete method.
+
+            Parameters:
+            - id (str): The ID of the task category to delete.
+            - current_user (User): The current user performing the delete operation.
+
+            Returns:
+            Job | None: The queued job, or None if the category is not found or small enough to be deleted inline.
+        """
+
+        from app.services.job_service import JobService
+
+        min_tasks = current_app.config["TASK_CATEGORY_BACKGROUND_DELETE_MIN_TASKS"]
+        if not min_tasks:
+            return None
+
+        task_category = self.get_by_id(id, True, current_user)
+        if task_category is None or self.task_category_repository.count_tasks(task_category.id) < min_tasks:
+            return None
+        return JobService().enqueue("task_category.delete", {"id": task_category.id}, current_user)
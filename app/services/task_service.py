@@ -1,9 +1,15 @@
+from datetime import datetime, timedelta
 from typing import Optional
 
-from app.models import Task, User, TaskCategory
+from flask import current_app, has_app_context
+
+from app.models import ArchivedTask, Task, TaskRecord, User, TaskCategory
+from app.models.task import utcnow
+from app.repositories.archived_task_repository import ArchivedTaskRepository
 from app.repositories.task_category_repository import TaskCategoryRepository
 from app.repositories.task_repository import TaskRepository
-from app.utils import move_element_and_update_order
+from app.repositories.user_repository import UserRepository
+from app.utils import move_element_and_update_order, moved_element_order, move_coalescer, shard_router
 
 
 class TaskService:
@@ -18,9 +24,15 @@ class TaskService:
         - __init__(self): Constructor method initializing task repositories.
         - create_init_tasks(self, tasks_categories: list[TaskCategory], current_user: User) -> list[Task]: Creates and
           returns initial example tasks for each provided task category.
-        - get_all(self, category_id: Optional[str], current_user: User) -> list: Retrieves all tasks optionally filtered
-          by category ID.
-        - get_by_id(self, id: int, current_user: User) -> Task | None: Retrieves a task by its ID.
+        - get_all(self, category_id: Optional[str], current_user: User, query_args: Optional[dict] = None) -> list:
+          Retrieves all tasks optionally filtered by category ID and by filter and sort query arguments.
+        - get_all_records(self, category_id: Optional[str], current_user: User, query_args: Optional[dict] = None,
+          fields: Optional[tuple[str, ...]] = None) -> list[TaskRecord]: Same as get_all, as read-only records for
+          serialization.
+        - get_by_id(self, id: int, current_user: User, fields: Optional[tuple[str, ...]] = None) -> Task | None:
+          Retrieves a task by its ID.
+        - search(self, query: str, page: int, per_page: int, current_user: User, fields: Optional[tuple[str, ...]] =
+          None) -> tuple[list[Task], int]: Searches tasks by title and description through the full-text index.
         - create(self, title: str, description: str, order: int, category_id: str, current_user: User) -> Task: Creates
           a new task with the provided title, description, order, and category ID.
         - get_by_order(self, order: int, current_user: User): Retrieves a task by its order.
@@ -28,19 +40,38 @@ class TaskService:
           Optional[str], current_user: User) -> Task | None: Updates an existing task with the provided ID, title,
           description, order, and/or category ID.
         - delete(self, id: int, current_user: User) -> bool: Deletes a task with the provided ID.
+        - flush_pending_moves(current_user: User): Persists the coalesced moves of the user that are still buffered.
+        - archive(self, id: int, current_user: User) -> ArchivedTask | None: Moves a task to the archive.
+        - get_archived(self, query: Optional[str], page: int, per_page: int, current_user: User, fields:
+          Optional[tuple[str, ...]] = None) -> tuple[list[ArchivedTask], int]: Lists or searches the archived tasks.
+        - get_archived_by_id(self, id: int, current_user: User, fields: Optional[tuple[str, ...]] = None) ->
+          ArchivedTask | None: Retrieves an archived task.
+        - restore(self, id: int, category_id: Optional[str], current_user: User) -> Task | None: Moves an archived task
+          back to a board.
+        - archive_stale(self) -> int: Archives the completed tasks left untouched, following the archive policy.
 
         Attributes:
         - task_repository: An instance of TaskRepository for accessing task data.
         - task_category_repository: An instance of TaskCategoryRepository for accessing task category data.
+        - archived_task_repository: An instance of ArchivedTaskRepository for accessing archived task data.
 
         Note:
         - This class assumes the existence of a User instance for operations that require a current user.
         - The 'move_element_and_update_order' function is utilized within the 'update' method for reordering tasks.
+        - When TASK_MOVE_COALESCE_WINDOW_MS is set, updates that only change the order of a task are buffered by the
+          'move_coalescer' for that window and only the final position of a burst of moves is persisted. Every other
+          method flushes the buffered moves of the user first, so users read their own writes when served by the same
+          worker process (see MoveCoalescer). The response to a buffered move already holds the order and update time
+          the task gets once the move is persisted, unless another move of the same category is buffered after it.
+        - Archived tasks are kept out of the "task" table, so the boards and the task list only read active tasks.
+        - Every method adding, removing, moving or modifying a task updates the "task_count" and "tasks_updated_at"
+          counters of the categories involved in the same transaction, through 'update_task_count'.
     """
 
     def __init__(self):
         self.task_repository = TaskRepository()
         self.task_category_repository = TaskCategoryRepository()
+        self.archived_task_repository = ArchivedTaskRepository()
 
     def create_init_tasks(self, tasks_categories: list[TaskCategory], current_user: User) -> list[Task]:
         """
@@ -68,7 +99,7 @@ class TaskService:
             tasks_created.append(task)
         return tasks_created
 
-    def get_all(self, category_id: Optional[str], current_user: User) -> list:
+    def get_all(self, category_id: Optional[str], current_user: User, query_args: Optional[dict] = None) -> list:
         """
             Method: get_all
 
@@ -79,14 +110,46 @@ class TaskService:
             - category_id (Optional[str]): The ID of the task category to filter tasks by. If None, all tasks are
               retrieved.
             - current_user (User): The current user for whom the tasks are retrieved.
+            - query_args (Optional[dict]): Filter and sort query string arguments, pushed down to SQL (optional).
 
             Returns:
             list: A list containing all tasks retrieved from the repository.
+
+            Raises:
+            ValueError: If the query arguments are not valid.
+        """
+
+        self.flush_pending_moves(current_user)
+        return self.task_repository.get_all(category_id, current_user, query_args)
+
+    def get_all_records(self, category_id: Optional[str], current_user: User, query_args: Optional[dict] = None,
+                        fields: Optional[tuple[str, ...]] = None) -> list[TaskRecord]:
+        """
+            Method: get_all_records
+
+            Description:
+            Retrieves all tasks like get_all, as read-only records that are cheaper to load and serialize than Task
+            objects. Used by the list endpoints, which only serialize the tasks.
+
+            Parameters:
+            - category_id (Optional[str]): The ID of the task category to filter tasks by. If None, all tasks are
+              retrieved.
+            - current_user (User): The current user for whom the tasks are retrieved.
+            - query_args (Optional[dict]): Filter and sort query string arguments, pushed down to SQL (optional).
+            - fields (Optional[tuple[str, ...]]): The only fields to load, pushed down to SQL (optional, all of them by
+              default).
+
+            Returns:
+            list[TaskRecord]: A list containing all tasks retrieved from the repository.
+
+            Raises:
+            ValueError: If the query arguments are not valid.
         """
 
-        return self.task_repository.get_all(category_id, current_user)
+        self.flush_pending_moves(current_user)
+        return self.task_repository.get_all_records(category_id, current_user, query_args, fields)
 
-    def get_by_id(self, id: int, current_user: User) -> Task | None:
+    def get_by_id(self, id: int, current_user: User, fields: Optional[tuple[str, ...]] = None) -> Task | None:
         """
             Method: get_by_id
 
@@ -96,12 +159,39 @@ class TaskService:
             Parameters:
             - id (int): The ID of the task to retrieve.
             - current_user (User): The current user for whom the task is retrieved.
+            - fields (Optional[tuple[str, ...]]): The only fields to load, pushed down to SQL (optional, all of them by
+              default).
 
             Returns:
             Task | None: The task retrieved based on the provided ID. Returns None if no task is found.
         """
 
-        return self.task_repository.get_by_id(id, current_user)
+        self.flush_pending_moves(current_user)
+        return self.task_repository.get_by_id(id, current_user, fields)
+
+    def search(self, query: str, page: int, per_page: int, current_user: User,
+               fields: Optional[tuple[str, ...]] = None) -> tuple[list[Task], int]:
+        """
+            Method: search
+
+            Description:
+            Searches the tasks of the given current user by title and description. Results are ranked by relevance and
+            paginated.
+
+            Parameters:
+            - query (str): The free-text search query.
+            - page (int): The 1-based page of results to retrieve.
+            - per_page (int): The maximum number of results per page.
+            - current_user (User): The current user whose tasks are searched.
+            - fields (Optional[tuple[str, ...]]): The only fields to load, pushed down to SQL (optional, all of them by
+              default).
+
+            Returns:
+            tuple[list[Task], int]: The page of matching tasks, best match first, and the total number of matches.
+        """
+
+        self.flush_pending_moves(current_user)
+        return self.task_repository.search(query, page, per_page, current_user, fields)
 
     def create(self, title: str, description: str, order: int, category_id: str, current_user: User) -> Task:
         """
@@ -119,10 +209,17 @@ class TaskService:
 
             Returns:
             Task: The newly created task instance.
+
+            Raises:
+            ValueError: If the current user has no task category with the provided ID.
         """
 
-        category = self.task_category_repository.get_by_id(category_id, True, current_user)
-        task = Task(title=title, description=description, order=order, category_id=category.id, user_id=current_user.id)
+        self.flush_pending_moves(current_user)
+        category_id = self.task_category_repository.get_id_by_key(category_id, current_user)
+        if category_id is None:
+            raise ValueError("Task category not found")
+        task = Task(title=title, description=description, order=order, category_id=category_id, user_id=current_user.id)
+        self.task_category_repository.update_task_count(category_id, 1)
         self.task_repository.create(task)
         return task
 
@@ -141,6 +238,7 @@ class TaskService:
             Task: The task retrieved based on the provided order.
         """
 
+        self.flush_pending_moves(current_user)
         return self.task_repository.get_by_order(order, current_user)
 
     def update(self, id: int, title: Optional[str], description: Optional[str], order: Optional[int],
@@ -164,29 +262,130 @@ class TaskService:
             Task | None: The updated task instance if the update is successful. Returns None if no task is found.
         """
 
+        window_ms = current_app.config["TASK_MOVE_COALESCE_WINDOW_MS"]
+        if window_ms and order is not None and not (title or description or category_id):
+            task = self.task_repository.get_by_id(id, current_user)
+            if task is None:
+                return None
+
+            moved_at = utcnow()
+            move_coalescer.schedule(current_user.id, task.id, order, moved_at, window_ms / 1000,
+                                    self._apply_pending_moves_in_context(current_app._get_current_object()))
+            # The move is persisted later, with the order it will get in its category and the time it was received.
+            order = moved_element_order(self.task_category_repository.count_tasks(task.category_id), order)
+            return Task(id=task.id, title=task.title, description=task.description, order=order,
+                        category_id=task.category_id, user_id=task.user_id, updated_at=moved_at)
+
         task = self.get_by_id(id, current_user)
         if task is None:
             return None
 
+        updated_at = utcnow()
         task.title = title if title else task.title
         task.description = description if description else task.description
         if order is not None:
-            task_order_older = self.get_all(task.category_id, current_user)
-
-            task_order_reordered = move_element_and_update_order(task_order_older, task.id, order)
-
-            for row_task_category_order in task_order_reordered:
-                self.task_repository.update(row_task_category_order)
-                if row_task_category_order.id == task.id:
-                    task.order = row_task_category_order.order
+            self._move(task, order, updated_at, current_user)
 
         if category_id:
             category = self.task_category_repository.get_by_id(category_id, True, current_user)
+            if category.id != task.category_id:
+                self.task_category_repository.update_task_count(task.category_id, -1)
+                self.task_category_repository.update_task_count(category.id, 1)
             task.category_id = category.id
+        self.task_category_repository.update_task_count(task.category_id, 0)
 
+        task.updated_at = updated_at
         self.task_repository.update(task)
         return task
 
+    def _move(self, task: Task, order: int, moved_at: datetime, current_user: User):
+        """
+            Method: _move
+
+            Description:
+            Moves a task to a new order within its category and persists the new order of every task of the category.
+            Only the moved task is stamped (updated_at): the other tasks are renumbered, not modified.
+
+            Parameters:
+            - task (Task): The task to move.
+            - order (int): The new order of the task.
+            - moved_at (datetime): When the task was moved.
+            - current_user (User): The current user moving the task.
+        """
+
+        task_order_older = self.task_repository.get_all(task.category_id, current_user)
+        task.updated_at = moved_at
+
+        task_order_reordered = move_element_and_update_order(task_order_older, task.id, order)
+        self.task_category_repository.update_task_count(task.category_id, 0)
+
+        for row_task_category_order in task_order_reordered:
+            self.task_repository.update(row_task_category_order)
+            if row_task_category_order.id == task.id:
+                task.order = row_task_category_order.order
+
+    def _apply_pending_moves(self, user_id: int, moves: dict[int, tuple[int, datetime]]):
+        """
+            Method: _apply_pending_moves
+
+            Description:
+            Persists the buffered moves of a user, in the order they were last received. Moves of tasks deleted in the
+            meantime are skipped.
+
+            Parameters:
+            - user_id (int): The ID of the user who owns the tasks.
+            - moves (dict[int, tuple[int, datetime]]): The buffered moves, mapping task IDs to their new order and the
+              time of the move.
+        """
+
+        current_user = UserRepository().get_by_id(user_id)
+        if current_user is None:
+            return
+        shard_router.activate(current_user)
+
+        for task_id, (order, moved_at) in moves.items():
+            task = self.task_repository.get_by_id(task_id, current_user)
+            if task is not None:
+                self._move(task, order, moved_at, current_user)
+
+    def _apply_pending_moves_in_context(self, app):
+        """
+            Method: _apply_pending_moves_in_context
+
+            Description:
+            Wraps _apply_pending_moves so it can run outside of the request, from the flush timer, in an application
+            context of its own.
+
+            Parameters:
+            - app (Flask): The Flask application instance.
+
+            Returns:
+            Callable[[int, dict[int, tuple[int, datetime]]], None]: The wrapped function.
+        """
+
+        def apply(user_id: int, moves: dict[int, tuple[int, datetime]]):
+            if has_app_context():
+                self._apply_pending_moves(user_id, moves)
+                return
+            with app.app_context():
+                self._apply_pending_moves(user_id, moves)
+
+        return apply
+
+    def flush_pending_moves(self, current_user: User):
+        """
+            Method: flush_pending_moves
+
+            Description:
+            Persists the coalesced moves of the given current user that are still buffered, so what follows reads its
+            own writes.
+
+            Parameters:
+            - current_user (User): The current user whose buffered moves are persisted.
+        """
+
+        move_coalescer.flush(current_user.id)
+
     def delete(self, id: int, current_user: User) -> bool:
         """
             Method: delete
@@ -205,4 +404,120 @@ class TaskService:
         task = self.get_by_id(id, current_user)
         if not task:
             return False
+        self.task_category_repository.update_task_count(task.category_id, -1)
         return self.task_repository.delete(task.id)
+
+    def archive(self, id: int, current_user: User) -> ArchivedTask | None:
+        """
+            Method: archive
+
+            Description:
+            Moves a task with the provided ID for the given current user to the archive, out of its board.
+
+            Parameters:
+            - id (int): The ID of the task to archive.
+            - current_user (User): The current user archiving the task.
+
+            Returns:
+            ArchivedTask | None: The archived task. Returns None if no task is found.
+        """
+
+        task = self.get_by_id(id, current_user)
+        if task is None:
+            return None
+        self.task_category_repository.update_task_count(task.category_id, -1)
+        return self.archived_task_repository.archive(task)
+
+    def get_archived(self, query: Optional[str], page: int, per_page: int, current_user: User,
+                     fields: Optional[tuple[str, ...]] = None) -> tuple[list[ArchivedTask], int]:
+        """
+            Method: get_archived
+
+            Description:
+            Retrieves the archived tasks of the given current user, most recently archived first, optionally searched
+            by title and description, and paginated.
+
+            Parameters:
+            - query (Optional[str]): The free-text search query (optional).
+            - page (int): The 1-based page of results to retrieve.
+            - per_page (int): The maximum number of results per page.
+            - current_user (User): The current user whose archived tasks are retrieved.
+            - fields (Optional[tuple[str, ...]]): The only fields to load, pushed down to SQL (optional, all of them by
+              default).
+
+            Returns:
+            tuple[list[ArchivedTask], int]: The page of archived tasks and the total number of matches.
+        """
+
+        return self.archived_task_repository.get_all(query, page, per_page, current_user, fields)
+
+    def get_archived_by_id(self, id: int, current_user: User,
+                           fields: Optional[tuple[str, ...]] = None) -> ArchivedTask | None:
+        """
+            Method: get_archived_by_id
+
+            Description:
+            Retrieves an archived task by its ID for the given current user.
+
+            Parameters:
+            - id (int): The ID of the archived task to retrieve.
+            - current_user (User): The current user for whom the archived task is retrieved.
+            - fields (Optional[tuple[str, ...]]): The only fields to load, pushed down to SQL (optional, all of them by
+              default).
+
+            Returns:
+            ArchivedTask | None: The archived task. Returns None if no archived task is found.
+        """
+
+        return self.archived_task_repository.get_by_id(id, current_user, fields)
+
+    def restore(self, id: int, category_id: Optional[str], current_user: User) -> Task | None:
+        """
+            Method: restore
+
+            Description:
+            Moves an archived task back to the board of the given current user, at the end of the provided category or
+            of the category it was archived from.
+
+            Parameters:
+            - id (int): The ID of the archived task to restore.
+            - category_id (Optional[str]): The ID of the category to restore the task to (optional).
+            - current_user (User): The current user restoring the task.
+
+            Returns:
+            Task | None: The restored task. Returns None if no archived task is found.
+
+            Raises:
+            ValueError: If the category does not exist anymore.
+        """
+
+        archived_task = self.archived_task_repository.get_by_id(id, current_user)
+        if archived_task is None:
+            return None
+
+        self.flush_pending_moves(current_user)
+        category = self.task_category_repository.get_by_id(category_id or archived_task.category_id, True,
+                                                           current_user)
+        if category is None:
+            raise ValueError("Task category not found, provide the category_id to restore the task to")
+        self.task_category_repository.update_task_count(category.id, 1)
+        return self.archived_task_repository.restore(archived_task, category)
+
+    def archive_stale(self) -> int:
+        """
+            Method: archive_stale
+
+            Description:
+            Archives, for every user of the current shard, the tasks of the categories listed in
+            TASK_ARCHIVE_CATEGORIES that have not been updated for TASK_ARCHIVE_AFTER_DAYS days.
+
+            Returns:
+            int: The number of archived tasks (always 0 when TASK_ARCHIVE_AFTER_DAYS is 0).
+        """
+
+        after_days = current_app.config["TASK_ARCHIVE_AFTER_DAYS"]
+        if not after_days:
+            return 0
+        return self.archived_task_repository.archive_stale(current_app.config["TASK_ARCHIVE_CATEGORIES"],
+                                                           utcnow() - timedelta(days=after_days),
+                                                           current_app.config["TASK_ARCHIVE_BATCH_SIZE"])
@@ -0,0 +1,127 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+
+from app.models import RevokedToken
+from app.models.task import utcnow
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.utils.bloom_filter import BloomFilter
+
+# How far back, before its previous refresh, a worker process reloads the revocations, so a revocation committed after
+# a refresh that started later than its "revoked_at" (a slow transaction, a clock a little behind) is still loaded.
+REFRESH_OVERLAP_SECONDS = 60
+
+
+class TokenRevocationService:
+    """
+        Class: TokenRevocationService
+
+        Description:
+        This class provides the revocation of authentication tokens for the Todo-List API. Revoked token identifiers
+        ("jti" claim) are stored in the "revoked_token" table until the tokens expire, and every worker process mirrors
+        them in an in-memory Bloom filter. Checking a token only reads the filter; the table is only queried for the few
+        tokens the filter reports as possibly revoked (the revoked ones and about TOKEN_REVOCATION_FILTER_ERROR_RATE of
+        the others). The filter loads the tokens revoked since its previous refresh, minus REFRESH_OVERLAP_SECONDS, at
+        most every TOKEN_REVOCATION_REFRESH_SECONDS, so a token revoked through another worker process can be accepted
+        for up to that delay; revocations made by the worker itself apply at once. Once it holds more than
+        TOKEN_REVOCATION_FILTER_CAPACITY tokens, the filter is rebuilt from the tokens not expired yet. The expired
+        tokens are deleted by the jobs worker (see purge_expired), never on the request path.
+
+        Methods:
+        - revoke(self, token: dict): Revokes a decoded token.
+        - is_revoked(self, jti: str) -> bool: Tells whether a token is revoked.
+        - purge_expired(self): Deletes the revoked tokens that have expired.
+
+        Attributes:
+        - revoked_token_repository: An instance of RevokedTokenRepository for accessing revoked token data.
+    """
+
+    def __init__(self):
+        self.revoked_token_repository = RevokedTokenRepository()
+        self._lock = threading.Lock()
+        self._filter = None
+        self._loaded_at = None
+        self._refreshed_at = 0.0
+
+    def revoke(self, token: dict):
+        """
+            Method: revoke
+
+            Description:
+            Revokes a decoded token until it expires. Revoking a token twice does nothing.
+
+            Parameters:
+            - token (dict): The claims of the token, with its "jti", "id" and "exp".
+        """
+
+        if self.revoked_token_repository.get_by_name(token["jti"]) is None:
+            expires_at = datetime.fromtimestamp(token["exp"], timezone.utc).replace(tzinfo=None)
+            self.revoked_token_repository.create(RevokedToken(jti=token["jti"], user_id=token["id"],
+                                                              expires_at=expires_at))
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(token["jti"])
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+            Method: is_revoked
+
+            Description:
+            Tells whether a token is revoked, querying the revocation store only when the Bloom filter reports that it
+            may be.
+
+            Parameters:
+            - jti (str): The unique identifier of the token.
+
+            Returns:
+            bool: True if the token is revoked.
+        """
+
+        self._refresh()
+        revocations = self._filter
+        if revocations is not None and jti not in revocations:
+            return False
+        return self.revoked_token_repository.get_by_name(jti) is not None
+
+    def purge_expired(self):
+        """
+            Method: purge_expired
+
+            Description:
+            Deletes the revoked tokens that have expired, since their expiry rejects them anyway.
+        """
+
+        self.revoked_token_repository.delete(utcnow())
+
+    def _refresh(self):
+        config = current_app.config
+        if time.monotonic() - self._refreshed_at < config["TOKEN_REVOCATION_REFRESH_SECONDS"]:
+            return
+        if not self._lock.acquire(blocking=self._filter is None):
+            return
+
+        try:
+            now = utcnow()
+            if self._filter is None or self._filter.count > self._filter.capacity:
+                revocations = BloomFilter(config["TOKEN_REVOCATION_FILTER_CAPACITY"],
+                                          config["TOKEN_REVOCATION_FILTER_ERROR_RATE"])
+                jtis = self.revoked_token_repository.get_all(now)
+            else:
+                revocations = self._filter
+                jtis = self.revoked_token_repository.get_since(
+                    self._loaded_at - timedelta(seconds=REFRESH_OVERLAP_SECONDS))
+
+            for jti in jtis:
+                # The overlap loads some tokens again, which must not count twice towards the capacity.
+                if jti not in revocations:
+                    revocations.add(jti)
+            self._filter = revocations
+            self._loaded_at = now
+            self._refreshed_at = time.monotonic()
+        finally:
+            self._lock.release()
+
+
+token_revocation_service = TokenRevocationService()
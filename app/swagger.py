@@ -1,6 +1,33 @@
+import json
+import os
+
 from flask import Flask
 from flask_restx import Api
 from flask_swagger_ui import get_swaggerui_blueprint
+from werkzeug.utils import cached_property
+
+
+class PrebuiltSpecApi(Api):
+    """
+        Class: PrebuiltSpecApi
+
+        Description:
+        flask-restx API serving an OpenAPI document generated at build time ("flask openapi-dump") instead of rendering
+        it from the namespaces. Without a document, the API renders it as usual.
+
+        Attributes:
+        - prebuilt_spec (dict | None): The OpenAPI document served at "/swagger.json".
+    """
+
+    def __init__(self, *args, prebuilt_spec: dict | None = None, **kwargs):
+        self.prebuilt_spec = prebuilt_spec
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def __schema__(self):
+        if self.prebuilt_spec is not None:
+            return self.prebuilt_spec
+        return super().__schema__
 
 
 def create_swagger(app: Flask):
@@ -10,7 +37,12 @@ def create_swagger(app: Flask):
         Description:
         This function is responsible for setting up Swagger documentation for the Flask Todo-List API. It configures the
         Swagger UI blueprint, registers it with the Flask application, and sets up the necessary namespaces for API
-        endpoints related to authentication, task categories, and tasks.
+        endpoints related to authentication, task categories, tasks, and jobs.
+
+        The OpenAPI document itself is never rendered here. When the OPENAPI_SPEC_PATH setting points to a document
+        generated at build time by "flask openapi-dump", it is served as-is (see PrebuiltSpecApi); otherwise
+        flask-restx builds it once, on the first request to "/swagger.json", and caches it for the lifetime of the
+        worker.
 
         Parameters:
         - app (Flask): The Flask application instance to which Swagger documentation will be added.
@@ -18,7 +50,7 @@ def create_swagger(app: Flask):
         Returns:
         None
     """
-    from .routes import auth, task, task_category
+    from .routes import auth, job, task, task_category
     swagger_url = '/api/docs'
     api_url = '/api/swagger.json'
     swagger_ui_blueprint = get_swaggerui_blueprint(
@@ -29,8 +61,19 @@ def create_swagger(app: Flask):
         }
     )
     app.register_blueprint(swagger_ui_blueprint, url_prefix=swagger_url)
-    api = Api(app, title='API Flask Todo-List', version='1.0', description='The Documentation of API Flask Todo-List')
+
+    prebuilt_spec = None
+    spec_path = app.config.get("OPENAPI_SPEC_PATH")
+    if spec_path and os.path.isfile(spec_path):
+        with open(spec_path, encoding="utf-8") as file:
+            prebuilt_spec = json.load(file)
+
+    api = PrebuiltSpecApi(app, title='API Flask Todo-List', version='1.0',
+                          description='The Documentation of API Flask Todo-List', prebuilt_spec=prebuilt_spec)
 
     api.add_namespace(auth.api, path='/auth')
     api.add_namespace(task_category.api, path='/task-category')
     api.add_namespace(task.api, path='/task')
+    api.add_namespace(job.api, path='/job')
+
+    app.extensions["restx_api"] = api
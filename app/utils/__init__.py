@@ -1 +1,17 @@
-from .reordener import move_element_and_update_order
+from .reordener import move_element_and_update_order, moved_element_order
+from .search import (create_task_search_index, rebuild_task_search_index, tokenize_search_query,
+                     build_fts5_match_query, build_tsquery)
+from .query_filters import build_filter_criteria, build_sort_clauses
+from .move_coalescer import MoveCoalescer, move_coalescer
+from .sharding import DEFAULT_SHARD, ShardRouter, ShardedSession, shard_router
+from .single_flight import SingleFlight, single_flight
+from .bloom_filter import BloomFilter
+from .statement_monitor import init_statement_monitor
+from .statement_cache import StatementCache, cached_statement, init_statement_cache, statement_cache
+from .sqlite_profile import SQLiteWriter, init_sqlite_profile
+from .admission_control import AdmissionController
+from .cache import (Cache, CacheRegistry, MemcachedCacheBackend, MemoryCacheBackend, UwsgiCacheBackend, cache_registry,
+                    cached)
+from .fieldsets import (ARCHIVED_TASK_FIELDS, TASK_CATEGORY_FIELDS, TASK_FIELDS, nested_fields, own_fields,
+                        parse_fieldset)
+from .rate_limiter import MemoryBucketStore, RateLimiter, SharedMemoryBucketStore, rate_limiter
@@ -0,0 +1,46 @@
+import threading
+
+
+class AdmissionController:
+    """
+        Class: AdmissionController
+
+        Description:
+        Caps the number of requests a worker process serves at the same time, overall and per route class. The last
+        read_reserved slots can only be taken by the "read" class, so cheap reads are still served while expensive
+        operations saturate the worker. A request that finds no free slot is rejected at once instead of waiting.
+
+        Methods:
+        - acquire(self, route_class: str) -> bool: Takes a slot for a request of the route class, if one is free.
+        - release(self, route_class: str): Frees the slot of a finished request.
+
+        Attributes:
+        - max_in_flight (int): The maximum number of requests in flight.
+        - read_reserved (int): The number of slots only available to the "read" class.
+        - class_limits (dict[str, int]): The maximum number of requests in flight per route class (unlisted classes are
+          only bound by max_in_flight).
+        - in_flight (dict[str, int]): The number of requests in flight per route class.
+    """
+
+    def __init__(self, max_in_flight: int, read_reserved: int, class_limits: dict[str, int]):
+        self.max_in_flight = max_in_flight
+        self.read_reserved = min(read_reserved, max_in_flight)
+        self.class_limits = class_limits
+        self.in_flight: dict[str, int] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, route_class: str) -> bool:
+        capacity = self.max_in_flight if route_class == "read" else self.max_in_flight - self.read_reserved
+        with self._lock:
+            in_flight = self.in_flight.get(route_class, 0)
+            if self._total >= capacity or in_flight >= self.class_limits.get(route_class, capacity):
+                return False
+            self.in_flight[route_class] = in_flight + 1
+            self._total += 1
+            return True
+
+    def release(self, route_class: str):
+        with self._lock:
+            self.in_flight[route_class] -= 1
+            self._total -= 1
@@ -0,0 +1,41 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+        Class: BloomFilter
+
+        Description:
+        Compact probabilistic set of strings. Membership tests never miss an added item, and wrongly report an item that
+        was not added with a probability of about error_rate as long as at most capacity items have been added. Two
+        64-bit halves of a BLAKE2b digest are combined into the bit positions (double hashing).
+
+        Methods:
+        - add(self, item: str): Adds an item.
+        - __contains__(self, item: str) -> bool: Tells whether the item may have been added.
+
+        Attributes:
+        - capacity (int): The number of items the filter is sized for.
+        - count (int): The number of items added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.count = 0
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((first + index * second) % self._size for index in range(self._hashes))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
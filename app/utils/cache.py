@@ -0,0 +1,431 @@
+import hashlib
+import pickle
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Iterable
+
+from flask import current_app, has_app_context
+
+TAG_PREFIX = "tag:"
+
+
+class MemoryCacheBackend:
+    """
+        Class: MemoryCacheBackend
+
+        Description:
+        Least recently used cache in the memory of the worker process, bounded both by its number of entries and by the
+        size of their keys and values in bytes. Every worker process has its own copy.
+
+        Methods:
+        - get(self, key: str) -> bytes | None: Returns the value of a key, None if it is missing or expired.
+        - set(self, key: str, value: bytes, ttl: float | None): Stores a value, for ttl seconds (None keeps it until it
+          is evicted).
+        - delete(self, key: str): Removes a key.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: float | None):
+        if len(key) + len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl if ttl else None)
+            self.size += len(key) + len(value)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key: str):
+        value, _ = self._entries.pop(key)
+        self.size -= len(key) + len(value)
+
+
+class UwsgiCacheBackend:
+    """
+        Class: UwsgiCacheBackend
+
+        Description:
+        Cache shared by the worker processes of a uWSGI instance, in the shared memory of the uWSGI caching framework.
+        Its number of entries and their size are set when declaring the cache, e.g.
+        "--cache2 name=todo,items=10000,blocksize=4096". Only available when the application runs under uWSGI.
+
+        Methods:
+        - get(self, key: str) -> bytes | None: Returns the value of a key, None if it is missing or expired.
+        - set(self, key: str, value: bytes, ttl: float | None): Stores a value, for ttl seconds (None keeps it until it
+          is evicted).
+        - delete(self, key: str): Removes a key.
+    """
+
+    def __init__(self, name: str):
+        try:
+            import uwsgi
+        except ImportError as error:
+            raise RuntimeError("CACHE_BACKEND 'uwsgi' requires running the application under uWSGI") from error
+        self._uwsgi = uwsgi
+        self.name = name
+
+    def get(self, key: str) -> bytes | None:
+        return self._uwsgi.cache_get(key, self.name)
+
+    def set(self, key: str, value: bytes, ttl: float | None):
+        self._uwsgi.cache_update(key, value, int(ttl or 0), self.name)
+
+    def delete(self, key: str):
+        self._uwsgi.cache_del(key, self.name)
+
+
+class MemcachedCacheBackend:
+    """
+        Class: MemcachedCacheBackend
+
+        Description:
+        Cache kept by a local key-value server speaking the memcached text protocol (memcached, or a compatible server),
+        shared by every process of the host that connects to it. Each thread keeps its own connection. Server errors
+        are treated as misses, so an unavailable server only disables the cache.
+
+        Methods:
+        - get(self, key: str) -> bytes | None: Returns the value of a key, None if it is missing, expired or if the
+          server is unavailable.
+        - set(self, key: str, value: bytes, ttl: float | None): Stores a value, for ttl seconds (None keeps it until it
+          is evicted).
+        - delete(self, key: str): Removes a key.
+    """
+
+    TIMEOUT_SECONDS = 0.25
+
+    def __init__(self, address: str):
+        host, _, port = address.rpartition(":")
+        self.address = (host or "127.0.0.1", int(port))
+        self._local = threading.local()
+
+    @staticmethod
+    def _server_key(key: str) -> bytes:
+        encoded = key.encode()
+        if len(encoded) > 200 or any(byte <= 32 or byte == 127 for byte in encoded):
+            return b"h:" + hashlib.sha256(encoded).hexdigest().encode()
+        return encoded
+
+    @staticmethod
+    def _line_received(response: bytes) -> bool:
+        return response.endswith(b"\r\n")
+
+    @staticmethod
+    def _value_received(response: bytes) -> bool:
+        header, separator, rest = response.partition(b"\r\n")
+        if not separator:
+            return False
+        if not header.startswith(b"VALUE "):
+            return True
+        return len(rest) >= int(header.split()[3]) + len(b"\r\nEND\r\n")
+
+    def _call(self, command: bytes, received: Callable[[bytes], bool]) -> bytes | None:
+        try:
+            connection = getattr(self._local, "connection", None)
+            if connection is None:
+                connection = self._local.connection = socket.create_connection(self.address, self.TIMEOUT_SECONDS)
+            connection.sendall(command)
+            response = b""
+            while not received(response):
+                chunk = connection.recv(65536)
+                if not chunk:
+                    raise OSError("Connection closed by the cache server")
+                response += chunk
+            return response
+        except (OSError, ValueError, IndexError):
+            connection = getattr(self._local, "connection", None)
+            if connection is not None:
+                connection.close()
+            self._local.connection = None
+            return None
+
+    def get(self, key: str) -> bytes | None:
+        response = self._call(b"get " + self._server_key(key) + b"\r\n", self._value_received)
+        if not response or not response.startswith(b"VALUE "):
+            return None
+        header, _, rest = response.partition(b"\r\n")
+        return rest[:int(header.split()[3])]
+
+    def set(self, key: str, value: bytes, ttl: float | None):
+        self._call(b"set %s 0 %d %d\r\n%s\r\n" % (self._server_key(key), int(ttl or 0), len(value), value),
+                   self._line_received)
+
+    def delete(self, key: str):
+        self._call(b"delete " + self._server_key(key) + b"\r\n", self._line_received)
+
+
+class Cache:
+    """
+        Class: Cache
+
+        Description:
+        Caches Python values, pickled, in a pluggable backend ("memory", "uwsgi" or "memcached", see CACHE_BACKEND).
+        Values are copies: mutating a value read from the cache does not change the cached one.
+
+        Entries can be tagged, and invalidating a tag drops every entry tagged with it, in every process sharing the
+        backend. Each tag has a version stored in the backend itself; entries record the versions their tags had
+        before the value was loaded (see tag_versions), and are ignored once a tag has moved on (or was evicted). A
+        value loaded while one of its tags is invalidated is thus never served.
+
+        The hits, misses, stores and invalidations of the process are counted (see stats).
+
+        Methods:
+        - get(self, key: str) -> tuple[bool, Any]: Looks a key up.
+        - tag_versions(self, tags: Iterable[str]) -> dict[str, bytes]: The current versions of tags.
+        - set(self, key: str, value: Any, ttl: float | None = None, tags: Iterable[str] = (), versions: dict = None):
+          Stores a value.
+        - delete(self, key: str): Removes a key.
+        - invalidate(self, *tags: str): Drops the entries tagged with any of the tags.
+        - stats(self) -> dict: The statistics of the process.
+    """
+
+    def __init__(self, backend, prefix: str = ""):
+        self.backend = backend
+        self.prefix = prefix
+        self.counters = {"hits": 0, "misses": 0, "sets": 0, "invalidations": 0}
+
+    def _count(self, name: str):
+        self.counters[name] += 1
+
+    def _tag_versions(self, tags: Iterable[str], create: bool) -> dict[str, bytes | None]:
+        versions = {}
+        for tag in tags:
+            version = self.backend.get(self.prefix + TAG_PREFIX + tag)
+            if version is None and create:
+                version = uuid.uuid4().bytes
+                self.backend.set(self.prefix + TAG_PREFIX + tag, version, None)
+            versions[tag] = version
+        return versions
+
+    def tag_versions(self, tags: Iterable[str]) -> dict[str, bytes]:
+        """
+            Method: tag_versions
+
+            Description:
+            Reads the current versions of tags, creating the missing ones. Read before loading a value, and passed to
+            set, they make the value stale if one of the tags is invalidated while it is being loaded.
+
+            Parameters:
+            - tags (Iterable[str]): The tags.
+
+            Returns:
+            dict[str, bytes]: The tags mapped to their version.
+        """
+        return self._tag_versions(tags, create=True)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+            Method: get
+
+            Description:
+            Looks a key up.
+
+            Parameters:
+            - key (str): The key.
+
+            Returns:
+            tuple[bool, Any]: Whether the key was found, and its value.
+        """
+        data = self.backend.get(self.prefix + key)
+        if data is not None:
+            value, versions = pickle.loads(data)
+            if not versions or self._tag_versions(versions, create=False) == versions:
+                self._count("hits")
+                return True, value
+        self._count("misses")
+        return False, None
+
+    def set(self, key: str, value: Any, ttl: float | None = None, tags: Iterable[str] = (), versions: dict = None):
+        """
+            Method: set
+
+            Description:
+            Stores a value.
+
+            Parameters:
+            - key (str): The key.
+            - value (Any): The value, which must be picklable.
+            - ttl (float | None): How long the value is kept, in seconds (None keeps it until it is evicted or
+              invalidated).
+            - tags (Iterable[str]): The tags of the entry (optional).
+            - versions (dict[str, bytes]): The versions of the tags read before the value was loaded (see
+              tag_versions). Read now by default, which suits values that cannot be stale.
+        """
+        if versions is None:
+            versions = self.tag_versions(tags)
+        data = pickle.dumps((value, versions), pickle.HIGHEST_PROTOCOL)
+        self.backend.set(self.prefix + key, data, ttl)
+        self._count("sets")
+
+    def delete(self, key: str):
+        """
+            Method: delete
+
+            Description:
+            Removes a key.
+
+            Parameters:
+            - key (str): The key.
+        """
+        self.backend.delete(self.prefix + key)
+
+    def invalidate(self, *tags: str):
+        """
+            Method: invalidate
+
+            Description:
+            Drops the entries tagged with any of the tags, by moving the tags to a new version.
+
+            Parameters:
+            - tags (str): The tags.
+        """
+        for tag in tags:
+            self.backend.set(self.prefix + TAG_PREFIX + tag, uuid.uuid4().bytes, None)
+            self._count("invalidations")
+
+    def stats(self) -> dict:
+        """
+            Method: stats
+
+            Description:
+            Returns the statistics of the cache in the current process.
+
+            Returns:
+            dict: The hits, misses, stores ("sets") and tag invalidations, the hit rate, and for the "memory" backend
+            its number of entries, size in bytes and evictions.
+        """
+        stats = dict(self.counters)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        if isinstance(self.backend, MemoryCacheBackend):
+            stats.update(entries=len(self.backend._entries), bytes=self.backend.size,
+                         evictions=self.backend.evictions)
+        return stats
+
+
+class CacheRegistry:
+    """
+        Class: CacheRegistry
+
+        Description:
+        Gives access to the cache of the process, created on first use from the configuration of the application
+        (CACHE_BACKEND, CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_UWSGI_NAME, CACHE_SERVER_ADDRESS and
+        CACHE_KEY_PREFIX). The cache is None when CACHE_BACKEND is "none".
+
+        Methods:
+        - get(self) -> Cache | None: The cache of the process.
+        - invalidate(self, *tags: str): Drops the entries tagged with any of the tags, if there is a cache.
+    """
+
+    def __init__(self):
+        self._cache = None
+        self._configured = False
+        self._lock = threading.Lock()
+
+    def get(self) -> Cache | None:
+        if not self._configured:
+            with self._lock:
+                if not self._configured:
+                    self._cache = self._create(current_app.config)
+                    self._configured = True
+        return self._cache
+
+    @staticmethod
+    def _create(config) -> Cache | None:
+        backend = config["CACHE_BACKEND"]
+        if backend == "none":
+            return None
+        if backend == "memory":
+            return Cache(MemoryCacheBackend(config["CACHE_MAX_ENTRIES"], config["CACHE_MAX_BYTES"]),
+                         config["CACHE_KEY_PREFIX"])
+        if backend == "uwsgi":
+            return Cache(UwsgiCacheBackend(config["CACHE_UWSGI_NAME"]), config["CACHE_KEY_PREFIX"])
+        if backend == "memcached":
+            return Cache(MemcachedCacheBackend(config["CACHE_SERVER_ADDRESS"]), config["CACHE_KEY_PREFIX"])
+        raise ValueError(f"Unsupported CACHE_BACKEND '{backend}', expected 'memory', 'uwsgi', 'memcached' or 'none'")
+
+    def invalidate(self, *tags: str):
+        if not has_app_context():
+            return
+        cache = self.get()
+        if cache is not None:
+            cache.invalidate(*tags)
+
+
+cache_registry = CacheRegistry()
+
+
+def cached(namespace: str, ttl_setting: str, key: Callable[..., Any], tags: Callable[..., Iterable[str]] = None,
+           restore: Callable[[Any], Any] = None):
+    """
+        Function: cached
+
+        Description:
+        Decorator caching the results of a method, typically a repository method, by the key built from its arguments.
+        None results are not cached, so a lookup that finds nothing is retried the next time. The versions of the tags
+        are read before the method runs, so a result loaded while one of its tags is invalidated is never served.
+
+        Parameters:
+        - namespace (str): Prefix of the keys of the method.
+        - ttl_setting (str): Name of the setting holding how long the results are kept, in seconds (0 disables the
+          cache of the method).
+        - key (Callable[..., Any]): Builds the key from the arguments of the method; the repr of its result is used.
+        - tags (Callable[..., Iterable[str]]): Builds the tags of the entry from the arguments of the method (optional).
+        - restore (Callable[[Any], Any]): Prepares a cached value before returning it, e.g. attaches an ORM object to
+          the session (optional).
+
+        Returns:
+        The decorator.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            ttl = current_app.config[ttl_setting]
+            cache = cache_registry.get() if ttl else None
+            if cache is None:
+                return f(*args, **kwargs)
+
+            cache_key = f"{namespace}:{key(*args, **kwargs)!r}"
+            hit, value = cache.get(cache_key)
+            if hit:
+                return restore(value) if restore else value
+
+            # The versions are read before the value is loaded, so an invalidation in the meantime makes it stale.
+            versions = cache.tag_versions(tags(*args, **kwargs) if tags else ())
+            value = f(*args, **kwargs)
+            if value is not None:
+                cache.set(cache_key, value, ttl, versions=versions)
+            return value
+
+        return wrapper
+
+    return decorator
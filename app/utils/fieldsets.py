@@ -0,0 +1,85 @@
+TASK_FIELDS = ("id", "title", "description", "order", "category_id", "user_id", "updated_at")
+ARCHIVED_TASK_FIELDS = ("id", "task_id", "title", "description", "order", "category_id", "user_id", "updated_at",
+                        "archived_at")
+TASK_CATEGORY_FIELDS = ("id", "title", "order", "user_id", "tasks")
+
+
+def parse_fieldset(value, allowed: tuple[str, ...], nested: dict[str, tuple[str, ...]] = None) -> tuple | None:
+    """
+        Function: parse_fieldset
+
+        Description:
+        Parses a "fields" query string argument (sparse fieldset) such as "id,title,order". Fields of related objects
+        are selected as "<relation>.<field>", e.g. "tasks.title", and the relation alone selects all of their fields.
+
+        Parameters:
+        - value: The comma separated field names (or a sequence of them), or None.
+        - allowed (tuple[str, ...]): The fields that can be selected.
+        - nested (dict[str, tuple[str, ...]]): The fields that can be selected for each relation (optional).
+
+        Returns:
+        tuple | None: The selected field names, without duplicates, or None (all the fields) if value is None.
+
+        Raises:
+        ValueError: If a field is unknown or no field is selected.
+    """
+    if value is None:
+        return None
+    names = value.split(",") if isinstance(value, str) else value
+
+    fields = []
+    for name in (str(name).strip() for name in names):
+        relation, _, field = name.partition(".")
+        if not name or name in fields:
+            continue
+        if field and field not in (nested or {}).get(relation, ()):
+            raise ValueError(f"Unknown field '{name}'")
+        if not field and name not in allowed:
+            raise ValueError(f"Unknown field '{name}', expected some of: {', '.join(allowed)}")
+        fields.append(name)
+    if not fields:
+        raise ValueError("At least one field must be selected")
+    return tuple(fields)
+
+
+def own_fields(fields: tuple | None, allowed: tuple[str, ...]) -> tuple[str, ...]:
+    """
+        Function: own_fields
+
+        Description:
+        Returns the fields of the object itself selected by a fieldset, a relation counting as selected when some of
+        its fields are.
+
+        Parameters:
+        - fields (tuple | None): The fieldset, as returned by parse_fieldset.
+        - allowed (tuple[str, ...]): All the fields of the object, in their serialization order.
+
+        Returns:
+        tuple[str, ...]: The selected fields, in their serialization order.
+    """
+    if fields is None:
+        return allowed
+    selected = {name.partition(".")[0] for name in fields}
+    return tuple(name for name in allowed if name in selected)
+
+
+def nested_fields(fields: tuple | None, relation: str, allowed: tuple[str, ...]) -> tuple[str, ...] | None:
+    """
+        Function: nested_fields
+
+        Description:
+        Returns the fields of the related objects selected by a fieldset.
+
+        Parameters:
+        - fields (tuple | None): The fieldset, as returned by parse_fieldset.
+        - relation (str): The name of the relation, e.g. "tasks".
+        - allowed (tuple[str, ...]): All the fields of the related objects, in their serialization order.
+
+        Returns:
+        tuple[str, ...] | None: All the fields when the relation itself is selected (or there is no fieldset), the
+        "<relation>.<field>" ones otherwise, or None when the relation is not selected at all.
+    """
+    if fields is None or relation in fields:
+        return allowed
+    selected = {name.partition(".")[2] for name in fields if name.startswith(f"{relation}.")}
+    return tuple(name for name in allowed if name in selected) or None
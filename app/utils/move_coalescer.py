@@ -0,0 +1,121 @@
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable
+
+logger = logging.getLogger("app.move_coalescer")
+
+
+class MoveCoalescer:
+    """
+        Class: MoveCoalescer
+
+        Description:
+        Buffers the order updates ("moves") of tasks per user so that a burst of moves of the same task, such as the
+        successive PUT requests sent while a card is dragged, is persisted once, at its final position. The first
+        buffered move of a user arms a timer; when the window elapses, or as soon as the user reads or writes tasks
+        again, the buffered moves are applied in the order they were last received, each with the time it was received
+        at.
+
+        The buffer lives in the memory of the worker process, so moves are only coalesced with moves received by the
+        same worker, and only the reads served by that worker flush them: coalescing is meant for a single worker
+        process running Python threads (uWSGI "--enable-threads"), without which the timer never fires. Moves whose
+        flush fails are kept, and logged when the timer flushed them, so the next flush retries them.
+
+        Methods:
+        - schedule(self, user_id, task_id, order, moved_at, window_seconds, apply): Buffers a move and arms the flush
+          timer.
+        - flush(self, user_id): Applies the buffered moves of a user right away.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._user_locks: dict[int, list] = {}
+        self._pending: dict[int, dict[int, tuple[int, datetime]]] = {}
+        self._appliers: dict[int, Callable[[int, dict[int, tuple[int, datetime]]], None]] = {}
+        self._timers: dict[int, threading.Timer] = {}
+
+    @contextmanager
+    def _user_lock(self, user_id: int):
+        """
+            Holds the lock of a user. The locks are counted by their holders and waiters, and dropped once unused, so
+            one is only kept per user being served.
+        """
+        with self._lock:
+            entry = self._user_locks.setdefault(user_id, [threading.RLock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._user_locks[user_id]
+
+    def schedule(self, user_id: int, task_id: int, order: int, moved_at: datetime, window_seconds: float,
+                 apply: Callable[[int, dict[int, tuple[int, datetime]]], None]):
+        """
+            Method: schedule
+
+            Description:
+            Buffers the move of a task to a new order, replacing any buffered move of the same task, and arms the flush
+            timer of the user if it is not armed yet.
+
+            Parameters:
+            - user_id (int): The ID of the user who owns the task.
+            - task_id (int): The ID of the moved task.
+            - order (int): The new order of the task.
+            - moved_at (datetime): When the move was received, persisted as the update time of the task.
+            - window_seconds (float): The coalescing window, counted from the first buffered move of the user.
+            - apply (Callable[[int, dict[int, tuple[int, datetime]]], None]): Called with the user ID and the buffered
+              moves (task ID to order and time of the move) when they are flushed.
+        """
+        with self._user_lock(user_id):
+            moves = self._pending.setdefault(user_id, {})
+            moves.pop(task_id, None)
+            moves[task_id] = (order, moved_at)
+            self._appliers[user_id] = apply
+
+            if user_id not in self._timers:
+                timer = threading.Timer(window_seconds, self._flush_on_timer, args=(user_id,))
+                timer.daemon = True
+                self._timers[user_id] = timer
+                timer.start()
+
+    def flush(self, user_id: int):
+        """
+            Method: flush
+
+            Description:
+            Applies the buffered moves of a user right away and disarms the flush timer. Concurrent calls for the same
+            user are serialized, so a caller never observes the database while buffered moves are being applied. If
+            they cannot be applied, they are buffered again for the next flush and the error is raised.
+
+            Parameters:
+            - user_id (int): The ID of the user whose moves are flushed.
+        """
+        with self._user_lock(user_id):
+            moves = self._pending.pop(user_id, None)
+            apply = self._appliers.pop(user_id, None)
+            timer = self._timers.pop(user_id, None)
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            if not moves:
+                return
+            try:
+                apply(user_id, moves)
+            except Exception:
+                self._pending[user_id] = moves
+                self._appliers[user_id] = apply
+                raise
+
+    def _flush_on_timer(self, user_id: int):
+        try:
+            self.flush(user_id)
+        except Exception:
+            logger.exception("Could not apply the buffered task moves of user %s, kept for the next flush", user_id)
+
+
+move_coalescer = MoveCoalescer()
@@ -0,0 +1,112 @@
+FILTER_OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "in": lambda column, value: column.in_(value),
+    "prefix": lambda column, value: column.startswith(value, autoescape=True),
+    "isnull": lambda column, value: column.is_(None) if value else column.is_not(None),
+}
+
+MAX_IN_VALUES = 100
+
+
+def _convert_value(column, operator: str, raw_value: str, convert=None):
+    if operator == "isnull":
+        if raw_value.lower() not in ("true", "false"):
+            raise ValueError(f"'{column.key}__isnull' must be 'true' or 'false'")
+        return raw_value.lower() == "true"
+
+    python_type = column.type.python_type
+    if operator == "prefix" and python_type is not str:
+        raise ValueError(f"'{column.key}' does not support prefix matching")
+
+    values = raw_value.split(",") if operator == "in" else [raw_value]
+    if len(values) > MAX_IN_VALUES:
+        raise ValueError(f"'{column.key}__in' accepts at most {MAX_IN_VALUES} values")
+    try:
+        converted = [(convert or python_type)(value) for value in values]
+    except ValueError:
+        raise ValueError(f"Invalid value for '{column.key}': {raw_value!r}") from None
+
+    return converted if operator == "in" else converted[0]
+
+
+def build_filter_criteria(args, filterable_columns: dict) -> list:
+    """
+        Function: build_filter_criteria
+
+        Description:
+        Translates query string arguments into SQL criteria, using only the columns of the provided whitelist. An
+        argument is either "<field>=<value>" (equality) or "<field>__<operator>=<value>", where operator is one of eq,
+        ne, lt, lte, gt, gte, in (comma separated list), prefix and isnull (true/false). Arguments whose field is not
+        whitelisted are ignored, unless they use the operator syntax, in which case they are rejected.
+
+        Values are converted to the Python type of the column, unless the whitelist gives a converter along with the
+        column, as a (column, converter) tuple. A converter takes the raw value and returns the value compared with
+        the column, or raises ValueError.
+
+        Parameters:
+        - args (Mapping[str, str]): The query string arguments (e.g. request.args).
+        - filterable_columns (dict): The whitelist, mapping public field names to model columns (or to (column,
+          converter) tuples).
+
+        Returns:
+        list: The SQLAlchemy criteria to apply with "filter".
+
+        Raises:
+        ValueError: If a field, operator or value is not valid.
+    """
+    criteria = []
+    for key, raw_value in args.items():
+        field, _, operator = key.partition("__")
+        if field not in filterable_columns:
+            if operator:
+                raise ValueError(f"Unknown filter field '{field}'")
+            continue
+
+        operator = operator or "eq"
+        if operator not in FILTER_OPERATORS:
+            raise ValueError(f"Unknown filter operator '{operator}'")
+
+        column, convert = filterable_columns[field], None
+        if isinstance(column, tuple):
+            column, convert = column
+        criteria.append(FILTER_OPERATORS[operator](column, _convert_value(column, operator, raw_value, convert)))
+    return criteria
+
+
+def build_sort_clauses(sort: str | None, sortable_columns: dict, default: list) -> list:
+    """
+        Function: build_sort_clauses
+
+        Description:
+        Translates a "sort" query string argument such as "-order,title" into ORDER BY clauses, using only the columns
+        of the provided whitelist. A leading "-" sorts the field in descending order.
+
+        Parameters:
+        - sort (str | None): The comma separated sort keys, or None to use the default.
+        - sortable_columns (dict): The whitelist, mapping public field names to model columns.
+        - default (list): The ORDER BY clauses used when no sort is given.
+
+        Returns:
+        list: The SQLAlchemy ORDER BY clauses.
+
+        Raises:
+        ValueError: If a sort field is not valid.
+    """
+    if not sort:
+        return default
+
+    clauses = []
+    for key in sort.split(","):
+        key = key.strip()
+        descending = key.startswith("-")
+        field = key.lstrip("-+")
+        if field not in sortable_columns:
+            raise ValueError(f"Unknown sort field '{field}'")
+        column = sortable_columns[field]
+        clauses.append(column.desc() if descending else column.asc())
+    return clauses
@@ -0,0 +1,182 @@
+import fcntl
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+
+def take_token(tokens: float, updated_at: float, now: float, rate: float, burst: float) -> tuple[float, float]:
+    """
+        Function: take_token
+
+        Description:
+        Refills a token bucket for the time elapsed since its last update, then takes a token from it if one is left.
+
+        Parameters:
+        - tokens (float): The tokens left in the bucket at its last update.
+        - updated_at (float): The time of its last update (seconds since the epoch).
+        - now (float): The current time (seconds since the epoch).
+        - rate (float): The number of tokens added per second.
+        - burst (float): The capacity of the bucket.
+
+        Returns:
+        tuple[float, float]: The tokens left in the bucket, and 0 if a token was taken or else the number of seconds
+        until one is available.
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated_at) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate
+
+
+class MemoryBucketStore:
+    """
+        Class: MemoryBucketStore
+
+        Description:
+        Keeps the token buckets in the memory of the worker process, so every worker process enforces the limits on its
+        own. Once more than max_keys are kept, the least recently updated bucket is dropped, and simply considered full
+        again, which keeps every call O(1) whatever the limits of the buckets.
+
+        Methods:
+        - take(self, key: str, rate: float, burst: float) -> float: Takes a token from the bucket of a key.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, burst: float) -> float:
+        now = time.time()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens, wait = take_token(tokens, updated_at, now, rate, burst)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class SharedMemoryBucketStore:
+    """
+        Class: SharedMemoryBucketStore
+
+        Description:
+        Keeps the token buckets in a file mapped in memory by every worker process of the host, ideally on a memory
+        filesystem such as /dev/shm, so the limits apply to the host as a whole. The file is a fixed hash table of
+        slots (key hash, tokens, update time); a key goes to the first of PROBES slots from its hash that is free or
+        holds it, or else replaces the least recently updated one. A bucket evicted that way is simply considered full
+        again. Updates are serialized by a lock on the file (between processes) and a thread lock (within a process).
+
+        Methods:
+        - take(self, key: str, rate: float, burst: float) -> float: Takes a token from the bucket of a key.
+    """
+
+    SLOT = struct.Struct("<Qdd")
+    PROBES = 4
+
+    def __init__(self, path: str, slots: int):
+        self.path = path
+        self.slots = slots
+        self._lock = threading.Lock()
+        self._file = None
+        self._map = None
+
+    def _open(self):
+        size = self.slots * self.SLOT.size
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._file).st_size < size:
+            os.ftruncate(self._file, size)
+        self._map = mmap.mmap(self._file, size)
+
+    def take(self, key: str, rate: float, burst: float) -> float:
+        key_hash = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") | 1
+        first = key_hash % self.slots
+        now = time.time()
+
+        with self._lock:
+            if self._map is None:
+                self._open()
+            fcntl.lockf(self._file, fcntl.LOCK_EX)
+            try:
+                slot, tokens, updated_at = None, burst, now
+                oldest, oldest_updated_at = first, math.inf
+                for probe in range(self.PROBES):
+                    index = (first + probe) % self.slots
+                    slot_hash, slot_tokens, slot_updated_at = self.SLOT.unpack_from(self._map, index * self.SLOT.size)
+                    if slot_hash == key_hash:
+                        slot, tokens, updated_at = index, slot_tokens, slot_updated_at
+                        break
+                    if slot_hash == 0:
+                        slot = index
+                        break
+                    if slot_updated_at < oldest_updated_at:
+                        oldest, oldest_updated_at = index, slot_updated_at
+
+                tokens, wait = take_token(tokens, updated_at, now, rate, burst)
+                self.SLOT.pack_into(self._map, (oldest if slot is None else slot) * self.SLOT.size, key_hash, tokens,
+                                    now)
+            finally:
+                fcntl.lockf(self._file, fcntl.LOCK_UN)
+        return wait
+
+
+class RateLimiter:
+    """
+        Class: RateLimiter
+
+        Description:
+        Token-bucket rate limiter: every key (a user or a client IP address) gets a bucket of "burst" tokens, refilled
+        at "rate" tokens per second, and each request takes a token. The buckets live in the shared memory file
+        RATE_LIMIT_SHARED_PATH when it is set, so the limits apply across the worker processes of the host, or else in
+        the memory of each worker process.
+
+        Methods:
+        - retry_after(self, key: str, rate: float, burst: float) -> float: Takes a token for a request, telling how long
+          to wait when none is left.
+    """
+
+    def __init__(self):
+        self._store = None
+        self._lock = threading.Lock()
+
+    def _get_store(self):
+        if self._store is None:
+            with self._lock:
+                if self._store is None:
+                    config = current_app.config
+                    if config["RATE_LIMIT_SHARED_PATH"]:
+                        self._store = SharedMemoryBucketStore(config["RATE_LIMIT_SHARED_PATH"],
+                                                              config["RATE_LIMIT_SHARED_SLOTS"])
+                    else:
+                        self._store = MemoryBucketStore(config["RATE_LIMIT_SHARED_SLOTS"])
+        return self._store
+
+    def retry_after(self, key: str, rate: float, burst: float) -> float:
+        """
+            Method: retry_after
+
+            Description:
+            Takes a token from the bucket of the key for a request.
+
+            Parameters:
+            - key (str): Identifies the bucket, e.g. "user:42" or "ip:203.0.113.7".
+            - rate (float): The number of tokens added per second.
+            - burst (float): The capacity of the bucket.
+
+            Returns:
+            float: 0 if the request is allowed, or else the number of seconds until it would be.
+        """
+        return self._get_store().take(key, rate, burst)
+
+
+rate_limiter = RateLimiter()
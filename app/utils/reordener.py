@@ -32,3 +32,25 @@ def move_element_and_update_order(lst, element_id, new_order):
         item.order = i
 
     return lst
+
+
+def moved_element_order(length, new_order):
+    """
+        Function: moved_element_order
+
+        Description:
+        This function returns the 'order' that move_element_and_update_order gives to the moved element of a list of
+        'length' elements, without the list: 'new_order' is clamped to the list the way list.insert clamps its index,
+        negative values counting from the end.
+
+        Parameters:
+        - length (int): The number of elements of the list, the moved element included.
+        - new_order (int): The index where the element should be moved to.
+
+        Returns:
+        int: The 'order' of the moved element.
+    """
+    others = max(length - 1, 0)
+    if new_order < 0:
+        return max(others + new_order, 0)
+    return min(new_order, others)
@@ -0,0 +1,115 @@
+import re
+
+from sqlalchemy import text
+
+SQLITE_TASK_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5(title, description, content='task', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS task_fts_ai AFTER INSERT ON task BEGIN "
+    "INSERT INTO task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS task_fts_ad AFTER DELETE ON task BEGIN "
+    "INSERT INTO task_fts(task_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS task_fts_au AFTER UPDATE OF title, description ON task BEGIN "
+    "INSERT INTO task_fts(task_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+]
+
+POSTGRESQL_TASK_SEARCH_DDL = [
+    "ALTER TABLE task ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS "
+    "(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_task_search_vector ON task USING GIN (search_vector)",
+]
+
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def create_task_search_index(connection):
+    """
+        Function: create_task_search_index
+
+        Description:
+        Creates the full-text index over task titles and descriptions for the dialect of the given connection. SQLite
+        gets an external-content FTS5 table kept in sync by triggers on insert, delete and title/description updates
+        (reorders do not touch it); PostgreSQL gets a generated "tsvector" column backed by a GIN index. Every statement
+        is idempotent, so it is safe to run against an existing database. Other dialects are left untouched.
+
+        Parameters:
+        - connection: The SQLAlchemy connection on which the DDL is executed.
+
+        Returns:
+        None
+    """
+    statements = {
+        "sqlite": SQLITE_TASK_SEARCH_DDL,
+        "postgresql": POSTGRESQL_TASK_SEARCH_DDL,
+    }.get(connection.dialect.name, [])
+
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def rebuild_task_search_index(connection):
+    """
+        Function: rebuild_task_search_index
+
+        Description:
+        Repopulates the full-text index from the current content of the "task" table. Only SQLite needs it, since the
+        PostgreSQL generated column is always up to date.
+
+        Parameters:
+        - connection: The SQLAlchemy connection on which the rebuild is executed.
+
+        Returns:
+        None
+    """
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("INSERT INTO task_fts(task_fts) VALUES ('rebuild')"))
+
+
+def tokenize_search_query(query: str) -> list[str]:
+    """
+        Function: tokenize_search_query
+
+        Description:
+        Splits a free-text search query into word tokens, dropping any operator or punctuation so user input can never
+        be interpreted as full-text query syntax.
+
+        Parameters:
+        - query (str): The raw search query.
+
+        Returns:
+        list[str]: The word tokens of the query.
+    """
+    return SEARCH_TOKEN_PATTERN.findall(query)
+
+
+def build_fts5_match_query(tokens: list[str]) -> str:
+    """
+        Function: build_fts5_match_query
+
+        Description:
+        Builds an FTS5 MATCH expression where every token must be present as a word prefix.
+
+        Parameters:
+        - tokens (list[str]): The word tokens of the query.
+
+        Returns:
+        str: The MATCH expression, e.g. '"buy"* "milk"*'.
+    """
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def build_tsquery(tokens: list[str]) -> str:
+    """
+        Function: build_tsquery
+
+        Description:
+        Builds a PostgreSQL "to_tsquery" expression where every token must be present as a word prefix.
+
+        Parameters:
+        - tokens (list[str]): The word tokens of the query.
+
+        Returns:
+        str: The tsquery expression, e.g. "buy:* & milk:*".
+    """
+    return " & ".join(f"{token}:*" for token in tokens)
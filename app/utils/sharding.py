@@ -0,0 +1,103 @@
+from flask import current_app, g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import inspect
+from sqlalchemy.sql.util import find_tables
+
+DEFAULT_SHARD = "default"
+
+
+def _is_sharded(table) -> bool:
+    return table.info.get("sharded", False)
+
+
+class ShardedSession(Session):
+    """
+        Class: ShardedSession
+
+        Description:
+        Flask-SQLAlchemy session that sends the statements touching a sharded table ("task", "task_category") to the
+        shard of the user being served, activated for the current application context by ShardRouter.activate. Every
+        other statement, such as the "user" directory lookups, goes to the main database.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_app_context() and g.get("shard", DEFAULT_SHARD) != DEFAULT_SHARD:
+            if mapper is not None:
+                tables = [inspect(mapper).local_table]
+            elif clause is not None:
+                tables = find_tables(clause, include_aliases=True, include_joins=True, include_crud=True)
+            else:
+                tables = []
+
+            if any(_is_sharded(table) for table in tables):
+                return self._db.engines[g.shard]
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class ShardRouter:
+    """
+        Class: ShardRouter
+
+        Description:
+        Maps users to the database shard holding their board (task categories and tasks). Users themselves always live
+        in the main database, which acts as the directory: "user.shard_key" records the shard of each user, assigned at
+        registration from the user ID (round-robin over DATABASE_SHARDS) and changed by "flask shard-rebalance". When
+        DATABASE_SHARDS is not set, every board lives in the main database.
+
+        Methods:
+        - shard_names(self) -> list[str]: The configured shards.
+        - place(self, user_id: int) -> str: The shard assigned to a new user.
+        - shard_for(self, user) -> str: The shard holding the board of a user.
+        - activate(self, user): Routes the board queries of the current application context to the shard of a user.
+        - use(self, shard: str): Routes the board queries of the current application context to a shard.
+        - engine(self, shard: str): The engine of a shard.
+        - ensure_user(self, user, shard: str): Copies the directory row of a user to a shard.
+    """
+
+    def shard_names(self) -> list[str]:
+        return list(current_app.config["DATABASE_SHARDS"]) or [DEFAULT_SHARD]
+
+    def place(self, user_id: int) -> str:
+        shards = self.shard_names()
+        return shards[user_id % len(shards)]
+
+    def shard_for(self, user) -> str:
+        return user.shard_key or DEFAULT_SHARD
+
+    def activate(self, user):
+        self.use(self.shard_for(user))
+
+    def use(self, shard: str):
+        g.shard = shard
+
+    def engine(self, shard: str):
+        from app import db
+
+        return db.engines[None if shard == DEFAULT_SHARD else shard]
+
+    def ensure_user(self, user, shard: str):
+        """
+            Method: ensure_user
+
+            Description:
+            Copies the directory row of a user (without the password hash) to a shard, so the foreign keys of the board
+            tables of the shard are satisfied. Does nothing for the default shard or if the row already exists.
+
+            Parameters:
+            - user (User): The user to copy.
+            - shard (str): The name of the shard.
+        """
+        if shard == DEFAULT_SHARD:
+            return
+
+        from app.models import User
+
+        table = User.__table__
+        with self.engine(shard).begin() as connection:
+            exists = connection.execute(table.select().where(table.c.id == user.id)).first()
+            if exists is None:
+                connection.execute(table.insert().values(id=user.id, username=user.username, shard_key=shard))
+
+
+shard_router = ShardRouter()
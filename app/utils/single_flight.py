@@ -0,0 +1,145 @@
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable
+
+POLL_INTERVAL_SECONDS = 0.005
+PURGE_INTERVAL_SECONDS = 60
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.failed = False
+
+
+class SingleFlight:
+    """
+        Class: SingleFlight
+
+        Description:
+        Coalesces identical concurrent loads: while a load is in flight for a key, the other callers asking for the
+        same key wait for it and get its result instead of running their own. Callers only join a load that is already
+        running, so they may get a result at most one load duration old; nothing is cached once the load is done.
+
+        Within a worker process the callers are threads (or greenlets in the gevent mode). Given a shared directory,
+        ideally on a memory filesystem such as /dev/shm, the load running in one worker process also serves the other
+        worker processes of the host: an exclusive file lock elects the leader, which writes the JSON result to a file
+        read by the followers. Results must then be JSON-serializable.
+
+        If the leader fails or takes longer than the timeout, its followers run the load themselves.
+
+        Methods:
+        - do(self, key, load, timeout, shared_dir=None): Runs the load, or joins the one in flight for the key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._purged_at = 0.0
+
+    def do(self, key: str, load: Callable[[], Any], timeout: float, shared_dir: str | None = None) -> Any:
+        """
+            Method: do
+
+            Description:
+            Returns the result of the load for the key, running it only if no identical load is already in flight.
+
+            Parameters:
+            - key (str): Identifies identical loads, e.g. the user and the query arguments of a request.
+            - load (Callable[[], Any]): Produces the result. The result is shared between callers and must not be
+              mutated.
+            - timeout (float): Maximum time, in seconds, spent waiting for the load of another caller.
+            - shared_dir (str | None): Directory shared by the worker processes of the host, to coalesce across them
+              (optional).
+
+            Returns:
+            Any: The result of the load.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            if flight.done.wait(timeout) and not flight.failed:
+                return flight.result
+            return load()
+
+        try:
+            flight.result = self._load_shared(key, load, timeout, shared_dir) if shared_dir else load()
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def _load_shared(self, key: str, load: Callable[[], Any], timeout: float, shared_dir: str) -> Any:
+        os.makedirs(shared_dir, exist_ok=True)
+        name = hashlib.sha256(key.encode()).hexdigest()
+        result_path = os.path.join(shared_dir, f"{name}.json")
+        started_at = time.time()
+
+        with open(os.path.join(shared_dir, f"{name}.lock"), "a+b") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return self._wait_shared(lock_file, result_path, started_at, load, timeout)
+
+            try:
+                result = load()
+                temporary_path = f"{result_path}.{os.getpid()}.{threading.get_ident()}"
+                with open(temporary_path, "w", encoding="utf-8") as result_file:
+                    json.dump({"written_at": time.time(), "result": result}, result_file)
+                os.replace(temporary_path, result_path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        self._purge(shared_dir)
+        return result
+
+    @staticmethod
+    def _wait_shared(lock_file, result_path: str, started_at: float, load: Callable[[], Any], timeout: float) -> Any:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL_SECONDS)
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+
+            try:
+                with open(result_path, encoding="utf-8") as result_file:
+                    written = json.load(result_file)
+            except (OSError, ValueError):
+                written = None
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+            if written is not None and written["written_at"] >= started_at:
+                return written["result"]
+            break
+        return load()
+
+    def _purge(self, shared_dir: str):
+        now = time.time()
+        if now - self._purged_at < PURGE_INTERVAL_SECONDS:
+            return
+        self._purged_at = now
+        for entry in os.scandir(shared_dir):
+            try:
+                if now - entry.stat().st_mtime > PURGE_INTERVAL_SECONDS:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+single_flight = SingleFlight()
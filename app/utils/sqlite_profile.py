@@ -0,0 +1,157 @@
+import threading
+
+from flask import Flask
+from sqlalchemy import event
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "DROP", "ALTER")
+
+
+def is_write_statement(statement: str) -> bool:
+    """
+        Function: is_write_statement
+
+        Description:
+        Tells whether an SQL statement writes to the database, i.e. takes the database write lock of SQLite.
+
+        Parameters:
+        - statement (str): The SQL statement sent to the database.
+
+        Returns:
+        bool: True for the DML and DDL statements.
+    """
+    return statement.lstrip()[:7].upper().startswith(WRITE_STATEMENTS)
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: dict):
+    """
+        Function: apply_sqlite_pragmas
+
+        Description:
+        Sets the PRAGMAs of the SQLite profile on a new connection. The journal mode is persistent (stored in the
+        database file), the other settings apply to the connection only.
+
+        Parameters:
+        - dbapi_connection: The sqlite3 connection.
+        - pragmas (dict): The PRAGMA values, by name, in the order they are set.
+
+        Returns:
+        None
+    """
+    cursor = dbapi_connection.cursor()
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+    cursor.close()
+
+
+class SQLiteWriter:
+    """
+        Class: SQLiteWriter
+
+        Description:
+        Serializes the write transactions of the worker process on a SQLite database, which only ever has one writer.
+        A connection takes the writer at its first write statement and hands it back when it returns to the pool, i.e.
+        once its transaction is committed or rolled back. Concurrent writers thus wait in line on a lock of the process
+        instead of polling the database file through the busy handler of SQLite, while readers go on thanks to WAL.
+        Other processes writing to the same file are still waited for through busy_timeout.
+
+        A connection that cannot take the writer within the timeout goes on without it, and SQLite answers "database is
+        locked" as it would have. So does a second connection of a thread (or greenlet) already holding the writer,
+        which would otherwise wait for itself.
+
+        Methods:
+        - acquire(self, info: dict): Takes the writer for a connection, unless it already holds it.
+        - release(self, info: dict): Hands the writer back if the connection holds it.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._owner = None
+
+    def acquire(self, info: dict):
+        if info.get("sqlite_writer") is self or self._owner == threading.get_ident():
+            return
+        if self._lock.acquire(timeout=self.timeout):
+            self._owner = threading.get_ident()
+            info["sqlite_writer"] = self
+
+    def release(self, info: dict):
+        if info.pop("sqlite_writer", None) is self:
+            self._owner = None
+            self._lock.release()
+
+
+def tune_sqlite_engine(engine, pragmas: dict, serialize_writes: bool, busy_timeout_ms: int):
+    """
+        Function: tune_sqlite_engine
+
+        Description:
+        Installs the SQLite profile on an engine. See init_sqlite_profile.
+
+        Parameters:
+        - engine (Engine): The SQLAlchemy engine of a SQLite database file.
+        - pragmas (dict): The PRAGMA values set on every new connection.
+        - serialize_writes (bool): Whether the write transactions of the process go through a SQLiteWriter.
+        - busy_timeout_ms (int): How long a write waits for the writer, in milliseconds.
+
+        Returns:
+        SQLiteWriter | None: The writer of the engine, if the writes are serialized.
+    """
+    event.listen(engine, "connect", lambda dbapi_connection, connection_record:
+                 apply_sqlite_pragmas(dbapi_connection, pragmas))
+    if not serialize_writes:
+        return None
+
+    writer = SQLiteWriter(busy_timeout_ms / 1000)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def acquire_writer(connection, cursor, statement, parameters, context, executemany):
+        if is_write_statement(statement):
+            writer.acquire(connection.info)
+
+    @event.listens_for(engine.pool, "checkin")
+    def release_writer(dbapi_connection, connection_record):
+        writer.release(connection_record.info)
+
+    return writer
+
+
+def init_sqlite_profile(app: Flask):
+    """
+        Function: init_sqlite_profile
+
+        Description:
+        This function is responsible for tuning the SQLite database files of the Flask application (the main database
+        and every shard) for concurrent use by the API, when SQLITE_PROFILE_ENABLED is set. In-memory databases and
+        other database servers are left as they are.
+
+        Every new connection switches the database to write-ahead logging (SQLITE_JOURNAL_MODE), so readers no longer
+        block the writer and the other way around, waits up to SQLITE_BUSY_TIMEOUT_MS for the lock of another writer
+        instead of failing with "database is locked", only syncs the log at checkpoints (SQLITE_SYNCHRONOUS), maps the
+        database file in memory (SQLITE_MMAP_SIZE) and gets a larger page cache (SQLITE_CACHE_SIZE_KB). With
+        SQLITE_SERIALIZE_WRITES, the write transactions of the worker process wait in line for a single in-process
+        writer (see SQLiteWriter).
+
+        Parameters:
+        - app (Flask): The Flask application instance whose engines will be tuned.
+
+        Returns:
+        None
+    """
+    from app import db
+
+    config = app.config
+    if not config["SQLITE_PROFILE_ENABLED"]:
+        return
+
+    pragmas = {
+        "journal_mode": config["SQLITE_JOURNAL_MODE"],
+        "busy_timeout": int(config["SQLITE_BUSY_TIMEOUT_MS"]),
+        "synchronous": config["SQLITE_SYNCHRONOUS"],
+        "mmap_size": int(config["SQLITE_MMAP_SIZE"]),
+        "cache_size": -int(config["SQLITE_CACHE_SIZE_KB"]),
+    }
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == "sqlite" and engine.url.database not in (None, "", ":memory:"):
+                tune_sqlite_engine(engine, pragmas, config["SQLITE_SERIALIZE_WRITES"], config["SQLITE_BUSY_TIMEOUT_MS"])
@@ -0,0 +1,118 @@
+import functools
+import threading
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import default
+
+STATEMENT_VARIANTS = 256
+
+
+class StatementCache:
+    """
+        Class: StatementCache
+
+        Description:
+        Keeps track of the statements built once per process by the repositories (see cached_statement) and of the
+        compiled cache of the engines: SQLAlchemy compiles a statement to SQL once per engine and process, and reuses
+        the compiled form for every statement of the same structure, the values being bound parameters. Each execution
+        is counted as a hit, a miss (compiled now), or uncached (a statement SQLAlchemy cannot cache, e.g. raw SQL).
+
+        Methods:
+        - register(self, name: str, builder): Registers a statement builder memoized by cached_statement.
+        - watch(self, engine, name: str): Counts the compiled cache hits and misses of an engine.
+        - stats(self) -> dict: The statistics of the process.
+    """
+
+    def __init__(self):
+        self.builders = {}
+        self.engines = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, builder):
+        self.builders[name] = builder
+
+    def watch(self, engine, name: str):
+        with self._lock:
+            if name in self.engines and self.engines[name]["engine"] is engine:
+                return
+            counters = self.engines[name] = {"engine": engine, "hits": 0, "misses": 0, "uncached": 0}
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def count_compiled_cache(connection, cursor, statement, parameters, context, executemany):
+            cache_hit = getattr(context, "cache_hit", None)
+            if cache_hit is default.CACHE_HIT:
+                counters["hits"] += 1
+            elif cache_hit is default.CACHE_MISS:
+                counters["misses"] += 1
+            else:
+                counters["uncached"] += 1
+
+    def stats(self) -> dict:
+        """
+            Method: stats
+
+            Description:
+            Returns the statistics of the statement builders and of the compiled cache of each engine, in the current
+            process.
+
+            Returns:
+            dict: "statements" maps each builder to its hits, misses (statements built) and cached variants, and
+            "compiled" maps each engine to its hits, misses, uncached executions, hit rate and compiled statements held.
+        """
+        statements = {}
+        for name, builder in self.builders.items():
+            info = builder.cache_info()
+            statements[name] = {"hits": info.hits, "misses": info.misses, "variants": info.currsize}
+
+        compiled = {}
+        for name, counters in self.engines.items():
+            lookups = counters["hits"] + counters["misses"]
+            compiled_cache = counters["engine"]._compiled_cache
+            compiled[name] = {"hits": counters["hits"], "misses": counters["misses"], "uncached": counters["uncached"],
+                              "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+                              "size": len(compiled_cache) if compiled_cache is not None else 0}
+        return {"statements": statements, "compiled": compiled}
+
+
+statement_cache = StatementCache()
+
+
+def cached_statement(f):
+    """
+        Decorator function memoizing a statement builder of a repository: the statement is built once per process for
+        each combination of the arguments of the builder, which must be hashable and describe the structure of the
+        statement only (e.g. the fields selected), the values being bound parameters given at execution
+        (bindparam). A statement built once also keeps its cache key, so SQLAlchemy finds its compiled form without
+        walking the statement again.
+
+        Parameters:
+        - f (function): The statement builder.
+
+        Returns:
+        The memoized builder, counted in statement_cache.stats().
+    """
+    builder = functools.lru_cache(maxsize=STATEMENT_VARIANTS)(f)
+    statement_cache.register(f.__qualname__, builder)
+    return builder
+
+
+def init_statement_cache(app: Flask):
+    """
+        Function: init_statement_cache
+
+        Description:
+        This function is responsible for counting the compiled cache hits and misses of the engines of the Flask
+        application (the main database and every shard), reported by statement_cache.stats().
+
+        Parameters:
+        - app (Flask): The Flask application instance whose engines will be watched.
+
+        Returns:
+        None
+    """
+    from app import db
+
+    with app.app_context():
+        for name, engine in db.engines.items():
+            statement_cache.watch(engine, name or "default")
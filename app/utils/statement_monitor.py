@@ -0,0 +1,204 @@
+import logging
+import re
+import sys
+import time
+
+from flask import Flask, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger("app.slow_query")
+
+MAX_STATEMENT_LENGTH = 2000
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|%s)(?:\s*,\s*(?:\?|%\(\w+\)s|%s))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+        Function: statement_shape
+
+        Description:
+        Normalizes an SQL statement so the executions of the same query look alike in the log: whitespace is collapsed
+        and lists of placeholders, such as the expanded values of an IN clause, are shortened to "(...)".
+
+        Parameters:
+        - statement (str): The SQL statement sent to the database.
+
+        Returns:
+        str: The shape of the statement, truncated to MAX_STATEMENT_LENGTH characters.
+    """
+    shape = _PLACEHOLDER_LIST.sub("(...)", _WHITESPACE.sub(" ", statement).strip())
+    return shape if len(shape) <= MAX_STATEMENT_LENGTH else shape[:MAX_STATEMENT_LENGTH] + "..."
+
+
+def redact_parameters(parameters, executemany: bool = False):
+    """
+        Function: redact_parameters
+
+        Description:
+        Replaces the values of the parameters of a statement by their type names, so the log never holds user data,
+        password hashes or tokens.
+
+        Parameters:
+        - parameters: The parameters of the statement, a sequence or a mapping (a list of them for executemany).
+        - executemany (bool): Whether the statement ran once per set of parameters.
+
+        Returns:
+        The redacted parameters, or a description of the sets of parameters for executemany.
+    """
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    return [type(value).__name__ for value in parameters or ()]
+
+
+def calling_repository_method() -> str | None:
+    """
+        Function: calling_repository_method
+
+        Description:
+        Finds the repository method that issued the statement being executed by walking up the call stack.
+
+        Returns:
+        str | None: The qualified name of the method, e.g. "TaskRepository.get_all", or None if the statement was not
+        issued by a repository.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith("app.repositories."):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
+
+def _route() -> str | None:
+    if not has_request_context():
+        return None
+    return f"{request.method} {request.url_rule.rule if request.url_rule else request.path}"
+
+
+def _set_sqlite_statement_timeout(dbapi_connection, connection_record, timeout_ms: int):
+    # SQLite has no statement timeout: a progress handler, called every few thousand virtual machine instructions,
+    # interrupts the statement (sqlite3.OperationalError "interrupted") once it has run longer than the timeout.
+    connection_record.info["statement_deadline"] = None
+
+    def interrupt_after_deadline() -> int:
+        deadline = connection_record.info.get("statement_deadline")
+        return 1 if deadline is not None and time.monotonic() > deadline else 0
+
+    dbapi_connection.set_progress_handler(interrupt_after_deadline, 10000)
+
+
+def _set_postgresql_statement_timeout(dbapi_connection, timeout_ms: int):
+    autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"SET statement_timeout = {int(timeout_ms)}")
+    cursor.close()
+    dbapi_connection.autocommit = autocommit
+
+
+def monitor_engine(engine, slow_query_ms: float, timeout_ms: int):
+    """
+        Function: monitor_engine
+
+        Description:
+        Installs the slow-query log and the statement timeout on an engine. See init_statement_monitor.
+
+        Parameters:
+        - engine (Engine): The SQLAlchemy engine to monitor.
+        - slow_query_ms (float): The duration, in milliseconds, from which a statement is logged (0 disables the log).
+        - timeout_ms (int): The duration, in milliseconds, after which a statement is cancelled (0 disables it).
+
+        Returns:
+        None
+    """
+    dialect = engine.dialect.name
+    sqlite_timeout = timeout_ms and dialect == "sqlite"
+
+    if timeout_ms and dialect == "postgresql":
+        event.listen(engine, "connect", lambda dbapi_connection, connection_record:
+                     _set_postgresql_statement_timeout(dbapi_connection, timeout_ms))
+    elif sqlite_timeout:
+        event.listen(engine, "connect", lambda dbapi_connection, connection_record:
+                     _set_sqlite_statement_timeout(dbapi_connection, connection_record, timeout_ms))
+
+        # The deadline also covers fetching the rows of the statement, and is lifted when the transaction ends.
+        def lift_deadline(connection, *args):
+            connection.info["statement_deadline"] = None
+
+        event.listen(engine, "commit", lift_deadline)
+        event.listen(engine, "rollback", lift_deadline)
+        event.listen(engine.pool, "checkin", lambda dbapi_connection, connection_record:
+                     connection_record.info.update(statement_deadline=None))
+
+    if not slow_query_ms and not sqlite_timeout:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(connection, cursor, statement, parameters, context, executemany):
+        started_at = time.monotonic()
+        connection.info["statement_started_at"] = started_at
+        if sqlite_timeout:
+            connection.info["statement_deadline"] = started_at + timeout_ms / 1000
+
+    def log_if_slow(connection, statement, parameters, executemany, failed: bool):
+        started_at = connection.info.pop("statement_started_at", None)
+        if not slow_query_ms or started_at is None:
+            return
+        duration_ms = (time.monotonic() - started_at) * 1000
+        if duration_ms < slow_query_ms:
+            return
+
+        route, repository_method = _route(), calling_repository_method()
+        logger.warning("Slow query%s (%.1f ms) on %s from %s: %s | parameters: %s", " failed" if failed else "",
+                       duration_ms, route or "no route", repository_method or "no repository",
+                       statement_shape(statement), redact_parameters(parameters, executemany),
+                       extra={"duration_ms": duration_ms, "route": route, "repository_method": repository_method})
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def log_slow_statement(connection, cursor, statement, parameters, context, executemany):
+        log_if_slow(connection, statement, parameters, executemany, failed=False)
+
+    @event.listens_for(engine, "handle_error")
+    def log_failed_statement(exception_context):
+        if exception_context.connection is not None and exception_context.statement is not None:
+            log_if_slow(exception_context.connection, exception_context.statement, exception_context.parameters,
+                        bool(exception_context.execution_context and exception_context.execution_context.executemany),
+                        failed=True)
+
+
+def init_statement_monitor(app: Flask):
+    """
+        Function: init_statement_monitor
+
+        Description:
+        This function is responsible for installing the slow-query log and the statement timeout on the engines of the
+        Flask application (the main database and every shard).
+
+        Every statement that takes at least SLOW_QUERY_THRESHOLD_MS is logged as a warning to the "app.slow_query"
+        logger, with its shape, its parameters redacted down to their types, its duration, the route of the request
+        and the repository method that issued it.
+
+        Statements running longer than STATEMENT_TIMEOUT_MS are cancelled, and the request fails instead of holding
+        the worker. PostgreSQL enforces it through the "statement_timeout" setting of every session (connection).
+        SQLite has no equivalent, so it is approximated by a progress handler interrupting the statement, which
+        includes the time spent fetching its rows but not the time spent waiting for a lock.
+
+        Parameters:
+        - app (Flask): The Flask application instance whose engines will be monitored.
+
+        Returns:
+        None
+    """
+    from app import db
+
+    slow_query_ms = app.config["SLOW_QUERY_THRESHOLD_MS"]
+    timeout_ms = app.config["STATEMENT_TIMEOUT_MS"]
+    if not slow_query_ms and not timeout_ms:
+        return
+
+    with app.app_context():
+        for engine in db.engines.values():
+            monitor_engine(engine, slow_query_ms, timeout_ms)
@@ -0,0 +1,96 @@
+"""
+    Benchmark: list serialization
+
+    Description:
+    Compares loading and serializing a large board through the ORM (TaskCategory and Task objects, tracked by the
+    session) against the read-only record fast path used by GET /task (Core select() into TaskCategoryRecord and
+    TaskRecord) and the board built as JSON by the database, used by GET /task-category. Reports the time and the peak
+    memory allocated per task listed.
+
+    Usage:
+    python benchmarks/list_serialization.py [--tasks 20000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(load, repeat: int) -> tuple[float, int]:
+    """
+        Returns the best time, in seconds, and the peak memory allocated, in bytes, of the load.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    load()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    os.environ.update(DATABASE_URL=f"sqlite:///{database}", SINGLE_FLIGHT_ENABLED="False")
+    sys.path.insert(0, ROOT)
+    from app import create_app, db
+    from app.models import Task, TaskCategory, User
+    from app.services import TaskCategoryService, TaskService
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        user = User(username="bench")
+        db.session.add(user)
+        db.session.commit()
+        categories = [TaskCategory(title=title, order=order, user_id=user.id)
+                      for order, title in enumerate(["Todo", "In Progress", "Done"], start=1)]
+        db.session.add_all(categories)
+        db.session.commit()
+        db.session.execute(Task.__table__.insert(), [
+            {"title": f"Task {index}", "description": "Benchmark task", "order": index // len(categories) + 1,
+             "category_id": categories[index % len(categories)].id, "user_id": user.id}
+            for index in range(args.tasks)])
+        db.session.commit()
+        user_id = user.id
+
+    task_category_service, task_service = TaskCategoryService(), TaskService()
+
+    def in_request(load):
+        def run():
+            with app.test_request_context():
+                current_user = db.session.get(User, user_id)
+                return load(current_user)
+        return run
+
+    loads = {
+        "board, ORM": in_request(lambda user: [category.to_dict() for category in
+                                               task_category_service.get_all(False, user)]),
+        "board, records": in_request(lambda user: [category.to_dict() for category in
+                                                   task_category_service.get_all_records(False, user)]),
+        "board, SQL JSON": in_request(lambda user: task_category_service.get_board(user)),
+        "tasks, ORM": in_request(lambda user: [task.to_dict() for task in task_service.get_all(None, user)]),
+        "tasks, records": in_request(lambda user: [task.to_dict() for task in
+                                                   task_service.get_all_records(None, user)]),
+    }
+    for name, load in loads.items():
+        elapsed, peak = measure(load, args.repeat)
+        print(f"{name:>15}: {elapsed * 1000:8.1f} ms  {elapsed * 1e6 / args.tasks:6.2f} us/task  "
+              f"peak {peak / args.tasks:7.0f} B/task")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+    Benchmark: repository statements
+
+    Description:
+    Compares the per-call cost of the small, hot repository queries (a task by ID, a task category by key, the board
+    summary and the task counter update of every task change) built for every call the way the repositories used to
+    (Model.query.filter_by(...) or select(...) with the values inlined) against the statements the repositories build
+    once per process (cached_statement), the values being bound parameters. Both run against the same in-memory SQLite
+    database, so the difference is the Python-side construction of the statements. The statistics of the statement
+    builders and of the compiled cache are printed at the end.
+
+    Usage:
+    python benchmarks/repository_statements.py [--calls 5000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(call, calls: int, repeat: int) -> float:
+    """
+        Returns the best time, in seconds, of the given number of calls.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            call()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    sys.path.insert(0, ROOT)
+    from sqlalchemy import asc, select, update
+
+    from app import create_app, db
+    from app.models import Task, TaskCategory, User
+    from app.models.task import utcnow
+    from app.repositories.task_category_repository import TaskCategoryRepository
+    from app.repositories.task_repository import TaskRepository
+    from app.utils import statement_cache
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        user = User(username="benchmark")
+        db.session.add(user)
+        db.session.flush()
+        category = TaskCategory(title="Todo", order=1, user_id=user.id)
+        db.session.add(category)
+        db.session.flush()
+        task = Task(title="Task", description="Benchmark", order=1, category_id=category.id, user_id=user.id)
+        db.session.add(task)
+        db.session.commit()
+        user_id, category_id, task_id = user.id, category.id, task.id
+
+    task_repository, task_category_repository = TaskRepository(), TaskCategoryRepository()
+
+    queries = {
+        "task by id": (
+            lambda: Task.query.filter_by(id=task_id, user_id=user_id).first(),
+            lambda: task_repository.get_by_id(task_id, user),
+        ),
+        "task category id by key": (
+            lambda: db.session.execute(select(TaskCategory.id).where(TaskCategory.key_criterion(str(category_id)),
+                                                                     TaskCategory.user_id == user_id)).scalar(),
+            lambda: TaskCategoryRepository.get_id_by_key.__wrapped__(task_category_repository, str(category_id), user),
+        ),
+        "board summary": (
+            lambda: db.session.execute(select(TaskCategory.id, TaskCategory.title, TaskCategory.order,
+                                              TaskCategory.task_count, TaskCategory.tasks_updated_at)
+                                       .where(TaskCategory.user_id == user_id)
+                                       .order_by(asc(TaskCategory.order))).all(),
+            lambda: task_category_repository.get_summary(user),
+        ),
+        "task count update": (
+            lambda: db.session.execute(update(TaskCategory).where(TaskCategory.id == category_id)
+                                       .values(task_count=TaskCategory.task_count + 0, tasks_updated_at=utcnow()),
+                                       execution_options={"synchronize_session": False}),
+            lambda: task_category_repository.update_task_count(category_id, 0),
+        ),
+    }
+
+    print(f"{args.calls} calls, best of {args.repeat}")
+    print(f"{'query':<26}{'built per call':>16}{'built once':>12}{'saving':>10}  (us/call)")
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        for name, (legacy, cached) in queries.items():
+            legacy_us = measure(legacy, args.calls, args.repeat) / args.calls * 1e6
+            cached_us = measure(cached, args.calls, args.repeat) / args.calls * 1e6
+            print(f"{name:<26}{legacy_us:>16.1f}{cached_us:>12.1f}{legacy_us - cached_us:>10.1f}")
+        db.session.rollback()
+
+    stats = statement_cache.stats()
+    stats["statements"] = {name: counters for name, counters in stats["statements"].items() if counters["misses"]}
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+    Benchmark: SQLite concurrency
+
+    Description:
+    Compares the throughput of concurrent board reads (GET /task-category) and task reorders (PUT /task/<id> with a new
+    order) on a SQLite database file, without the SQLite profile (rollback journal, full sync, writers polling the
+    database file through the busy handler) and with it (WAL, synchronous=NORMAL, memory mapping, a larger page cache
+    and a single in-process writer). Reader and writer threads call the application through the Flask test client for
+    a fixed duration; requests that fail, e.g. with "database is locked", are counted as errors.
+
+    Usage:
+    python benchmarks/sqlite_concurrency.py [--readers 8] [--writers 8] [--seconds 5] [--tasks 50]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(profile: bool, args) -> dict:
+    """
+        Runs the readers and writers against a new database, with or without the SQLite profile, and returns the
+        number of successful reads and writes and of errors.
+    """
+    from config import Config
+
+    from app import create_app
+
+    database = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{database}"
+        SQLITE_PROFILE_ENABLED = profile
+        RATE_LIMIT_ENABLED = False
+        ADMISSION_CONTROL_ENABLED = False
+        SINGLE_FLIGHT_ENABLED = False
+        SLOW_QUERY_THRESHOLD_MS = 0
+
+    app = create_app(BenchmarkConfig)
+    app.test_cli_runner().invoke(args=["create-db"])
+    client = app.test_client()
+    client.post("/auth/register", json={"username": "benchmark", "password": "benchmark"})
+    token = client.post("/auth/login", json={"username": "benchmark", "password": "benchmark"}).get_json()["result"]
+    headers = {"Authorization": f"Bearer {token}"}
+    category_id = client.get("/task-category", headers=headers).get_json()["result"][0]["id"]
+    task_ids = [client.post("/task", headers=headers, json={"title": f"Task {index}", "description": "Benchmark",
+                                                            "order": index + 1, "category_id": category_id})
+                .get_json()["result"]["id"] for index in range(args.tasks)]
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+
+    def count(name: str):
+        with lock:
+            counts[name] += 1
+
+    def read():
+        reader = app.test_client()
+        while time.perf_counter() < deadline:
+            response = reader.get("/task-category", headers=headers)
+            count("reads" if response.status_code == 200 else "errors")
+
+    def write(worker: int):
+        writer = app.test_client()
+        moves = 0
+        while time.perf_counter() < deadline:
+            task_id = task_ids[(worker * 31 + moves * 7) % len(task_ids)]
+            try:
+                response = writer.put(f"/task/{task_id}", headers=headers,
+                                      json={"order": (worker + moves) % args.tasks + 1})
+                count("writes" if response.status_code == 200 else "errors")
+            except Exception:
+                count("errors")
+            moves += 1
+
+    threads = ([threading.Thread(target=read) for _ in range(args.readers)]
+               + [threading.Thread(target=write, args=(worker,)) for worker in range(args.writers)])
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--tasks", type=int, default=50)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    sys.path.insert(0, ROOT)
+    logging.disable(logging.CRITICAL)
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:g} s, {args.tasks} tasks")
+    print(f"{'profile':<12}{'reads/s':>10}{'writes/s':>10}{'errors':>8}")
+    for name, profile in (("default", False), ("sqlite", True)):
+        counts = run(profile, args)
+        print(f"{name:<12}{counts['reads'] / args.seconds:>10.1f}{counts['writes'] / args.seconds:>10.1f}"
+              f"{counts['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
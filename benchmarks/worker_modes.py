@@ -0,0 +1,133 @@
+"""
+    Benchmark: worker modes
+
+    Description:
+    Compares the throughput of one blocking ("sync") worker against one cooperative ("gevent") worker on the I/O-bound
+    GET /task-category endpoint. Each mode is served by a single process in a subprocess, with a simulated database
+    round-trip latency added before every SQL statement (time.sleep, which gevent turns into a cooperative wait), and is
+    hit by concurrent clients.
+
+    Usage:
+    python benchmarks/worker_modes.py [--requests 300] [--concurrency 50] [--io-latency-ms 20]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def serve(mode: str, port: int, io_latency_ms: float):
+    """
+        Serves the application on the given port with a single sync or gevent worker.
+    """
+    sys.path.insert(0, ROOT)
+    from wsgi import application
+
+    from sqlalchemy import event
+
+    from app import db
+
+    with application.app_context():
+        db.create_all()
+
+        @event.listens_for(db.engine, "before_cursor_execute")
+        def simulate_database_latency(*args):
+            time.sleep(io_latency_ms / 1000)
+
+    if mode == "gevent":
+        from gevent.pywsgi import WSGIServer
+        WSGIServer(("127.0.0.1", port), application, log=None).serve_forever()
+    else:
+        from werkzeug.serving import WSGIRequestHandler, make_server
+
+        class QuietRequestHandler(WSGIRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+
+        make_server("127.0.0.1", port, application, threaded=False,
+                    request_handler=QuietRequestHandler).serve_forever()
+
+
+def call(url: str, method: str = "GET", body: dict | None = None, token: str | None = None) -> dict:
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(request, timeout=120) as response:
+        return json.loads(response.read())
+
+
+def wait_until_ready(base_url: str):
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"{base_url}/swagger.json", timeout=1)
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("The benchmark server did not start")
+
+
+def run(mode: str, port: int, args) -> dict:
+    database = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    env = dict(os.environ, WORKER_MODE=mode, DATABASE_URL=f"sqlite:///{database}", COMPRESSION_ENABLED="False",
+               DATABASE_POOL_SIZE=str(args.concurrency), DATABASE_MAX_OVERFLOW="0")
+    server = subprocess.Popen([sys.executable, __file__, "--serve", mode, "--port", str(port),
+                               "--io-latency-ms", str(args.io_latency_ms)], env=env, cwd=ROOT)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(base_url)
+        credentials = {"username": f"bench_{mode}", "password": "benchmark"}
+        call(f"{base_url}/auth/register", "POST", credentials)
+        token = call(f"{base_url}/auth/login", "POST", credentials)["result"]
+
+        def timed_request(_):
+            started = time.perf_counter()
+            call(f"{base_url}/task-category", token=token)
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as executor:
+            latencies = sorted(executor.map(timed_request, range(args.requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "mode": mode,
+        "requests_per_second": args.requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--io-latency-ms", type=float, default=20)
+    parser.add_argument("--port", type=int, default=5801)
+    parser.add_argument("--serve", choices=["sync", "gevent"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.io_latency_ms)
+        return
+
+    results = [run(mode, args.port + index, args) for index, mode in enumerate(["sync", "gevent"])]
+    for result in results:
+        print(f"{result['mode']:>6}: {result['requests_per_second']:8.1f} req/s  p50 {result['p50_ms']:8.1f} ms  "
+              f"p95 {result['p95_ms']:8.1f} ms")
+    print(f"gevent speedup: {results[1]['requests_per_second'] / results[0]['requests_per_second']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
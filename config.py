@@ -1,4 +1,39 @@
-from decouple import config
+from decouple import Csv, config
+
+
+def parse_database_shards(value: list[str]) -> dict[str, str]:
+    """
+        Parses the DATABASE_SHARDS setting, a comma separated list of "name=uri" pairs. The name "default" refers to
+        the main database (DATABASE_URL) and takes no URI.
+
+        Parameters:
+        - value (list[str]): The items of the setting.
+
+        Returns:
+        dict[str, str]: The shard names mapped to their database URI ("" for the default shard), in declaration order.
+    """
+    shards = {}
+    for item in value:
+        name, _, uri = item.partition("=")
+        shards[name.strip()] = uri.strip()
+    return shards
+
+
+def parse_route_class_limits(value: list[str]) -> dict[str, int]:
+    """
+        Parses the ADMISSION_ROUTE_CLASS_LIMITS setting, a comma separated list of "route_class=limit" pairs.
+
+        Parameters:
+        - value (list[str]): The items of the setting.
+
+        Returns:
+        dict[str, int]: The route classes mapped to their maximum number of requests in flight.
+    """
+    limits = {}
+    for item in value:
+        name, _, limit = item.partition("=")
+        limits[name.strip()] = int(limit)
+    return limits
 
 
 class Config:
@@ -10,9 +45,169 @@ class Config:
         - SQLALCHEMY_DATABASE_URI (str): Database URI.
         - SQLALCHEMY_TRACK_MODIFICATIONS (bool): Flag to enable/disable tracking modifications.
         - DEBUG (bool): Flag to enable/disable debug mode.
+        - OPENAPI_SPEC_PATH (str): Path of a prebuilt OpenAPI document served instead of rendering it at runtime.
+        - STARTUP_IMPORT_BUDGET_MS (int): Maximum boot import time accepted by "flask startup-profile".
+        - COMPRESSION_ENABLED (bool): Flag to enable/disable negotiated response compression.
+        - COMPRESSION_ENCODINGS (list[str]): Accepted content encodings, in order of preference (zstd and br need the
+          optional "zstandard" and "Brotli" packages).
+        - COMPRESSION_MIN_SIZE (int): Minimum body size, in bytes, of a compressed response.
+        - COMPRESSION_MIMETYPES (list[str]): Mimetypes of the responses that are compressed.
+        - COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_LEVEL, COMPRESSION_ZSTD_LEVEL (int): Compression levels.
+        - WORKER_MODE (str): "sync" for blocking workers or "gevent" for cooperative workers (see worker_mode.py).
+        - SQLALCHEMY_ENGINE_OPTIONS (dict): Connection pool sizing (DATABASE_POOL_SIZE and DATABASE_MAX_OVERFLOW). In
+          the gevent mode it bounds the number of greenlets of a worker that can use the database at the same time.
+          In-memory SQLite databases use a single static connection and take no pool options.
+        - SQLITE_PROFILE_ENABLED (bool): Flag to enable/disable the tuning of the SQLite database files below (see
+          init_sqlite_profile).
+        - SQLITE_JOURNAL_MODE (str): Journal mode of the SQLite databases ("WAL" lets readers and the writer work at
+          the same time).
+        - SQLITE_BUSY_TIMEOUT_MS (int): Time a SQLite write waits for the lock of another writer before failing with
+          "database is locked".
+        - SQLITE_SYNCHRONOUS (str): When SQLite syncs to disk ("NORMAL" only syncs the write-ahead log at checkpoints).
+        - SQLITE_MMAP_SIZE (int): Bytes of the SQLite database files mapped in memory (0 disables memory mapping).
+        - SQLITE_CACHE_SIZE_KB (int): Page cache of each SQLite connection, in KiB.
+        - SQLITE_SERIALIZE_WRITES (bool): Flag to enable/disable the single in-process writer of the SQLite databases,
+          the write transactions of a worker process waiting in line for it.
+        - SLOW_QUERY_THRESHOLD_MS (float): Duration from which a statement is logged to the "app.slow_query" logger,
+          with its shape, redacted parameters, route and repository method (0 disables the slow-query log).
+        - STATEMENT_TIMEOUT_MS (int): Duration after which a statement is cancelled, set as "statement_timeout" on the
+          PostgreSQL sessions and approximated on SQLite (0 disables it). It applies to the CLI commands as well.
+        - RATE_LIMIT_ENABLED (bool): Flag to enable/disable the per-user and per-IP rate limits ("429 Too Many
+          Requests").
+        - RATE_LIMIT_USER_RATE, RATE_LIMIT_USER_BURST (float): Requests per second, and at once, allowed per user.
+        - RATE_LIMIT_IP_RATE, RATE_LIMIT_IP_BURST (float): Requests per second, and at once, allowed per client IP
+          address (authenticated or not).
+        - RATE_LIMIT_SHARED_PATH (str): File, ideally under /dev/shm, holding the rate limit buckets shared by the
+          worker processes of the host (empty keeps them in the memory of each worker process).
+        - RATE_LIMIT_SHARED_SLOTS (int): Number of buckets kept (users and IP addresses tracked at the same time).
+        - TRUSTED_PROXY_COUNT (int): Number of reverse proxies in front of the application trusted to set the
+          "X-Forwarded-For" header, from which the client IP address is then read (0 uses the address of the peer).
+        - ADMISSION_CONTROL_ENABLED (bool): Flag to enable/disable the load shedding of the requests a worker cannot
+          serve right away ("503 Service Unavailable").
+        - ADMISSION_MAX_IN_FLIGHT (int): Maximum number of requests served at the same time by a worker process (gevent
+          mode only: a sync worker serves one anyway).
+        - ADMISSION_READ_RESERVED (int): Number of those slots that only cheap reads (GET) can take.
+        - ADMISSION_ROUTE_CLASS_LIMITS (dict[str, int]): Maximum number of requests in flight per route class ("read",
+          "write" and "expensive": logins, registrations and moves), as "route_class=limit" pairs.
+        - ADMISSION_MAX_QUEUE_MS (int): Time spent waiting in front of the worker, according to the "X-Request-Start"
+          header of a reverse proxy such as nginx, after which a request is rejected (0, the default, disables the
+          check; uWSGI serving HTTP itself sets no such header).
+        - ADMISSION_RETRY_AFTER_SECONDS (int): Value of the "Retry-After" header of the rejected requests.
+        - CACHE_BACKEND (str): Backend of the cache: "memory" (LRU cache of each worker process), "uwsgi" (cache
+          shared by the uWSGI workers), "memcached" (key-value server shared by the hosts) or "none".
+        - CACHE_MAX_ENTRIES, CACHE_MAX_BYTES (int): Maximum number of entries, and of bytes, of the "memory" cache.
+        - CACHE_UWSGI_NAME (str): Name of the uWSGI cache ("--cache2 name=...") used by the "uwsgi" backend.
+        - CACHE_SERVER_ADDRESS (str): Address ("host:port") of the server of the "memcached" backend.
+        - CACHE_KEY_PREFIX (str): Prefix of the keys, to share a cache server between applications.
+        - CACHE_USER_TTL_SECONDS (int): How long the users loaded by the authentication are cached (0 disables it).
+          Defaults to 60 with the "memcached" backend and to 0 otherwise: the other backends are not shared with
+          every process changing the users (CLI commands, jobs worker, other hosts), whose changes would go unseen.
+        - CACHE_TASK_CATEGORY_TTL_SECONDS (int): How long the ownership checks of the task categories are cached, with
+          the same default: a category deleted by another process would otherwise still accept new tasks.
+        - CACHE_BOARD_TTL_SECONDS (int): How long the boards are cached (0, the default, disables it; use a shared
+          backend, since the "memory" backend of the other workers is not invalidated).
+        - DATABASE_SHARDS (dict[str, str]): Shards holding the users' boards, as "name=uri" pairs ("default" is the
+          main database). Unset, every board lives in the main database.
+        - SQLALCHEMY_BINDS (dict[str, str]): Engines of the shards other than the main database.
+        - TASK_MOVE_COALESCE_WINDOW_MS (int): Window during which successive moves of a task by its user are coalesced
+          into a single reorder (0, the default, disables coalescing). The moves are buffered by the worker process,
+          so only enable it with a single worker process running threads (see MoveCoalescer).
+        - TASK_ARCHIVE_CATEGORIES (list[str]): Titles of the task categories holding completed tasks, archived by
+          "flask archive-tasks".
+        - TASK_ARCHIVE_AFTER_DAYS (int): Days without update after which a completed task is archived (0 disables the
+          archive policy).
+        - TASK_ARCHIVE_BATCH_SIZE (int): Maximum number of tasks archived per transaction.
+        - JOB_MAX_ATTEMPTS (int): How many times a background job is started before it is marked as failed.
+        - JOB_RETRY_BACKOFF_SECONDS (int): Delay before the first retry of a failed job, doubled at every attempt.
+        - JOB_TIMEOUT_SECONDS (int): Running time after which a job is considered abandoned by its worker.
+        - TASK_CATEGORY_BACKGROUND_DELETE_MIN_TASKS (int): Number of tasks from which a task category is deleted by a
+          background job, the request answering "202 Accepted" (0 always deletes inline).
+        - IDEMPOTENCY_ENABLED (bool): Flag to enable/disable the "Idempotency-Key" header of the mutating endpoints.
+        - IDEMPOTENCY_TTL_SECONDS (int): How long the response of an idempotent request is replayed.
+        - IDEMPOTENCY_MAX_RESPONSE_BYTES (int): Largest response body stored for replay.
+        - IDEMPOTENCY_IN_FLIGHT_TIMEOUT_SECONDS (int): Time after which a request still in flight is considered
+          abandoned, letting a retry with the same key run.
+        - SINGLE_FLIGHT_ENABLED (bool): Flag to enable/disable the coalescing of identical concurrent board reads.
+        - SINGLE_FLIGHT_SHARED_DIR (str): Directory shared by the worker processes, ideally under /dev/shm, to coalesce
+          board reads across them (empty coalesces within each worker only).
+        - SINGLE_FLIGHT_TIMEOUT_SECONDS (float): Maximum time a request waits for an identical board read in flight.
+        - TOKEN_REVOCATION_REFRESH_SECONDS (float): Maximum delay before a worker process sees the tokens revoked
+          through another one.
+        - TOKEN_REVOCATION_FILTER_CAPACITY (int): Number of revoked tokens the in-memory Bloom filter is sized for.
+        - TOKEN_REVOCATION_FILTER_ERROR_RATE (float): Share of the valid tokens the filter reports as possibly revoked,
+          checked against the database.
     """
 
     SECRET_KEY = config('SECRET_KEY', '004f2af45d3a4e161a7dd2d17fdae47f')
     SQLALCHEMY_DATABASE_URI = config('DATABASE_URL', 'sqlite:///db.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = True
     DEBUG = config('DEBUG', False)
+    OPENAPI_SPEC_PATH = config('OPENAPI_SPEC_PATH', '')
+    STARTUP_IMPORT_BUDGET_MS = config('STARTUP_IMPORT_BUDGET_MS', 1500, cast=int)
+    COMPRESSION_ENABLED = config('COMPRESSION_ENABLED', True, cast=bool)
+    COMPRESSION_ENCODINGS = config('COMPRESSION_ENCODINGS', 'zstd,br,gzip', cast=Csv())
+    COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', 1024, cast=int)
+    COMPRESSION_MIMETYPES = config('COMPRESSION_MIMETYPES', 'application/json,text/html,text/css,text/javascript',
+                                   cast=Csv())
+    COMPRESSION_GZIP_LEVEL = config('COMPRESSION_GZIP_LEVEL', 5, cast=int)
+    COMPRESSION_BROTLI_LEVEL = config('COMPRESSION_BROTLI_LEVEL', 4, cast=int)
+    COMPRESSION_ZSTD_LEVEL = config('COMPRESSION_ZSTD_LEVEL', 3, cast=int)
+    WORKER_MODE = config('WORKER_MODE', 'sync')
+    SQLALCHEMY_ENGINE_OPTIONS = {} if SQLALCHEMY_DATABASE_URI in ('sqlite://', 'sqlite:///:memory:') else {
+        'pool_size': config('DATABASE_POOL_SIZE', 5, cast=int),
+        'max_overflow': config('DATABASE_MAX_OVERFLOW', 10, cast=int),
+    }
+    SQLITE_PROFILE_ENABLED = config('SQLITE_PROFILE_ENABLED', True, cast=bool)
+    SQLITE_JOURNAL_MODE = config('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_BUSY_TIMEOUT_MS = config('SQLITE_BUSY_TIMEOUT_MS', 5000, cast=int)
+    SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_MMAP_SIZE = config('SQLITE_MMAP_SIZE', 256 * 1024 * 1024, cast=int)
+    SQLITE_CACHE_SIZE_KB = config('SQLITE_CACHE_SIZE_KB', 16384, cast=int)
+    SQLITE_SERIALIZE_WRITES = config('SQLITE_SERIALIZE_WRITES', True, cast=bool)
+    SLOW_QUERY_THRESHOLD_MS = config('SLOW_QUERY_THRESHOLD_MS', 200, cast=float)
+    STATEMENT_TIMEOUT_MS = config('STATEMENT_TIMEOUT_MS', 30000, cast=int)
+    RATE_LIMIT_ENABLED = config('RATE_LIMIT_ENABLED', True, cast=bool)
+    RATE_LIMIT_USER_RATE = config('RATE_LIMIT_USER_RATE', 10.0, cast=float)
+    RATE_LIMIT_USER_BURST = config('RATE_LIMIT_USER_BURST', 60.0, cast=float)
+    RATE_LIMIT_IP_RATE = config('RATE_LIMIT_IP_RATE', 50.0, cast=float)
+    RATE_LIMIT_IP_BURST = config('RATE_LIMIT_IP_BURST', 200.0, cast=float)
+    RATE_LIMIT_SHARED_PATH = config('RATE_LIMIT_SHARED_PATH', '')
+    RATE_LIMIT_SHARED_SLOTS = config('RATE_LIMIT_SHARED_SLOTS', 65536, cast=int)
+    TRUSTED_PROXY_COUNT = config('TRUSTED_PROXY_COUNT', 0, cast=int)
+    ADMISSION_CONTROL_ENABLED = config('ADMISSION_CONTROL_ENABLED', True, cast=bool)
+    ADMISSION_MAX_IN_FLIGHT = config('ADMISSION_MAX_IN_FLIGHT', 64, cast=int)
+    ADMISSION_READ_RESERVED = config('ADMISSION_READ_RESERVED', 16, cast=int)
+    ADMISSION_ROUTE_CLASS_LIMITS = parse_route_class_limits(config('ADMISSION_ROUTE_CLASS_LIMITS',
+                                                                   'expensive=4,write=32', cast=Csv()))
+    ADMISSION_MAX_QUEUE_MS = config('ADMISSION_MAX_QUEUE_MS', 0, cast=int)
+    ADMISSION_RETRY_AFTER_SECONDS = config('ADMISSION_RETRY_AFTER_SECONDS', 1, cast=int)
+    CACHE_BACKEND = config('CACHE_BACKEND', 'memory')
+    CACHE_MAX_ENTRIES = config('CACHE_MAX_ENTRIES', 10000, cast=int)
+    CACHE_MAX_BYTES = config('CACHE_MAX_BYTES', 64 * 1024 * 1024, cast=int)
+    CACHE_UWSGI_NAME = config('CACHE_UWSGI_NAME', 'todo')
+    CACHE_SERVER_ADDRESS = config('CACHE_SERVER_ADDRESS', '127.0.0.1:11211')
+    CACHE_KEY_PREFIX = config('CACHE_KEY_PREFIX', 'todo:')
+    CACHE_USER_TTL_SECONDS = config('CACHE_USER_TTL_SECONDS', 60 if CACHE_BACKEND == 'memcached' else 0, cast=int)
+    CACHE_TASK_CATEGORY_TTL_SECONDS = config('CACHE_TASK_CATEGORY_TTL_SECONDS',
+                                             60 if CACHE_BACKEND == 'memcached' else 0, cast=int)
+    CACHE_BOARD_TTL_SECONDS = config('CACHE_BOARD_TTL_SECONDS', 0, cast=int)
+    TASK_MOVE_COALESCE_WINDOW_MS = config('TASK_MOVE_COALESCE_WINDOW_MS', 0, cast=int)
+    TASK_ARCHIVE_CATEGORIES = config('TASK_ARCHIVE_CATEGORIES', 'Done', cast=Csv())
+    TASK_ARCHIVE_AFTER_DAYS = config('TASK_ARCHIVE_AFTER_DAYS', 30, cast=int)
+    TASK_ARCHIVE_BATCH_SIZE = config('TASK_ARCHIVE_BATCH_SIZE', 500, cast=int)
+    JOB_MAX_ATTEMPTS = config('JOB_MAX_ATTEMPTS', 3, cast=int)
+    JOB_RETRY_BACKOFF_SECONDS = config('JOB_RETRY_BACKOFF_SECONDS', 10, cast=int)
+    JOB_TIMEOUT_SECONDS = config('JOB_TIMEOUT_SECONDS', 900, cast=int)
+    TASK_CATEGORY_BACKGROUND_DELETE_MIN_TASKS = config('TASK_CATEGORY_BACKGROUND_DELETE_MIN_TASKS', 500, cast=int)
+    IDEMPOTENCY_ENABLED = config('IDEMPOTENCY_ENABLED', True, cast=bool)
+    IDEMPOTENCY_TTL_SECONDS = config('IDEMPOTENCY_TTL_SECONDS', 86400, cast=int)
+    IDEMPOTENCY_MAX_RESPONSE_BYTES = config('IDEMPOTENCY_MAX_RESPONSE_BYTES', 65536, cast=int)
+    IDEMPOTENCY_IN_FLIGHT_TIMEOUT_SECONDS = config('IDEMPOTENCY_IN_FLIGHT_TIMEOUT_SECONDS', 60, cast=int)
+    SINGLE_FLIGHT_ENABLED = config('SINGLE_FLIGHT_ENABLED', True, cast=bool)
+    SINGLE_FLIGHT_SHARED_DIR = config('SINGLE_FLIGHT_SHARED_DIR', '')
+    SINGLE_FLIGHT_TIMEOUT_SECONDS = config('SINGLE_FLIGHT_TIMEOUT_SECONDS', 5.0, cast=float)
+    TOKEN_REVOCATION_REFRESH_SECONDS = config('TOKEN_REVOCATION_REFRESH_SECONDS', 2.0, cast=float)
+    TOKEN_REVOCATION_FILTER_CAPACITY = config('TOKEN_REVOCATION_FILTER_CAPACITY', 100000, cast=int)
+    TOKEN_REVOCATION_FILTER_ERROR_RATE = config('TOKEN_REVOCATION_FILTER_ERROR_RATE', 0.01, cast=float)
+    DATABASE_SHARDS = parse_database_shards(config('DATABASE_SHARDS', '', cast=Csv()))
+    SQLALCHEMY_BINDS = {name: uri for name, uri in DATABASE_SHARDS.items() if name != 'default'}
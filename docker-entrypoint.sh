@@ -0,0 +1,11 @@
+#!/bin/sh
+set -e
+
+flask --app wsgi create-db
+
+if [ "$WORKER_MODE" = "gevent" ]; then
+    exec uwsgi --socket 0.0.0.0:5000 --protocol=http -w wsgi:application \
+        --gevent "${GEVENT_CONCURRENCY:-100}" --gevent-early-monkey-patch
+fi
+
+exec uwsgi --socket 0.0.0.0:5000 --protocol=http -w wsgi:application
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pytest_addoption(parser):
+    parser.addoption("--update-query-budgets", action="store_true",
+                     help="Write the SQL statements and rows counted per endpoint to query_budgets.json.")
+
+
+@pytest.fixture
+def project_root(monkeypatch) -> str:
+    """
+        The root directory of the project, made the working directory of the test.
+    """
+    monkeypatch.chdir(ROOT)
+    return ROOT
+
+
+@pytest.fixture(scope="session")
+def app_factory(tmp_path_factory):
+    """
+        Builds the application on a new SQLite database, with the caches, rate limits, load shedding and request
+        coalescing disabled so every request reaches the database. Settings can be overridden as keyword arguments.
+        With create_db=False, "flask create-db" is not run on the database.
+    """
+    from config import Config
+
+    from app import create_app
+
+    def create_test_app(create_db: bool = True, **settings):
+        database = tmp_path_factory.mktemp("database") / "test.db"
+
+        class TestConfig(Config):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{database}"
+            SQLALCHEMY_ENGINE_OPTIONS = {}
+            DATABASE_SHARDS = {}
+            SQLALCHEMY_BINDS = {}
+            RATE_LIMIT_ENABLED = False
+            ADMISSION_CONTROL_ENABLED = False
+            SINGLE_FLIGHT_ENABLED = False
+            CACHE_BACKEND = "none"
+            TASK_MOVE_COALESCE_WINDOW_MS = 0
+
+        for name, value in settings.items():
+            setattr(TestConfig, name, value)
+
+        app = create_app(TestConfig)
+        if create_db:
+            with app.app_context():
+                result = app.test_cli_runner().invoke(args=["create-db"])
+            assert result.exit_code == 0, result.output
+        return app
+
+    return create_test_app
+
+
+@pytest.fixture
+def app(app_factory):
+    return app_factory()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(client) -> dict:
+    """
+        The Authorization header of a new user, whose board holds the default task categories and tasks.
+    """
+    credentials = {"username": "tester", "password": "tester"}
+    client.post("/auth/register", json=credentials)
+    token = client.post("/auth/login", json=credentials).get_json()["result"]
+    return {"Authorization": f"Bearer {token}"}
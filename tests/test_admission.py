@@ -0,0 +1,13 @@
+import time
+
+
+def test_requests_shed_by_admission_control_are_not_rate_limited(app_factory):
+    client = app_factory(ADMISSION_CONTROL_ENABLED=True, ADMISSION_MAX_QUEUE_MS=1000, RATE_LIMIT_ENABLED=True,
+                         RATE_LIMIT_IP_RATE=0.001, RATE_LIMIT_IP_BURST=1.0).test_client()
+
+    def status(**headers) -> int:
+        return client.get("/auth/profile", headers=headers, environ_base={"REMOTE_ADDR": "198.51.100.7"}).status_code
+
+    assert status(**{"X-Request-Start": f"t={time.time() - 5:.3f}"}) == 503
+    assert status() == 401
+    assert status() == 429
@@ -0,0 +1,21 @@
+from sqlalchemy.exc import OperationalError
+
+from app.repositories.user_repository import UserRepository
+
+
+def test_invalid_token_is_rejected(client):
+    response = client.get("/auth/profile", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401
+
+
+def test_database_error_is_a_server_error(client, auth_headers, monkeypatch):
+    def get_by_id(self, id):
+        raise OperationalError("SELECT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(UserRepository, "get_by_id", get_by_id)
+    headers = {**auth_headers, "Idempotency-Key": "locked"}
+    assert client.post("/task-category", headers=headers, json={"title": "Locked", "order": 4}).status_code == 500
+
+    monkeypatch.undo()
+    # The error was not stored for replay, so the retry is served.
+    assert client.post("/task-category", headers=headers, json={"title": "Locked", "order": 4}).status_code == 201
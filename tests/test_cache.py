@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import delete
+
+from app import db
+from app.models import Task, TaskCategory
+from app.utils import Cache, MemoryCacheBackend, cache_registry, cached
+from config import Config
+
+
+@pytest.mark.skipif(Config.CACHE_BACKEND != "memory", reason="checks the defaults of the per-process cache")
+def test_category_deleted_by_another_process_rejects_new_tasks(app, client, auth_headers, monkeypatch):
+    monkeypatch.setattr(cache_registry, "_cache", Cache(MemoryCacheBackend(1000, 1024 * 1024), "test:"))
+    monkeypatch.setattr(cache_registry, "_configured", True)
+    app.config.update(CACHE_USER_TTL_SECONDS=Config.CACHE_USER_TTL_SECONDS,
+                      CACHE_TASK_CATEGORY_TTL_SECONDS=Config.CACHE_TASK_CATEGORY_TTL_SECONDS)
+
+    category_id = client.get("/task-category", headers=auth_headers).get_json()["result"][-1]["id"]
+    task = {"title": "Task", "description": "Task", "category_id": category_id, "order": 2}
+    assert client.post("/task", headers=auth_headers, json=task).status_code == 201
+
+    # The category is deleted without going through this process, e.g. by the jobs worker.
+    with app.app_context():
+        db.session.execute(delete(Task).where(Task.category_id == int(category_id)))
+        db.session.execute(delete(TaskCategory).where(TaskCategory.id == int(category_id)))
+        db.session.commit()
+
+    response = client.post("/task", headers=auth_headers, json=task)
+    assert response.status_code == 400, response.get_json()
+
+
+def test_value_loaded_during_an_invalidation_is_not_served(app, monkeypatch):
+    monkeypatch.setattr(cache_registry, "_cache", Cache(MemoryCacheBackend(1000, 1024 * 1024), "test:"))
+    monkeypatch.setattr(cache_registry, "_configured", True)
+    app.config["TEST_CACHE_TTL_SECONDS"] = 60
+    rows = {1: "old"}
+
+    @cached("test", "TEST_CACHE_TTL_SECONDS", key=lambda id: id, tags=lambda id: [f"row:{id}"])
+    def load(id):
+        value = rows[id]
+        if value == "old":
+            # Another request updates the row once it has been read, but before it is stored in the cache.
+            rows[id] = "new"
+            cache_registry.invalidate(f"row:{id}")
+        return value
+
+    with app.app_context():
+        assert load(1) == "old"
+        assert load(1) == "new"
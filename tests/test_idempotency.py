@@ -0,0 +1,38 @@
+import time
+
+from sqlalchemy import func, select
+
+from app import db
+from app.models import IdempotencyKey
+
+
+def test_authentication_responses_are_not_stored(app, client):
+    credentials = {"username": "retrier", "password": "retrier"}
+    client.post("/auth/register", json=credentials, headers={"Idempotency-Key": "register"})
+    login = client.post("/auth/login", json=credentials, headers={"Idempotency-Key": "login"})
+    assert login.status_code == 200
+
+    with app.app_context():
+        # The login response holds a token, which must not be kept in the database.
+        assert db.session.scalar(select(func.count()).select_from(IdempotencyKey)) == 0
+
+
+def test_retry_after_rate_limit_is_served(app_factory):
+    app = app_factory(RATE_LIMIT_ENABLED=True, RATE_LIMIT_USER_RATE=2.0, RATE_LIMIT_USER_BURST=1.0)
+    client = app.test_client()
+    credentials = {"username": "retrier", "password": "retrier"}
+    client.post("/auth/register", json=credentials)
+    token = client.post("/auth/login", json=credentials).get_json()["result"]
+    headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": "new-category"}
+
+    assert client.get("/auth/profile", headers=headers).status_code == 200
+    limited = client.post("/task-category", headers=headers, json={"title": "Retried", "order": 4})
+    assert limited.status_code == 429
+
+    time.sleep(float(limited.headers["Retry-After"]))
+    retried = client.post("/task-category", headers=headers, json={"title": "Retried", "order": 4})
+    assert retried.status_code == 201 and "Idempotency-Replayed" not in retried.headers
+
+    replayed = client.post("/task-category", headers=headers, json={"title": "Retried", "order": 4})
+    assert replayed.headers["Idempotency-Replayed"] == "true"
+    assert replayed.get_json() == retried.get_json()
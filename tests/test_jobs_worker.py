@@ -0,0 +1,21 @@
+import threading
+
+from app.commands import jobs
+from app.services import JobService
+
+
+def test_worker_threads_survive_errors(app, monkeypatch):
+    calls, done = [], threading.Event()
+
+    def run_next(self):
+        calls.append(threading.get_ident())
+        if len(calls) <= 2:
+            raise RuntimeError("database is locked")
+        done.set()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(JobService, "run_next", run_next)
+    monkeypatch.setattr(jobs, "MAX_ERROR_BACKOFF_SECONDS", 0)
+    result = app.test_cli_runner().invoke(args=["jobs-worker", "--threads", "1", "--poll-interval", "0"])
+
+    assert done.is_set() and len(calls) == 3, result.output
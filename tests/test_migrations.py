@@ -0,0 +1,67 @@
+import sqlite3
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+LEGACY_KEYS = ["a" * 64, "b" * 64]
+
+
+@pytest.fixture
+def legacy_database(tmp_path) -> str:
+    """
+        A SQLite database created before integer task category keys: a user whose two categories hold two tasks and
+        one task, under 64-character hexadecimal keys.
+    """
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as connection:
+        connection.executescript('''
+            CREATE TABLE user (id INTEGER PRIMARY KEY, username VARCHAR(64) NOT NULL UNIQUE,
+                               password_hash VARCHAR(255));
+            CREATE TABLE task_category (id VARCHAR(64) PRIMARY KEY, title VARCHAR(128) NOT NULL, "order" INTEGER,
+                                        user_id INTEGER REFERENCES user (id));
+            CREATE TABLE task (id INTEGER PRIMARY KEY, title VARCHAR(128) NOT NULL, description VARCHAR,
+                               "order" INTEGER, category_id VARCHAR REFERENCES task_category (id),
+                               user_id INTEGER REFERENCES user (id));
+        ''')
+        connection.execute("INSERT INTO user VALUES (1, 'legacy', ?)", (generate_password_hash("legacy"),))
+        connection.executemany('INSERT INTO task_category VALUES (?, ?, ?, 1)',
+                               [(LEGACY_KEYS[0], "To Do", 1), (LEGACY_KEYS[1], "Done", 2)])
+        connection.executemany('INSERT INTO task VALUES (?, ?, ?, ?, ?, 1)',
+                               [(7, "First", "", 1, LEGACY_KEYS[0]), (8, "Second", "", 2, LEGACY_KEYS[0]),
+                                (9, "Third", "", 1, LEGACY_KEYS[1])])
+    return f"sqlite:///{path}"
+
+
+def test_create_db_migrates_legacy_category_keys(app_factory, legacy_database):
+    client = app_factory(SQLALCHEMY_DATABASE_URI=legacy_database).test_client()
+    token = client.post("/auth/login", json={"username": "legacy", "password": "legacy"}).get_json()["result"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    tasks = client.get("/task", headers=headers, query_string={"category_id": LEGACY_KEYS[0]}).get_json()["result"]
+    assert [task["id"] for task in tasks] == [7, 8]
+    category = client.get(f"/task-category/{LEGACY_KEYS[1]}", headers=headers).get_json()["result"]
+    assert [task["id"] for task in category["tasks"]] == [9]
+
+
+def test_migrate_category_keys_initializes_task_counters(app_factory, legacy_database):
+    from app import db
+    from app.commands.database import add_missing_columns
+    from app.models import ArchivedTask, Task, TaskCategory, User
+    from app.services import TaskCategoryService
+
+    app = app_factory(SQLALCHEMY_DATABASE_URI=legacy_database, create_db=False)
+    with app.app_context():
+        # An earlier "flask create-db" added the new columns of the users, and the archive of the tasks.
+        with db.engine.begin() as connection:
+            add_missing_columns(connection, User.__table__)
+            add_missing_columns(connection, Task.__table__)
+            ArchivedTask.__table__.create(connection)
+            connection.execute(ArchivedTask.__table__.insert().values(
+                task_id=10, title="Archived", order=1, category_id=LEGACY_KEYS[1], user_id=1))
+        result = app.test_cli_runner().invoke(args=["migrate-category-keys"])
+        assert result.exit_code == 0, result.output
+
+        summary = TaskCategoryService().get_summary(db.session.get(User, 1))
+        assert [(category["title"], category["task_count"]) for category in summary] == [("To Do", 2), ("Done", 1)]
+        done = db.session.scalar(db.select(TaskCategory).where(TaskCategory.legacy_id == LEGACY_KEYS[1]))
+        assert db.session.scalar(db.select(ArchivedTask.category_id)) == done.id
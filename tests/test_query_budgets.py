@@ -0,0 +1,195 @@
+"""
+    Query budgets: every endpoint of the API is called once through the Flask test client, on a new SQLite database,
+    and the SQL statements it runs and the rows it fetches are compared against query_budgets.json. A change that adds
+    queries on purpose updates the budgets with "python -m pytest tests/test_query_budgets.py --update-query-budgets"
+    and commits the new file along with it.
+"""
+import difflib
+import json
+import os
+
+import pytest
+from flask import has_request_context, request
+from sqlalchemy import event
+
+from app.utils.statement_monitor import statement_shape
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "query_budgets.json")
+
+
+def load_budgets() -> dict:
+    if not os.path.exists(BUDGETS_PATH):
+        return {}
+    with open(BUDGETS_PATH) as file:
+        return json.load(file)
+
+
+class QueryCounter:
+    """
+        Counts, per route ("<METHOD> <rule>"), the SQL statements sent to the databases and the rows they return while
+        serving requests, in counts ({"statements": [statement shapes], "rows": int}). Statements are counted on the
+        engines, so every statement is seen whoever issues it, and rows are counted on the session, whose results are
+        read in full once to be counted.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self._listeners = []
+
+    def install(self, engines, session):
+        for engine in engines:
+            self._listen(engine, "before_cursor_execute", self.count_statement)
+        self._listen(session, "do_orm_execute", self.count_rows)
+
+    def remove(self):
+        for target, name, listener in self._listeners:
+            event.remove(target, name, listener)
+        self._listeners = []
+
+    def count_statement(self, connection, cursor, statement, parameters, context, executemany):
+        counts = self._route_counts()
+        if counts is not None:
+            counts["statements"].append(statement_shape(statement))
+
+    def count_rows(self, orm_execute_state):
+        counts = self._route_counts()
+        if counts is None or not orm_execute_state.is_select:
+            return None
+        # The rows are read here to be counted, and handed to the caller as a result of its own.
+        frozen = orm_execute_state.invoke_statement().freeze()
+        counts["rows"] += len(frozen.data)
+        return frozen()
+
+    def _route_counts(self) -> dict | None:
+        if not has_request_context() or request.url_rule is None:
+            return None
+        route = f"{request.method} {request.url_rule.rule}"
+        return self.counts.setdefault(route, {"statements": [], "rows": 0})
+
+    def _listen(self, target, name: str, listener):
+        event.listen(target, name, listener)
+        self._listeners.append((target, name, listener))
+
+
+def api_routes(app) -> set[str]:
+    """
+        The endpoints of the API, i.e. the methods of the resources declared in app.routes, as "<METHOD> <rule>".
+    """
+    routes = set()
+    for rule in app.url_map.iter_rules():
+        view_class = getattr(app.view_functions[rule.endpoint], "view_class", None)
+        if view_class is not None and view_class.__module__.startswith("app.routes."):
+            routes.update(f"{method} {rule.rule}" for method in rule.methods - {"HEAD", "OPTIONS"})
+    return routes
+
+
+def exercise_routes(client, call):
+    """
+        Calls every endpoint of the API once, in the order a user would: registration, login, the board and its task
+        categories, the tasks, their archive, the background jobs and finally the logout. A task category holding
+        tasks is deleted, so its deletion is queued as a background job. call(method, path, status, **kwargs) returns
+        the JSON body of the response once its status has been checked.
+    """
+    credentials = {"username": "querybudget", "password": "querybudget"}
+    call("POST", "/auth/register", 201, json=credentials)
+    token = call("POST", "/auth/login", 200, json=credentials)["result"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def call_as_user(method: str, path: str, status: int = 200, **kwargs) -> dict:
+        return call(method, path, status, headers=headers, **kwargs)
+
+    call_as_user("GET", "/auth/profile")
+    board = call_as_user("GET", "/task-category")["result"]
+    category_id = call_as_user("POST", "/task-category", 201, json={"title": "Query budget", "order": len(board) + 1}
+                               )["result"]["id"]
+    call_as_user("GET", "/task-category/summary")
+    call_as_user("GET", f"/task-category/{category_id}")
+    call_as_user("PUT", f"/task-category/{category_id}", json={"title": "Query budget board"})
+
+    call_as_user("GET", "/task")
+    task_id = call_as_user("POST", "/task", 201, json={"title": "Query budget", "description": "Counted queries",
+                                                       "category_id": str(category_id), "order": 1})["result"]["id"]
+    call_as_user("GET", "/task/search", query_string={"q": "budget"})
+    call_as_user("GET", f"/task/{task_id}")
+    call_as_user("PUT", f"/task/{task_id}", json={"category_id": str(board[0]["id"]), "order": 1})
+
+    archived_id = call_as_user("POST", f"/task/{task_id}/archive")["result"]["id"]
+    call_as_user("GET", "/task/archive")
+    call_as_user("GET", f"/task/archive/{archived_id}")
+    call_as_user("POST", f"/task/archive/{archived_id}/restore", json={})
+    call_as_user("DELETE", f"/task/{task_id}")
+
+    call_as_user("DELETE", f"/task-category/{board[-1]['id']}", 202)
+    job_id = call_as_user("GET", "/job")["result"][0]["id"]
+    call_as_user("GET", f"/job/{job_id}")
+    call_as_user("POST", "/auth/logout")
+
+
+@pytest.fixture(scope="module")
+def budget_app(app_factory):
+    return app_factory(TASK_CATEGORY_BACKGROUND_DELETE_MIN_TASKS=1)
+
+
+@pytest.fixture(scope="module")
+def measured_routes(budget_app, request) -> dict:
+    """
+        The statements (shapes) and rows of each route over exercise_routes. A first user is registered and logged in
+        before counting, so one-off work of the process (loading the revoked tokens) is not charged to the first
+        endpoint. With --update-query-budgets, the counts are written to query_budgets.json.
+    """
+    from app import db
+
+    client = budget_app.test_client()
+    warm_up = {"username": "warmup", "password": "warmup"}
+    client.post("/auth/register", json=warm_up)
+    token = client.post("/auth/login", json=warm_up).get_json()["result"]
+    client.get("/auth/profile", headers={"Authorization": f"Bearer {token}"})
+    # The revoked tokens are loaded now, and no longer reloaded in the middle of the requests counted.
+    budget_app.config["TOKEN_REVOCATION_REFRESH_SECONDS"] = float("inf")
+
+    def call(method: str, path: str, status: int, **kwargs) -> dict:
+        response = client.open(path, method=method, **kwargs)
+        assert response.status_code == status, (f"{method} {path} answered {response.status_code} instead of "
+                                                f"{status}: {response.get_data(as_text=True)[:500]}")
+        return response.get_json()
+
+    counter = QueryCounter()
+    with budget_app.app_context():
+        counter.install(db.engines.values(), db.session)
+    try:
+        exercise_routes(client, call)
+    finally:
+        counter.remove()
+
+    if request.config.getoption("--update-query-budgets"):
+        budgets = {route: {"statements": len(counts["statements"]), "rows": counts["rows"]}
+                   for route, counts in sorted(counter.counts.items())}
+        with open(BUDGETS_PATH, "w") as file:
+            json.dump(budgets, file, indent=2)
+            file.write("\n")
+    return counter.counts
+
+
+def test_every_endpoint_is_exercised(budget_app, measured_routes):
+    assert sorted(api_routes(budget_app) - set(measured_routes)) == []
+
+
+def test_every_endpoint_has_a_budget(measured_routes):
+    assert sorted(set(measured_routes) - set(load_budgets())) == [], (
+        "Run \"python -m pytest tests/test_query_budgets.py --update-query-budgets\" to budget the new endpoints.")
+
+
+@pytest.mark.parametrize("route", sorted(load_budgets()))
+def test_query_budget(route, measured_routes):
+    budget = load_budgets()[route]
+    counts = measured_routes.get(route)
+    assert counts is not None, f"{route} has a budget but is no longer exercised."
+
+    measured = {"statements": len(counts["statements"]), "rows": counts["rows"]}
+    if all(measured[name] <= budget[name] for name in budget):
+        return
+    diff = difflib.unified_diff(json.dumps(budget, indent=2).splitlines(), json.dumps(measured, indent=2).splitlines(),
+                                "budget", "measured", lineterm="")
+    statements = "\n".join(f"  {shape}" for shape in counts["statements"])
+    pytest.fail(f"{route} is over its query budget:\n" + "\n".join(diff) + f"\nStatements run:\n{statements}",
+                pytrace=False)
@@ -0,0 +1,24 @@
+from app import db
+from app.models import TaskCategory
+
+LEGACY_KEY = "a" * 64
+
+
+def test_task_filter_accepts_legacy_category_keys(app, client, auth_headers):
+    board = client.get("/task-category", headers=auth_headers).get_json()["result"]
+    with app.app_context():
+        db.session.get(TaskCategory, int(board[0]["id"])).legacy_id = LEGACY_KEY
+        db.session.commit()
+
+    for query in (f"category_id={LEGACY_KEY}", f"category_id__in={LEGACY_KEY}"):
+        response = client.get(f"/task?{query}", headers=auth_headers)
+        assert response.status_code == 200, response.get_json()
+        assert {task["category_id"] for task in response.get_json()["result"]} == {board[0]["id"]}
+
+    response = client.get(f"/task?category_id={'b' * 64}", headers=auth_headers)
+    assert response.status_code == 200 and response.get_json()["result"] == []
+
+
+def test_task_filter_rejects_malformed_category_keys(client, auth_headers):
+    response = client.get("/task?category_id=xyz", headers=auth_headers)
+    assert response.status_code == 400
@@ -0,0 +1,23 @@
+from app.utils.rate_limiter import MemoryBucketStore
+
+
+def test_memory_store_drops_the_least_recently_updated_bucket():
+    store = MemoryBucketStore(max_keys=2)
+    store.take("user:1", 10.0, 60.0)
+    store.take("ip:203.0.113.1", 50.0, 200.0)
+    store.take("user:1", 10.0, 60.0)
+    store.take("user:2", 10.0, 60.0)
+
+    assert list(store._buckets) == ["user:1", "user:2"]
+
+
+def test_client_address_is_read_from_trusted_proxy(app_factory):
+    client = app_factory(RATE_LIMIT_ENABLED=True, RATE_LIMIT_IP_RATE=0.001, RATE_LIMIT_IP_BURST=1.0,
+                         TRUSTED_PROXY_COUNT=1).test_client()
+
+    def status(address: str) -> int:
+        return client.get("/auth/profile", headers={"X-Forwarded-For": address}).status_code
+
+    assert status("203.0.113.1") == 401
+    assert status("203.0.113.2") == 401
+    assert status("203.0.113.1") == 429
@@ -0,0 +1,17 @@
+from app.commands.startup import profile_imports
+from config import Config
+
+
+def test_boot_imports_within_budget(project_root):
+    """
+        Boots the application ("import wsgi") in a fresh interpreter and checks its total import time against
+        STARTUP_IMPORT_BUDGET_MS, listing the slowest imports when the budget is exceeded.
+    """
+    rows = profile_imports("wsgi")
+    total_ms = sum(self_us for _, self_us, _ in rows) / 1000
+
+    slowest = sorted(rows, key=lambda row: row[1], reverse=True)[:15]
+    report = "\n".join(f"{self_us / 1000:9.1f} ms self {cumulative_us / 1000:9.1f} ms total  {name}"
+                       for name, self_us, cumulative_us in slowest)
+    assert total_ms <= Config.STARTUP_IMPORT_BUDGET_MS, (
+        f"Boot took {total_ms:.1f} ms (budget {Config.STARTUP_IMPORT_BUDGET_MS} ms), slowest imports:\n{report}")
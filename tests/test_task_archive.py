@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from app import db
+from app.models import Task
+
+LONG_AGO = datetime(2020, 1, 1)
+
+
+def test_moving_a_task_only_stamps_the_moved_task(app, client, auth_headers):
+    category_id = client.get("/task-category", headers=auth_headers).get_json()["result"][-1]["id"]
+    for order in (2, 3):
+        client.post("/task", headers=auth_headers, json={"title": f"Task {order}", "description": "Done",
+                                                         "category_id": category_id, "order": order})
+    tasks = client.get(f"/task-category/{category_id}", headers=auth_headers).get_json()["result"]["tasks"]
+    moved, *others = [int(task["id"]) for task in tasks]
+    with app.app_context():
+        db.session.execute(update(Task).values(updated_at=LONG_AGO))
+        db.session.commit()
+
+    response = client.put(f"/task/{moved}", headers=auth_headers, json={"order": len(others)})
+    assert response.status_code == 200
+
+    with app.app_context():
+        updated_at = dict(db.session.execute(db.select(Task.id, Task.updated_at)).all())
+    assert updated_at[moved] > LONG_AGO
+    assert all(updated_at[id] == LONG_AGO for id in others)
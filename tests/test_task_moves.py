@@ -0,0 +1,47 @@
+import pytest
+
+from app import db
+from app.models import Task
+from app.models.task import utcnow
+from app.utils import move_coalescer
+from app.utils.move_coalescer import MoveCoalescer
+
+
+@pytest.fixture
+def coalescing_app(app):
+    app.config["TASK_MOVE_COALESCE_WINDOW_MS"] = 60000
+    return app
+
+
+def test_coalesced_move_answers_the_persisted_order_and_time(coalescing_app, client, auth_headers):
+    category_id = client.get("/task-category", headers=auth_headers).get_json()["result"][0]["id"]
+    task_id = client.post("/task", headers=auth_headers, json={"title": "Moved", "description": "Moved",
+                                                               "category_id": category_id, "order": 2}
+                          ).get_json()["result"]["id"]
+
+    response = client.put(f"/task/{task_id}", headers=auth_headers, json={"order": 99})
+    assert response.status_code == 200
+    answered = response.get_json()["result"]
+    assert answered["order"] == 1 and answered["updated_at"] is not None
+
+    with coalescing_app.app_context():
+        user_id = db.session.get(Task, task_id).user_id
+        move_coalescer.flush(user_id)
+        task = db.session.get(Task, task_id)
+        assert (task.order, task.updated_at.isoformat()) == (answered["order"], answered["updated_at"])
+
+
+def test_moves_are_kept_when_their_flush_fails():
+    coalescer, applied, moved_at = MoveCoalescer(), [], utcnow()
+
+    def fail(user_id, moves):
+        raise RuntimeError("database is locked")
+
+    coalescer.schedule(1, 10, 2, moved_at, 60, fail)
+    with pytest.raises(RuntimeError):
+        coalescer.flush(1)
+    coalescer.schedule(1, 11, 1, moved_at, 60, lambda user_id, moves: applied.append(moves))
+    coalescer.flush(1)
+
+    assert applied == [{10: (2, moved_at), 11: (1, moved_at)}]
+    assert coalescer._user_locks == {}
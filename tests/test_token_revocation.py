@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from app import db
+from app.models import RevokedToken
+from app.models.task import utcnow
+from app.services.token_revocation_service import TokenRevocationService
+
+
+def revoke(jti: str, id: int, revoked_at):
+    db.session.add(RevokedToken(id=id, jti=jti, expires_at=revoked_at + timedelta(minutes=45), revoked_at=revoked_at))
+    db.session.commit()
+
+
+def test_revocation_committed_out_of_id_order_is_loaded(app):
+    app.config["TOKEN_REVOCATION_REFRESH_SECONDS"] = 0
+    service = TokenRevocationService()
+    with app.app_context():
+        revoked_at = utcnow()
+        revoke("first", 100, revoked_at)
+        assert service.is_revoked("first")
+
+        # A revocation given a lower ID before the first one, but committed after the filter was loaded.
+        revoke("second", 50, revoked_at)
+        assert service.is_revoked("second")
+        assert not service.is_revoked("valid")
+
+
+def test_expired_revocations_are_purged(app):
+    service = TokenRevocationService()
+    with app.app_context():
+        revoke("expired", 1, utcnow() - timedelta(hours=1))
+        revoke("current", 2, utcnow())
+        service.purge_expired()
+        assert db.session.scalars(db.select(RevokedToken.jti)).all() == ["current"]
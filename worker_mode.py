@@ -0,0 +1,41 @@
+from decouple import config
+
+
+def patch_for_worker_mode():
+    """
+        Function: patch_for_worker_mode
+
+        Description:
+        This function prepares the process for the worker mode selected by the WORKER_MODE environment variable. In the
+        default "sync" mode it does nothing. In the "gevent" mode it monkey-patches the standard library with gevent
+        (sockets, time.sleep, threading, ...) and, when "psycogreen" is installed, makes psycopg2 wait on the gevent hub
+        instead of blocking the whole worker, so every greenlet of a uWSGI worker can serve a request while the others
+        wait on the database.
+
+        It must run before anything else is imported, which is why it lives outside of the "app" package and only
+        depends on "decouple". The Flask-SQLAlchemy session used by the repositories is already greenlet-safe: it is
+        scoped to the application context, which is stored in a context variable, and greenlet gives every greenlet its
+        own context.
+
+        Returns:
+        str: The worker mode in use ("sync" or "gevent").
+
+        Raises:
+        ValueError: If WORKER_MODE is neither "sync" nor "gevent".
+    """
+    worker_mode = config('WORKER_MODE', 'sync')
+    if worker_mode not in ("sync", "gevent"):
+        raise ValueError(f"Unsupported WORKER_MODE '{worker_mode}', expected 'sync' or 'gevent'")
+
+    if worker_mode == "gevent":
+        from gevent import monkey
+        monkey.patch_all()
+
+        try:
+            from psycogreen.gevent import patch_psycopg
+        except ImportError:
+            pass
+        else:
+            patch_psycopg()
+
+    return worker_mode
@@ -1,4 +1,8 @@
-from app import create_app
+from worker_mode import patch_for_worker_mode
+
+patch_for_worker_mode()
+
+from app import create_app  # noqa: E402 - must be imported after the worker mode patches
 
 application = create_app()
 